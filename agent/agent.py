@@ -16,7 +16,7 @@ import logging
 import uuid
 from datetime import UTC, datetime
 from pathlib import Path
-from typing import Any, Literal, cast
+from typing import TYPE_CHECKING, Any, Literal, cast
 
 from agent.api_clients.evaluation_client import EvaluationServiceClient
 from agent.api_clients.integration_client import (
@@ -30,7 +30,10 @@ from agent.mcp_client import MCPClient
 from agent.models.evaluation import EvaluationResponse
 from agent.report_generator import ReportGenerator
 from agent.state_manager import StateManager
-from shared.models.issue_card import EvaluationResult, IssueCard, Sources
+from shared.models.issue_card import Category, EvaluationResult, IssueCard, Priority, Sources
+
+if TYPE_CHECKING:
+    from shared.models.config import AppConfig
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +55,7 @@ class AgentConfig:
         cloud_sync_enabled: bool = False,
         cloud_sync_mode: Literal["immediate", "batch", "manual"] = "immediate",
         ci_mode: bool = False,
+        anthropic_api_key: str | None = None,
     ):
         self.integration_endpoint = integration_endpoint
         self.evaluation_endpoint = evaluation_endpoint
@@ -65,6 +69,37 @@ class AgentConfig:
         self.cloud_sync_enabled = cloud_sync_enabled
         self.cloud_sync_mode = cloud_sync_mode
         self.ci_mode = ci_mode
+        self.anthropic_api_key = anthropic_api_key
+
+    @classmethod
+    def from_app_config(
+        cls, config: "AppConfig", auth_token: str | None = None, **overrides: Any
+    ) -> "AgentConfig":
+        """Create from the loaded CLI configuration.
+
+        Args:
+            config: Loaded application config
+            auth_token: JWT token for API calls
+            **overrides: Extra or replacement AgentConfig arguments
+                (e.g. provider, ci_mode, anthropic_api_key)
+
+        Returns:
+            AgentConfig for the configured services and provider
+        """
+        aws, jira, notion = config.aws, config.jira, config.notion
+        kwargs: dict[str, Any] = {
+            "integration_endpoint": aws.integration_endpoint,
+            "evaluation_endpoint": aws.evaluation_endpoint,
+            "api_key": aws.api_key,
+            "auth_token": auth_token,
+            "provider": config.provider,
+            "report_dir": config.defaults.report_dir,
+            "project": config.langsmith.project,
+            "jira_project_key": jira.project_key if jira else None,
+            "notion_database_id": notion.database_id if notion else None,
+        }
+        kwargs.update(overrides)
+        return cls(**kwargs)
 
 
 class AnalysisResult:
@@ -133,6 +168,7 @@ class Agent:
         self._reporter = ReportGenerator(
             output_dir=config.report_dir,
             use_llm=config.ci_mode,  # Use LLM only when --ci flag is set
+            anthropic_api_key=config.anthropic_api_key,
         )
         self._state = StateManager(
             project=config.project,
@@ -215,7 +251,7 @@ class Agent:
         """
         # Determine priority based on evaluation scores
         min_score = min(r.score for r in evaluation.results) if evaluation.results else 1.0
-        priority: Literal["CRITICAL", "HIGH", "MEDIUM", "LOW"]
+        priority: Priority
         if min_score < 0.3:
             priority = "CRITICAL"
         elif min_score < 0.5:
@@ -227,10 +263,7 @@ class Agent:
 
         # Determine category from failing evaluations
         failing = [r for r in evaluation.results if r.status in ("fail", "warning")]
-        category: Literal[
-            "BUG", "PERFORMANCE", "OPTIMIZATION", "FEATURE_IDEA", "DOCUMENTATION",
-            "UI_UX", "TECHNICAL_DEBT", "ERROR", "QUALITY", "SECURITY",
-        ]
+        category: Category
         if any("error" in r.tool.lower() for r in failing):
             category = "BUG"
         elif any("latency" in r.tool.lower() or "token" in r.tool.lower() for r in failing):
@@ -2,16 +2,22 @@
 
 import logging
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import UTC
 from typing import Any
 
 import requests
 
+from shared.utils.serialization import dumps
+
 logger = logging.getLogger(__name__)
 
 # Type for progress callback: (phase, current, total, thread_id)
 ProgressCallback = Callable[[str, int, int, str], None]
 
+# Concurrent detail requests; kept below requests' default pool size (10)
+MAX_DETAIL_WORKERS = 8
+
 
 class ThreadData:
     """Thread data from the Integration Service."""
@@ -139,6 +145,33 @@ class IntegrationServiceClient:
             logger.error(f"Failed to fetch thread details for {thread_id}: {e}")
             raise
 
+    def _get_details_or_summary(self, thread_summary: dict[str, Any]) -> ThreadData:
+        """Fetch full thread details, falling back to the summary on failure."""
+        thread_id = thread_summary["thread_id"]
+        try:
+            return self.get_thread_details(thread_id)
+        except Exception as e:
+            logger.warning(f"Failed to get details for thread {thread_id}: {e}")
+            return ThreadData(thread_summary)
+
+    def fetch_thread(self, thread_id: str) -> FetchResult:
+        """Fetch a single thread by ID with full details.
+
+        Args:
+            thread_id: The thread ID to fetch
+
+        Returns:
+            FetchResult containing the thread, or no threads if it does not exist
+        """
+        try:
+            thread = self.get_thread_details(thread_id)
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                return FetchResult(threads=[], total_in_queue=0, returned=0, skipped=0)
+            raise
+
+        return FetchResult(threads=[thread], total_in_queue=1, returned=1, skipped=0)
+
     def fetch_threads(
         self,
         limit: int = 50,
@@ -149,7 +182,7 @@ class IntegrationServiceClient:
 
         Uses a two-step approach to avoid timeouts:
         1. Fetch summaries only (fast) - AWS filters out previously analyzed threads
-        2. Fetch details for each thread individually
+        2. Fetch details for each thread individually, several at a time
 
         Args:
             limit: Maximum threads to return
@@ -205,28 +238,31 @@ class IntegrationServiceClient:
                     skipped=skipped,
                 )
 
-            # Step 2: If details requested, fetch each thread's details individually
+            # Step 2: If details requested, fetch each thread's details concurrently
             threads: list[ThreadData] = []
             if with_details:
-                logger.info(f"Fetching details for {len(threads_data)} threads one-by-one")
+                total = len(threads_data)
+                logger.info(f"Fetching details for {total} threads")
                 if progress_callback:
-                    progress_callback("details", 0, len(threads_data), "")
-
-                for i, thread_summary in enumerate(threads_data):
-                    thread_id = thread_summary.get("thread_id")
-                    if thread_id:
+                    progress_callback("details", 0, total, "")
+
+                # Results keep the summary order regardless of completion order
+                detailed: list[ThreadData | None] = [None] * total
+                with ThreadPoolExecutor(max_workers=min(MAX_DETAIL_WORKERS, total)) as executor:
+                    futures = {
+                        executor.submit(self._get_details_or_summary, summary): i
+                        for i, summary in enumerate(threads_data)
+                        if summary.get("thread_id")
+                    }
+                    for completed, future in enumerate(as_completed(futures), 1):
+                        i = futures[future]
+                        detailed[i] = future.result()
                         if progress_callback:
-                            progress_callback("details", i + 1, len(threads_data), thread_id)
-                        try:
-                            logger.info(
-                                f"Fetching details {i + 1}/{len(threads_data)}: {thread_id}"
+                            progress_callback(
+                                "details", completed, total, threads_data[i]["thread_id"]
                             )
-                            thread_details = self.get_thread_details(thread_id)
-                            threads.append(thread_details)
-                        except Exception as e:
-                            logger.warning(f"Failed to get details for thread {thread_id}: {e}")
-                            # Fall back to summary data
-                            threads.append(ThreadData(thread_summary))
+
+                threads = [t for t in detailed if t is not None]
             else:
                 threads = [ThreadData(t) for t in threads_data]
 
@@ -254,7 +290,7 @@ class IntegrationServiceClient:
 
         Uses a two-step approach to avoid timeouts:
         1. Fetch summaries only (fast)
-        2. Fetch details for each thread individually
+        2. Fetch details for each thread individually, several at a time
 
         Args:
             limit: Maximum threads to return
@@ -323,28 +359,40 @@ class IntegrationServiceClient:
     def create_ticket(
         self,
         provider: str,
-        issue_data: dict[str, Any],
+        issue_data: dict[str, Any] | None = None,
+        raw_issue_json: bytes | None = None,
     ) -> dict[str, Any]:
         """Create a ticket in the target system.
 
         Args:
             provider: Provider name ('jira' or 'notion')
             issue_data: Issue data matching the IssueRequest schema
+            raw_issue_json: Pre-encoded issue JSON; spliced into the request
+                            body as-is instead of serializing issue_data
 
         Returns:
             Ticket creation response
         """
         try:
-            request_data = {
-                "provider": provider,
-                "issue": issue_data,
-            }
-
-            response = self._session.post(
-                f"{self.endpoint}/integrations/ticket",
-                json=request_data,
-                timeout=self.timeout,
-            )
+            if raw_issue_json is not None:
+                body = (
+                    b'{"provider":' + dumps(provider) + b',"issue":' + raw_issue_json + b"}"
+                )
+                response = self._session.post(
+                    f"{self.endpoint}/integrations/ticket",
+                    data=body,
+                    timeout=self.timeout,
+                )
+            else:
+                request_data = {
+                    "provider": provider,
+                    "issue": issue_data,
+                }
+                response = self._session.post(
+                    f"{self.endpoint}/integrations/ticket",
+                    json=request_data,
+                    timeout=self.timeout,
+                )
             response.raise_for_status()
 
             result: dict[str, Any] = response.json()
@@ -111,6 +111,7 @@ class ReportGenerator:
         project_context: dict[str, Any] | None = None,
         llm_client: LLMClient | None = None,
         use_llm: bool = False,
+        anthropic_api_key: str | None = None,
     ):
         """Initialize the report generator.
 
@@ -120,6 +121,8 @@ class ReportGenerator:
             llm_client: Optional LLM client for AI-powered generation
             use_llm: Whether to use LLM for report generation (default False).
                      When True (--ci flag), requires anthropic package.
+            anthropic_api_key: Anthropic API key for LLM mode
+                               (defaults to ANTHROPIC_API_KEY env var)
         """
         self.output_dir = output_dir or Path("./reports")
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -139,7 +142,7 @@ class ReportGenerator:
                 )
 
             # Verify API key is available
-            api_key = os.environ.get("ANTHROPIC_API_KEY")
+            api_key = anthropic_api_key or os.environ.get("ANTHROPIC_API_KEY")
             if not api_key:
                 raise ValueError(
                     "ANTHROPIC_API_KEY environment variable is required for LLM-powered reports. "
@@ -5,6 +5,7 @@ duplicate processing and enable incremental analysis runs.
 """
 
 import json
+from collections import defaultdict
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -56,6 +57,10 @@ class StateManager:
     State is stored in a JSON file in the reports directory.
     """
 
+    # Parsed state files shared by all instances in this process:
+    # resolved path -> ((mtime_ns, size), parsed JSON)
+    _CACHE: dict[Path, tuple[tuple[int, int], dict[str, Any]]] = {}
+
     def __init__(self, project: str, state_dir: str | None = None):
         """Initialize state manager.
 
@@ -67,6 +72,8 @@ class StateManager:
         self.state_dir = Path(state_dir or "./reports")
         self.state_file = self.state_dir / "processing_state.json"
         self._state: ProcessingState | None = None
+        self._processed_ids: set[str] | None = None
+        self._history_index: dict[str, list[int]] | None = None
 
     def _ensure_dir(self) -> None:
         """Ensure state directory exists."""
@@ -79,8 +86,7 @@ class StateManager:
 
         if self.state_file.exists():
             try:
-                with open(self.state_file) as f:
-                    data = json.load(f)
+                data = self._read_state_file()
                 self._state = ProcessingState(**data)
             except (json.JSONDecodeError, Exception) as e:
                 # If state file is corrupted, start fresh
@@ -91,6 +97,24 @@ class StateManager:
 
         return self._state
 
+    def _read_state_file(self) -> dict[str, Any]:
+        """Read and parse the state file, reusing an earlier parse if unchanged.
+
+        Returns:
+            Parsed state file contents
+        """
+        path = self.state_file.resolve()
+        stat = path.stat()
+        version = (stat.st_mtime_ns, stat.st_size)
+
+        cached = self._CACHE.get(path)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        data: dict[str, Any] = json.loads(path.read_bytes())
+        self._CACHE[path] = (version, data)
+        return data
+
     def _create_new_state(self) -> ProcessingState:
         """Create a new empty state."""
         return ProcessingState(
@@ -109,6 +133,34 @@ class StateManager:
 
         with open(self.state_file, "w") as f:
             json.dump(self._state.model_dump(), f, indent=2, default=str)
+        self._CACHE.pop(self.state_file.resolve(), None)
+
+    def processed_ids_set(self) -> set[str]:
+        """Get the set of processed thread IDs.
+
+        The set is built on first use and kept in sync by record_processing.
+
+        Returns:
+            Set of processed thread IDs
+        """
+        if self._processed_ids is None:
+            self._processed_ids = set(self.load().processed_thread_ids)
+        return self._processed_ids
+
+    def _history_positions(self) -> dict[str, list[int]]:
+        """Get positions of each thread's entries in the processing history.
+
+        Built on first use and kept in sync by record_processing.
+
+        Returns:
+            Mapping of thread ID to indexes into processing_history
+        """
+        if self._history_index is None:
+            index: dict[str, list[int]] = defaultdict(list)
+            for i, h in enumerate(self.load().processing_history):
+                index[h.thread_id].append(i)
+            self._history_index = dict(index)
+        return self._history_index
 
     def is_processed(self, thread_id: str) -> bool:
         """Check if a thread has already been processed.
@@ -119,8 +171,7 @@ class StateManager:
         Returns:
             True if thread has been processed
         """
-        state = self.load()
-        return thread_id in state.processed_thread_ids
+        return thread_id in self.processed_ids_set()
 
     def get_unprocessed_threads(self, thread_ids: list[str]) -> list[str]:
         """Filter out already-processed threads.
@@ -131,8 +182,8 @@ class StateManager:
         Returns:
             List of thread IDs that haven't been processed
         """
-        state = self.load()
-        return [tid for tid in thread_ids if tid not in state.processed_thread_ids]
+        processed = self.processed_ids_set()
+        return [tid for tid in thread_ids if tid not in processed]
 
     def record_processing(
         self,
@@ -164,8 +215,10 @@ class StateManager:
         state = self.load()
 
         # Add to processed list if not already there
-        if thread_id not in state.processed_thread_ids:
+        processed = self.processed_ids_set()
+        if thread_id not in processed:
             state.processed_thread_ids.append(thread_id)
+            processed.add(thread_id)
 
         # Create history entry
         entry = ProcessingHistoryEntry(
@@ -185,15 +238,11 @@ class StateManager:
         )
 
         # Check if entry already exists and update it, otherwise append
-        existing_idx = None
-        for i, h in enumerate(state.processing_history):
-            if h.thread_id == thread_id:
-                existing_idx = i
-                break
-
-        if existing_idx is not None:
-            state.processing_history[existing_idx] = entry
+        positions = self._history_positions()
+        if thread_id in positions:
+            state.processing_history[positions[thread_id][0]] = entry
         else:
+            positions[thread_id] = [len(state.processing_history)]
             state.processing_history.append(entry)
 
         # Update last poll time
@@ -239,13 +288,16 @@ class StateManager:
         state = self.load()
 
         if thread_id:
-            return [h for h in state.processing_history if h.thread_id == thread_id]
+            history = state.processing_history
+            return [history[i] for i in self._history_positions().get(thread_id, [])]
 
         return state.processing_history
 
     def clear_state(self) -> None:
         """Clear all state (useful for testing or reset)."""
         self._state = self._create_new_state()
+        self._processed_ids = None
+        self._history_index = None
         self.save()
 
     def get_stats(self) -> dict[str, Any]:
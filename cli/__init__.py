@@ -1,5 +1,15 @@
 """CLI interface for the LangSmith Thread Analyzer."""
 
-from cli.main import app
+from typing import Any
 
 __all__ = ["app"]
+
+
+def __getattr__(name: str) -> Any:
+    # Import the Typer app on first access so `cli.entry` can answer
+    # trivial invocations without loading it.
+    if name == "app":
+        from cli.main import app
+
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,6 @@
 """Entry point for running CLI as module: python -m cli"""
 
-from cli.main import app
+from cli.entry import main
 
 if __name__ == "__main__":
-    app()
+    main()
@@ -4,7 +4,11 @@ This module contains Claude Code agent files (.md) that define
 specialized agents with pre-approved tool permissions.
 """
 
+import atexit
+import contextlib
+import functools
 import logging
+import os
 import shutil
 from importlib import resources
 from pathlib import Path
@@ -18,15 +22,47 @@ AGENTS = [
 ]
 
 
+def _list_dir_names(directory: Path) -> set[str]:
+    """List the entry names in a directory with a single scandir call.
+
+    Args:
+        directory: Directory to list
+
+    Returns:
+        Set of entry names, empty if the directory does not exist
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries}
+    except FileNotFoundError:
+        return set()
+
+
+@functools.cache
+def _package_dir(package: str) -> Path:
+    """Get the filesystem path of a package's resource directory.
+
+    Resolved once per package; for zipped installs this extracts to a temp
+    dir that stays valid until interpreter exit.
+
+    Args:
+        package: Dotted package name
+
+    Returns:
+        Path to the package directory
+    """
+    stack = contextlib.ExitStack()
+    atexit.register(stack.close)
+    return stack.enter_context(resources.as_file(resources.files(package)))
+
+
 def get_agents_dir() -> Path:
     """Get the path to the agents directory in the package.
 
     Returns:
         Path to the agents directory
     """
-    # Use importlib.resources for Python 3.9+
-    with resources.as_file(resources.files(__package__)) as agents_path:
-        return agents_path
+    return _package_dir(__package__)
 
 
 def install_agents(
@@ -56,13 +92,16 @@ def install_agents(
 
     # Get the source agents directory
     source_dir = get_agents_dir()
+    # One directory listing instead of a stat per agent; forced installs
+    # copy everything, so they don't need it
+    existing = set() if force else _list_dir_names(target_dir)
 
     for agent_name in AGENTS:
         source_file = source_dir / agent_name
         target_file = target_dir / agent_name
 
         try:
-            if target_file.exists() and not force:
+            if agent_name in existing:
                 # Compare content — update if package version is newer/different
                 if source_file.read_text() == target_file.read_text():
                     results[agent_name] = True
@@ -98,9 +137,5 @@ def get_installed_agents(
             project_root = Path.cwd()
         target_dir = project_root / ".claude" / "agents"
 
-    installed = []
-    for agent_name in AGENTS:
-        if (target_dir / agent_name).exists():
-            installed.append(agent_name)
-
-    return installed
+    existing = _list_dir_names(target_dir)
+    return [agent_name for agent_name in AGENTS if agent_name in existing]
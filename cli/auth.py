@@ -7,21 +7,40 @@ Handles:
 """
 
 import base64
+import contextlib
 import hashlib
 import hmac
 import json
 import logging
+import math
 import os
 import secrets
+import time
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+from pathlib import Path
 from typing import Any
 
+from shared.utils.serialization import loads
+
 logger = logging.getLogger(__name__)
 
 # Service name for keyring storage
 KEYRING_SERVICE = "geniable"
 
+# Short-lived record of a successful auth check, so back-to-back commands
+# (e.g. `geni analyze fetch | ...`) skip re-reading tokens from the keyring
+AUTH_CACHE_FILE = Path.home() / ".geniable" / "cache" / "auth_ok.json"
+AUTH_CACHE_TTL_SECONDS = 300
+
+# Tokens read from storage, by config dir -> (token file mtime, tokens), so
+# repeated lookups in one process skip the keyring and token file
+_TOKEN_CACHE: dict[str, tuple[float | None, "AuthTokens"]] = {}
+
+# Decoded JWT claims by token hash -> (exp timestamp, claims)
+CLAIMS_CACHE_SIZE = 32
+_CLAIMS_CACHE: dict[bytes, tuple[float, dict[str, Any]]] = {}
+
 
 class AuthenticationError(Exception):
     """Raised when authentication fails."""
@@ -63,12 +82,20 @@ class AuthTokens:
 
     def is_expired(self) -> bool:
         """Check if access token is expired (with 5-minute buffer)."""
-        if not self.expires_at:
-            return True
+        remaining = self.seconds_until_expiry()
         buffer_seconds = 300  # 5 minutes
-        now = datetime.now(UTC)
+        return remaining is None or remaining < buffer_seconds
+
+    def seconds_until_expiry(self) -> float | None:
+        """Get the seconds left before the access token expires.
+
+        Returns:
+            Seconds remaining (negative once expired), or None if unknown
+        """
+        if not self.expires_at:
+            return None
         expires = self.expires_at if self.expires_at.tzinfo else self.expires_at.replace(tzinfo=UTC)
-        return now > expires - timedelta(seconds=buffer_seconds)
+        return expires.timestamp() - time.time()
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for storage."""
@@ -125,6 +152,13 @@ class TokenStorage:
         os.makedirs(self.config_dir, exist_ok=True)
         return os.path.join(self.config_dir, "tokens.json")
 
+    def token_file_mtime(self) -> float | None:
+        """Get the modification time of the token file, if present."""
+        try:
+            return os.path.getmtime(os.path.join(self.config_dir, "tokens.json"))
+        except OSError:
+            return None
+
     def store_tokens(self, tokens: AuthTokens) -> None:
         """Store tokens securely.
 
@@ -137,6 +171,7 @@ class TokenStorage:
             try:
                 self._keyring.set_password(KEYRING_SERVICE, "tokens", data)
                 logger.debug("Tokens stored in keyring")
+                _TOKEN_CACHE[self.config_dir] = (self.token_file_mtime(), tokens)
                 return
             except Exception as e:
                 logger.warning(f"Keyring storage failed: {e}, using file fallback")
@@ -147,13 +182,22 @@ class TokenStorage:
             f.write(data)
         os.chmod(token_file, 0o600)  # User read/write only
         logger.debug("Tokens stored in file")
+        _TOKEN_CACHE[self.config_dir] = (self.token_file_mtime(), tokens)
 
     def get_tokens(self) -> AuthTokens | None:
         """Retrieve stored tokens.
 
+        Tokens already read in this process are reused while they are
+        unexpired and the token file is unchanged.
+
         Returns:
             AuthTokens or None if not found
         """
+        token_mtime = self.token_file_mtime()
+        cached = _TOKEN_CACHE.get(self.config_dir)
+        if cached is not None and cached[0] == token_mtime and not cached[1].is_expired():
+            return cached[1]
+
         data = None
 
         if self._keyring:
@@ -176,13 +220,17 @@ class TokenStorage:
             return None
 
         try:
-            return AuthTokens.from_dict(json.loads(data))
+            tokens = AuthTokens.from_dict(json.loads(data))
         except Exception as e:
             logger.error(f"Failed to parse stored tokens: {e}")
             return None
 
+        _TOKEN_CACHE[self.config_dir] = (token_mtime, tokens)
+        return tokens
+
     def clear_tokens(self) -> None:
         """Clear stored tokens."""
+        _TOKEN_CACHE.pop(self.config_dir, None)
         if self._keyring:
             try:
                 self._keyring.delete_password(KEYRING_SERVICE, "tokens")
@@ -630,6 +678,7 @@ class CognitoAuthClient:
     def logout(self) -> None:
         """Clear stored tokens (local logout)."""
         self._token_storage.clear_tokens()
+        clear_auth_cache()
 
     def get_current_tokens(self) -> AuthTokens | None:
         """Get current tokens, refreshing if necessary.
@@ -653,11 +702,24 @@ class CognitoAuthClient:
     def is_authenticated(self) -> bool:
         """Check if user is authenticated.
 
+        A recent successful check (see has_recent_auth) is trusted as is, so
+        the common case reads one small file and never touches the keyring
+        or imports boto3. Otherwise the stored tokens are checked, which only
+        reaches Cognito when they need refreshing.
+
         Returns:
             True if valid tokens exist
         """
+        token_mtime = self._token_storage.token_file_mtime()
+        if has_recent_auth(token_mtime):
+            return True
+
         tokens = self.get_current_tokens()
-        return tokens is not None
+        if tokens is None:
+            return False
+
+        record_auth_ok(tokens, self._token_storage.token_file_mtime())
+        return True
 
     # =========================================================================
     # SRP Helper Methods
@@ -772,19 +834,107 @@ class CognitoAuthClient:
     def _extract_user_id(self, id_token: str) -> str:
         """Extract user ID (sub) from ID token."""
         try:
-            # JWT is base64url encoded, split by dots
-            payload = id_token.split(".")[1]
-            # Add padding if needed
-            padding = 4 - len(payload) % 4
-            if padding != 4:
-                payload += "=" * padding
-            decoded = base64.urlsafe_b64decode(payload)
-            claims = json.loads(decoded)
-            return str(claims.get("sub", ""))
+            return str(decode_jwt_payload(id_token).get("sub", ""))
         except Exception:
             return ""
 
 
+def decode_jwt_payload(token: str) -> dict[str, Any]:
+    """Decode the claims of a JWT without verifying its signature.
+
+    Claims are cached for the life of the process until the token's ``exp``.
+    Entries are keyed by a hash of the token so the cache never holds it in
+    plain text. Callers must treat the returned dict as read-only.
+
+    Args:
+        token: Encoded JWT (header.payload.signature)
+
+    Returns:
+        Decoded payload claims
+
+    Raises:
+        ValueError: If the token is not a well-formed JWT
+    """
+    key = hashlib.sha256(token.encode()).digest()[:16]
+    cached = _CLAIMS_CACHE.get(key)
+    if cached is not None:
+        if cached[0] > time.time():
+            return cached[1]
+        del _CLAIMS_CACHE[key]
+
+    try:
+        # JWT is base64url encoded, split by dots; restore stripped padding
+        payload = token.split(".", 2)[1]
+        claims = loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    except (IndexError, ValueError) as e:
+        raise ValueError(f"Malformed JWT: {e}") from e
+    if not isinstance(claims, dict):
+        raise ValueError("Malformed JWT: payload is not an object")
+
+    exp = claims.get("exp")
+    valid_until = float(exp) if isinstance(exp, int | float) else math.inf
+    if valid_until > time.time():
+        if len(_CLAIMS_CACHE) >= CLAIMS_CACHE_SIZE:
+            del _CLAIMS_CACHE[next(iter(_CLAIMS_CACHE))]
+        _CLAIMS_CACHE[key] = (valid_until, claims)
+    return claims
+
+
+def has_recent_auth(token_mtime: float | None, ttl: int = AUTH_CACHE_TTL_SECONDS) -> bool:
+    """Check whether a successful authentication check was recorded recently.
+
+    The record is only trusted while it is younger than ``ttl`` seconds, the
+    tokens it was recorded for are not about to expire, and the token file
+    has not changed since.
+
+    Args:
+        token_mtime: Current modification time of the token file
+        ttl: Maximum age of the record in seconds
+
+    Returns:
+        True if the last auth check can be reused
+    """
+    try:
+        with open(AUTH_CACHE_FILE) as f:
+            data = json.load(f)
+        now = time.time()
+        if now - float(data["authenticated_at"]) >= ttl:
+            return False
+        expires_at = data.get("expires_at")
+        if expires_at is None or now >= float(expires_at) - 300:
+            return False
+        return bool(data.get("token_mtime") == token_mtime)
+    except (OSError, ValueError, KeyError, TypeError):
+        return False
+
+
+def record_auth_ok(tokens: AuthTokens, token_mtime: float | None) -> None:
+    """Record a successful authentication check for has_recent_auth().
+
+    Args:
+        tokens: The valid tokens that were found
+        token_mtime: Modification time of the token file they were read from
+    """
+    data = {
+        "authenticated_at": time.time(),
+        "expires_at": tokens.expires_at.timestamp() if tokens.expires_at else None,
+        "token_mtime": token_mtime,
+    }
+    try:
+        AUTH_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(AUTH_CACHE_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f)
+    except OSError as e:
+        logger.debug(f"Could not write auth cache: {e}")
+
+
+def clear_auth_cache() -> None:
+    """Forget any recorded authentication check."""
+    with contextlib.suppress(OSError):
+        os.remove(AUTH_CACHE_FILE)
+
+
 # Hardcoded Cognito configuration - all users connect to the same Geniable cloud service
 DEFAULT_COGNITO_USER_POOL_ID = "ap-southeast-2_5OWr5yHu8"
 DEFAULT_COGNITO_CLIENT_ID = "3936nngb9i12t5ei6rjn9fblgc"
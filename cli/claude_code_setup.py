@@ -69,7 +69,6 @@ class ClaudeCodeSetup:
 
         # Check current state
         claude_md_exists, claude_md_path = self.check_claude_md_exists()
-        claude_dir_exists = self.check_claude_directory_exists()
 
         if claude_md_exists:
             console.print(f"[green]✓[/green] CLAUDE.md found: {claude_md_path}")
@@ -1,5 +1,16 @@
-"""CLI command submodules."""
+"""CLI command submodules.
 
-from cli.commands import analyze, scaffold, ticket
+Submodules are imported on first attribute access, so loading one command
+module does not pull in the others.
+"""
 
-__all__ = ["analyze", "scaffold", "ticket"]
+import importlib
+from typing import Any
+
+__all__ = ["aliases", "analyze", "auth", "issues", "scaffold", "ticket"]
+
+
+def __getattr__(name: str) -> Any:
+    if name in __all__:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,53 @@
+"""Top-level aliases for analyze and issues subcommands (convenience).
+
+Registered lazily on the root app, so the aliased command modules are only
+imported when an alias runs.
+"""
+
+import typer
+
+app = typer.Typer()
+
+
+@app.command("analyze-latest")
+def analyze_latest_alias(
+    limit: int = typer.Option(50, "--limit", "-l", help="Maximum threads to analyze"),
+    dry_run: bool = typer.Option(False, "--dry-run", help="Analyze without creating tickets"),
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
+    ci: bool = typer.Option(
+        False,
+        "--ci",
+        help="Enable LLM-powered reports using Anthropic API (for CI/CD pipelines)",
+    ),
+) -> None:
+    """Analyze latest annotated threads (alias for 'analyze latest')."""
+    from cli.commands.analyze import analyze_latest
+
+    analyze_latest(limit=limit, dry_run=dry_run, verbose=verbose, ci=ci)
+
+
+@app.command("issues-list")
+def issues_list_alias(
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
+    limit: int = typer.Option(50, "--limit", "-l", help="Maximum issues to fetch"),
+) -> None:
+    """List open Jira issues (alias for 'issues list')."""
+    from cli.commands.issues import issues_list
+
+    issues_list(verbose=verbose, limit=limit)
+
+
+@app.command("analyze-specific")
+def analyze_specific_alias(
+    count: int = typer.Option(10, "--count", "-c", help="Number of recent threads to show"),
+    verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
+    ci: bool = typer.Option(
+        False,
+        "--ci",
+        help="Enable LLM-powered reports using Anthropic API (for CI/CD pipelines)",
+    ),
+) -> None:
+    """Select and analyze a specific thread (alias for 'analyze specific')."""
+    from cli.commands.analyze import analyze_specific
+
+    analyze_specific(count=count, verbose=verbose, ci=ci)
@@ -2,17 +2,21 @@
 
 from __future__ import annotations
 
+import contextlib
+import functools
+import importlib
 import json
 import logging
 import os
 import shutil
 import subprocess
 import sys
-from typing import Any
+import threading
+from typing import TYPE_CHECKING, Any
 
 import typer
 from rich.console import Console
-from rich.prompt import Confirm, IntPrompt, Prompt
+from rich.prompt import Confirm, IntPrompt
 from rich.table import Table
 
 from cli.config_manager import ConfigManager
@@ -23,12 +27,33 @@ from cli.output_formatter import (
     print_header,
     print_info,
     print_success,
+    print_traceback,
     print_warning,
 )
+from cli.skills import ensure_skills_installed
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from cli.auth import CognitoAuthClient
 
 console = Console()
 app = typer.Typer(help="Thread analysis commands")
 
+# Rich markup for the thread selection table
+_STATUS_STYLES = {"error": "[red]{}[/red]", "success": "[green]{}[/green]"}
+_PROCESSED_MARKS = {True: "[green]✓[/green]", False: "[dim]—[/dim]"}
+
+
+def _truncate(text: str, width: int) -> str:
+    """Truncate text to at most ``width`` characters, ending with an ellipsis."""
+    return text if len(text) <= width else text[: width - 1] + "…"
+
+
+def _format_duration(seconds: float) -> str:
+    """Format a duration in seconds as minutes above one minute."""
+    return f"{seconds / 60:.1f}m" if seconds > 60 else f"{seconds:.1f}s"
+
 
 def _is_inside_claude_code() -> bool:
     """Check if we're running inside an active Claude Code session."""
@@ -90,9 +115,11 @@ def _spawn_claude_code(
     claude_path = shutil.which("claude")
     if not claude_path:
         print_error("Claude Code CLI not found")
-        print_info("Option 1: Run 'geni analyze-latest' from within Claude Code")
-        print_info("Option 2: Install Claude Code: npm install -g @anthropic-ai/claude-code")
-        print_info("Option 3: Use --ci flag for automated analysis with Anthropic API")
+        print_info(
+            "Option 1: Run 'geni analyze-latest' from within Claude Code",
+            "Option 2: Install Claude Code: npm install -g @anthropic-ai/claude-code",
+            "Option 3: Use --ci flag for automated analysis with Anthropic API",
+        )
         raise typer.Exit(1)
 
     # Build the analysis prompt
@@ -164,13 +191,47 @@ Begin your analysis now."""
         return 1
 
 
+def _write_threads_json(
+    threads: list[Any], total_in_queue: int, skipped: int, returned: int
+) -> None:
+    """Write fetch results to stdout as a JSON object.
+
+    When piped, threads are serialized and written one at a time without
+    indentation so large detailed payloads are never built as a single string
+    and consumers can start reading immediately. Interactive terminals get
+    the indented form.
+    """
+    from shared.utils.serialization import dumps
+
+    metadata = {"total_in_queue": total_in_queue, "skipped": skipped, "returned": returned}
+
+    # Write encoded bytes directly when the stream exposes a binary buffer
+    sys.stdout.flush()
+    buffer = getattr(sys.stdout, "buffer", None)
+    write = buffer.write if buffer is not None else lambda b: sys.stdout.write(b.decode())
+
+    if sys.stdout.isatty():
+        output_data = {"threads": [t.to_dict() for t in threads], **metadata}
+        write(dumps(output_data, indent=True) + b"\n")
+    else:
+        write(b'{"threads":[')
+        for i, thread in enumerate(threads):
+            if i:
+                write(b",")
+            write(dumps(thread.to_dict()))
+        write(b"]," + dumps(metadata)[1:] + b"\n")
+
+    if buffer is not None:
+        buffer.flush()
+
+
 def _get_anthropic_api_key(config_manager: ConfigManager) -> str | None:
     """Get Anthropic API key from environment, config, or secrets.
 
     Priority order:
     1. ANTHROPIC_API_KEY environment variable
     2. Config file (anthropic.api_key)
-    3. AWS Secrets Manager (if authenticated)
+    3. AWS Secrets Manager (if authenticated, cached locally for an hour)
 
     Returns:
         API key if found, None otherwise
@@ -187,16 +248,17 @@ def _get_anthropic_api_key(config_manager: ConfigManager) -> str | None:
     except Exception:
         pass
 
-    # 3. Check AWS Secrets Manager (if we have auth token)
+    # 3. Check AWS Secrets Manager (if we have auth token), cached locally.
+    # Without a token there is nothing to look up, so skip the import entirely.
+    if not _get_auth_token():
+        return None
+
     try:
-        from cli.secrets_manager import SecretsManagerClient
+        from cli.secrets_manager import get_cached_secret
 
-        auth_token = _get_auth_token()
-        if auth_token:
-            secrets_client = SecretsManagerClient()
-            secret = secrets_client.get_secret("anthropic")
-            if secret and secret.get("api_key"):
-                return str(secret["api_key"])
+        secret = get_cached_secret("anthropic")
+        if secret and secret.get("api_key"):
+            return str(secret["api_key"])
     except Exception:
         pass
 
@@ -210,14 +272,20 @@ def _prompt_for_anthropic_key(config_manager: ConfigManager) -> str:
         The API key entered by the user
 
     Raises:
-        typer.Exit: If user cancels or provides invalid key
+        typer.Exit: If user cancels, provides invalid key, or stdin is not interactive
     """
+    if not sys.stdin.isatty():
+        print_error("--ci requires ANTHROPIC_API_KEY to be set in non-interactive runs")
+        raise typer.Exit(2)
+
     console.print()
     console.print("[yellow]Anthropic API key required for LLM-powered reports.[/yellow]")
     console.print("Get your API key from: [link]https://console.anthropic.com/settings/keys[/link]")
     console.print()
 
-    api_key = Prompt.ask("Enter your Anthropic API key", password=True)
+    from getpass import getpass
+
+    api_key = getpass("Enter your Anthropic API key: ").strip()
 
     if not api_key:
         print_error("API key is required for --ci mode")
@@ -234,7 +302,7 @@ def _prompt_for_anthropic_key(config_manager: ConfigManager) -> str:
             config = config_manager.load()
             from shared.models.config import AnthropicConfig
 
-            config.anthropic = AnthropicConfig(api_key=api_key)
+            config = config.model_copy(update={"anthropic": AnthropicConfig(api_key=api_key)})
             ConfigManager.save_config(config.model_dump())
             print_success("API key saved to config")
         except Exception as e:
@@ -246,6 +314,9 @@ def _prompt_for_anthropic_key(config_manager: ConfigManager) -> str:
 def _setup_ci_mode(config_manager: ConfigManager) -> str:
     """Set up CI mode with Anthropic API key.
 
+    The key is returned rather than exported to the environment; callers
+    pass it explicitly to AgentConfig / ReportGenerator.
+
     Returns:
         The API key to use
 
@@ -257,34 +328,56 @@ def _setup_ci_mode(config_manager: ConfigManager) -> str:
     if not api_key:
         api_key = _prompt_for_anthropic_key(config_manager)
 
-    # Set environment variable for the session
-    os.environ["ANTHROPIC_API_KEY"] = api_key
-
     return api_key
 
 
-def _ensure_skills_installed() -> None:
-    """Ensure Geniable agents and skills are installed if .claude/ exists."""
-    try:
-        from pathlib import Path
+def _preimport(*modules: str) -> None:
+    """Import modules on a background thread to overlap with other startup work.
 
-        from cli.agents import install_agents
-        from cli.skills import install_skills
+    Later ``from ... import`` statements then resolve from ``sys.modules``.
+    Failures are ignored here and surface at the real import site.
+    """
 
-        project_root = Path.cwd()
-        if (project_root / ".claude").exists():
-            install_agents(
-                target_dir=project_root / ".claude" / "agents",
-                force=False,
-                project_root=project_root,
-            )
-            install_skills(
-                target_dir=project_root / ".claude" / "commands",
-                force=False,
-                project_root=project_root,
-            )
-    except Exception:
-        pass
+    def _import_all() -> None:
+        for module in modules:
+            with contextlib.suppress(Exception):
+                importlib.import_module(module)
+
+    threading.Thread(target=_import_all, daemon=True).start()
+
+
+def _make_progress_handler(
+    loading_progress: ThreadLoadingProgress,
+) -> Callable[[str, int, int, str], None]:
+    """Build the fetch progress callback that drives a ThreadLoadingProgress.
+
+    Args:
+        loading_progress: Active loading display to update
+
+    Returns:
+        Callback matching IntegrationServiceClient's progress_callback signature
+    """
+
+    def progress_handler(phase: str, current: int, total: int, thread_id: str) -> None:
+        if phase == "summaries":
+            loading_progress.start_summaries()
+        elif phase == "details":
+            if current == 0:
+                loading_progress.start_details(total)
+            else:
+                loading_progress.update_details(current, thread_id)
+        elif phase == "complete":
+            loading_progress.complete()
+
+    return progress_handler
+
+
+@functools.lru_cache(maxsize=1)
+def _get_auth_client() -> CognitoAuthClient:
+    """Get the Cognito auth client, created once per process."""
+    from cli.auth import get_auth_client
+
+    return get_auth_client()
 
 
 def _require_auth() -> None:
@@ -292,10 +385,7 @@ def _require_auth() -> None:
     import typer as t
 
     try:
-        from cli.auth import get_auth_client
-
-        auth_client = get_auth_client()
-        if not auth_client.is_authenticated():
+        if not _get_auth_client().is_authenticated():
             print_error("Authentication required")
             print_info("Run 'geni login' to authenticate first")
             raise t.Exit(1)
@@ -317,10 +407,7 @@ def _get_auth_token() -> str | None:
         The ID token if authenticated, None otherwise
     """
     try:
-        from cli.auth import get_auth_client
-
-        auth_client = get_auth_client()
-        tokens = auth_client.get_current_tokens()
+        tokens = _get_auth_client().get_current_tokens()
         if tokens:
             return tokens.id_token
     except Exception:
@@ -350,8 +437,14 @@ def analyze_latest(
     # Check auth status
     _require_auth()
 
+    # Warm the agent imports while configuration loads
+    if ci:
+        _preimport("agent.agent")
+    else:
+        _preimport("agent.api_clients.integration_client", "agent.state_manager")
+
     # Ensure agents and skills are installed
-    _ensure_skills_installed()
+    ensure_skills_installed()
 
     # Only show detailed logs in verbose mode
     if verbose:
@@ -383,8 +476,10 @@ def analyze_latest(
             state_dir=str(config.defaults.report_dir),
         )
         stats = state_manager.get_stats()
-        print_info(f"Last poll: {stats['last_poll']}")
-        print_info(f"Previously processed: {stats['total_processed']} threads")
+        print_info(
+            f"Last poll: {stats['last_poll']}",
+            f"Previously processed: {stats['total_processed']} threads",
+        )
 
         # Initialize integration client
         integration = IntegrationServiceClient(
@@ -394,22 +489,11 @@ def analyze_latest(
         )
 
         # Fetch threads with progress display
-        def progress_handler(phase: str, current: int, total: int, thread_id: str) -> None:
-            if phase == "summaries":
-                loading_progress.start_summaries()
-            elif phase == "details":
-                if current == 0:
-                    loading_progress.start_details(total)
-                else:
-                    loading_progress.update_details(current, thread_id)
-            elif phase == "complete":
-                loading_progress.complete()
-
         with ThreadLoadingProgress() as loading_progress:
             threads = integration.get_annotated_threads(
                 limit=limit,
                 with_details=True,
-                progress_callback=progress_handler,
+                progress_callback=_make_progress_handler(loading_progress),
             )
 
         if not threads:
@@ -425,32 +509,18 @@ def analyze_latest(
         if ci:
             # CI MODE: Use Anthropic API directly
             print_info("Setting up LLM-powered reports (CI mode)...")
-            _setup_ci_mode(config_manager)
+            anthropic_api_key = _setup_ci_mode(config_manager)
             print_success("CI mode enabled - using Anthropic API")
 
             # Import agent for CI mode
             from agent.agent import Agent, AgentConfig
 
-            # Get provider-specific config
-            jira_project_key = None
-            notion_database_id = None
-            if config.jira:
-                jira_project_key = config.jira.project_key
-            if config.notion:
-                notion_database_id = config.notion.database_id
-
             # Build agent config
-            agent_config = AgentConfig(
-                integration_endpoint=config.aws.integration_endpoint,
-                evaluation_endpoint=config.aws.evaluation_endpoint,
-                api_key=config.aws.api_key,
+            agent_config = AgentConfig.from_app_config(
+                config,
                 auth_token=auth_token,
-                provider=config.provider,
-                report_dir=config.defaults.report_dir,
-                project=config.langsmith.project,
-                jira_project_key=jira_project_key,
-                notion_database_id=notion_database_id,
                 ci_mode=True,
+                anthropic_api_key=anthropic_api_key,
             )
 
             # Create agent and run
@@ -507,7 +577,7 @@ def analyze_latest(
     except Exception as e:
         print_error(f"Analysis failed: {e}")
         if verbose:
-            console.print_exception()
+            print_traceback()
         raise typer.Exit(1) from e
 
 
@@ -530,6 +600,9 @@ def analyze_specific(
     # Check auth status (optional for now)
     _require_auth()
 
+    # Warm the agent imports while configuration loads
+    _preimport("agent.agent")
+
     # Only show detailed logs in verbose mode
     if verbose:
         logging.basicConfig(
@@ -550,9 +623,10 @@ def analyze_specific(
 
         # Handle --ci flag for LLM-powered reports
         ci_mode = False
+        anthropic_api_key = None
         if ci:
             print_info("Setting up LLM-powered reports (CI mode)...")
-            _setup_ci_mode(config_manager)
+            anthropic_api_key = _setup_ci_mode(config_manager)
             ci_mode = True
             print_success("CI mode enabled - reports will include AI-powered insights")
 
@@ -577,33 +651,26 @@ def analyze_specific(
         )
 
         # Fetch recent threads with loading animation
-        def progress_handler(phase: str, current: int, total: int, thread_id: str) -> None:
-            if phase == "summaries":
-                loading_progress.start_summaries()
-            elif phase == "details":
-                if current == 0:
-                    loading_progress.start_details(total)
-                else:
-                    loading_progress.update_details(current, thread_id)
-            elif phase == "complete":
-                loading_progress.complete()
-
         with ThreadLoadingProgress() as loading_progress:
             threads = integration.get_annotated_threads(
                 limit=count,
                 with_details=True,
-                progress_callback=progress_handler,
+                progress_callback=_make_progress_handler(loading_progress),
             )
 
         if not threads:
             print_warning("No threads found in the annotation queue")
             raise typer.Exit(0)
 
-        # Get processed thread IDs for marking
-        processed_ids = set(state_manager.load().processed_thread_ids)
-
         # Display table
-        table = Table(title=f"Recent Threads (showing {len(threads)})")
+        # Cells are pre-truncated to their column widths below, so Rich's
+        # measurement pass stays trivial even for long queues.
+        table = Table(
+            title=f"Recent Threads (showing {len(threads)})",
+            show_lines=False,
+            pad_edge=False,
+            collapse_padding=True,
+        )
         table.add_column("#", style="dim", width=4)
         table.add_column("Thread ID", style="cyan", width=12)
         table.add_column("Name", width=40)
@@ -611,32 +678,19 @@ def analyze_specific(
         table.add_column("Duration", width=10)
         table.add_column("Processed", width=10)
 
-        for idx, thread in enumerate(threads, 1):
-            # Format duration
-            duration = thread.duration_seconds
-            duration_str = f"{duration / 60:.1f}m" if duration > 60 else f"{duration:.1f}s"
-
-            # Check if processed
-            is_processed = thread.thread_id in processed_ids
-            processed_mark = "[green]✓[/green]" if is_processed else "[dim]—[/dim]"
-
-            # Status styling
-            status = thread.status
-            if status == "error":
-                status_styled = f"[red]{status}[/red]"
-            elif status == "success":
-                status_styled = f"[green]{status}[/green]"
-            else:
-                status_styled = status
-
-            table.add_row(
+        rows = [
+            (
                 str(idx),
-                thread.thread_id[:10] + "...",
-                thread.name[:38] + "..." if len(thread.name) > 40 else thread.name,
-                status_styled,
-                duration_str,
-                processed_mark,
+                _truncate(thread.thread_id, 11),
+                _truncate(thread.name, 40),
+                _STATUS_STYLES.get(thread.status, "{}").format(thread.status),
+                _format_duration(thread.duration_seconds),
+                _PROCESSED_MARKS[state_manager.is_processed(thread.thread_id)],
             )
+            for idx, thread in enumerate(threads, 1)
+        ]
+        for row in rows:
+            table.add_row(*row)
 
         console.print()
         console.print(table)
@@ -656,7 +710,7 @@ def analyze_specific(
         print_info(f"Selected: {selected_thread.name}")
 
         # Check if already processed
-        if selected_thread.thread_id in processed_ids:
+        if state_manager.is_processed(selected_thread.thread_id):
             print_warning("This thread has already been processed")
             history = state_manager.get_processing_history(selected_thread.thread_id)
             if history:
@@ -672,26 +726,12 @@ def analyze_specific(
             if not Confirm.ask("Re-analyze this thread?", default=False):
                 raise typer.Exit(0)
 
-        # Get provider-specific config
-        jira_project_key = None
-        notion_database_id = None
-        if config.jira:
-            jira_project_key = config.jira.project_key
-        if config.notion:
-            notion_database_id = config.notion.database_id
-
         # Build agent config
-        agent_config = AgentConfig(
-            integration_endpoint=config.aws.integration_endpoint,
-            evaluation_endpoint=config.aws.evaluation_endpoint,
-            api_key=config.aws.api_key,
+        agent_config = AgentConfig.from_app_config(
+            config,
             auth_token=auth_token,
-            provider=config.provider,
-            report_dir=config.defaults.report_dir,
-            project=config.langsmith.project,
-            jira_project_key=jira_project_key,
-            notion_database_id=notion_database_id,
             ci_mode=ci_mode,
+            anthropic_api_key=anthropic_api_key,
         )
 
         # Create agent and analyze
@@ -706,7 +746,11 @@ def analyze_specific(
         # Generate report
         from agent.report_generator import ReportGenerator
 
-        reporter = ReportGenerator(output_dir=config.defaults.report_dir, use_llm=ci_mode)
+        reporter = ReportGenerator(
+            output_dir=config.defaults.report_dir,
+            use_llm=ci_mode,
+            anthropic_api_key=anthropic_api_key,
+        )
         report_path = reporter.generate_thread_report(
             thread=selected_thread.to_dict(),
             eval_result=result.evaluation,
@@ -768,7 +812,7 @@ def analyze_specific(
     except Exception as e:
         print_error(f"Analysis failed: {e}")
         if verbose:
-            console.print_exception()
+            print_traceback()
         raise typer.Exit(1) from e
 
 
@@ -827,9 +871,7 @@ def fetch(
         # Fetch threads with metadata
         if thread_id:
             # Fetch specific thread by ID
-            result = integration.fetch_threads(limit=1, with_details=True)
-            # Filter to the specific thread
-            result.threads = [t for t in result.threads if t.thread_id == thread_id]
+            result = integration.fetch_thread(thread_id)
             if not result.threads:
                 print_error(f"Thread not found: {thread_id}")
                 raise typer.Exit(1)
@@ -854,35 +896,22 @@ def fetch(
         if not result.threads:
             # Output empty result for consistent parsing
             if output == "json":
-                output_data = {
-                    "threads": [],
-                    "total_in_queue": result.total_in_queue,
-                    "skipped": result.skipped,
-                    "returned": 0,
-                }
-                print(json.dumps(output_data, indent=2, default=str))
+                _write_threads_json([], result.total_in_queue, result.skipped, 0)
             else:
                 print("[]")
             return
 
-        # Convert to serializable format
-        thread_data = [t.to_dict() for t in result.threads]
-
         # Output in requested format
         if output == "json":
-            output_data = {
-                "threads": thread_data,
-                "total_in_queue": result.total_in_queue,
-                "skipped": result.skipped,
-                "returned": result.returned,
-            }
-            print(json.dumps(output_data, indent=2, default=str))
+            _write_threads_json(
+                result.threads, result.total_in_queue, result.skipped, result.returned
+            )
         elif output == "yaml":
             try:
                 import yaml
 
                 output_data = {
-                    "threads": thread_data,
+                    "threads": [t.to_dict() for t in result.threads],
                     "total_in_queue": result.total_in_queue,
                     "skipped": result.skipped,
                     "returned": result.returned,
@@ -903,7 +932,7 @@ def fetch(
     except Exception as e:
         print_error(f"Fetch failed: {e}")
         if verbose:
-            console.print_exception()
+            print_traceback()
         raise typer.Exit(1) from e
 
 
@@ -976,5 +1005,5 @@ def mark_done(
     except Exception as e:
         print_error(f"Mark-done failed: {e}")
         if verbose:
-            console.print_exception()
+            print_traceback()
         raise typer.Exit(1) from e
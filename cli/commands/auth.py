@@ -0,0 +1,369 @@
+"""Authentication commands: login, logout and whoami.
+
+Registered lazily on the root app, so this module is only imported when
+one of these commands runs.
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING
+
+import typer
+
+from cli.skills import ensure_skills_installed
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from types import ModuleType
+
+    from cli.auth import CognitoAuthClient
+
+app = typer.Typer()
+
+# login options
+_EMAIL_OPTION = typer.Option(None, "--email", "-e", help="Email address")
+_NO_KEYRING_OPTION = typer.Option(
+    False, "--no-keyring", help="Use file storage instead of system keyring"
+)
+_RESET_OPTION = typer.Option(
+    False, "--reset", help="Reset password using a verification code from email"
+)
+_DEBUG_OPTION = typer.Option(False, "--debug", help="Show verbose auth diagnostics")
+
+
+@functools.lru_cache(maxsize=1)
+def _auth() -> ModuleType:
+    """Import the authentication module on first use.
+
+    Returns:
+        The cli.auth module
+
+    Raises:
+        typer.Exit: If the module's dependencies are not installed
+    """
+    try:
+        import cli.auth
+    except ImportError as e:
+        from cli.output_formatter import print_error, print_info
+
+        print_error(f"Authentication module not available: {e}")
+        print_info("Ensure all dependencies are installed: pip install -e '.[dev]'")
+        raise typer.Exit(1) from e
+    return cli.auth
+
+
+def _handle_password_reset(
+    auth_client: CognitoAuthClient, email: str, getpass: Callable[[str], str]
+) -> None:
+    """Handle password reset via the standard ForgotPassword flow.
+
+    Initiates a fresh ForgotPassword request (sends a new verification code),
+    then completes the reset with ConfirmForgotPassword. This is more reliable
+    than using the admin-provided code directly, which can fail to transition
+    the user out of RESET_REQUIRED status.
+
+    Args:
+        auth_client: CognitoAuthClient instance
+        email: User's email address
+        getpass: getpass function for secure password input
+    """
+    from cli.output_formatter import console, print_error, print_info, print_success
+
+    auth = _auth()
+
+    # Step 1: Initiate ForgotPassword to send a fresh verification code
+    print_info("Sending a fresh verification code to your email...")
+    try:
+        delivery = auth_client.initiate_forgot_password(username=email)
+        destination = delivery.get("Destination", "your email")
+        console.print(f"\n[cyan]We just sent a verification code to {destination}.[/cyan]")
+        console.print("[cyan]Please check your email and enter the code below.[/cyan]")
+    except auth.AuthenticationError as e:
+        print_error(f"Could not initiate password reset: {e}")
+        raise typer.Exit(1) from e
+
+    console.print("[dim]Password requirements: min 12 chars, uppercase, lowercase, numbers[/dim]\n")
+
+    # Step 2: Prompt for the fresh verification code
+    verification_code = typer.prompt("Verification code from email")
+    if not verification_code or not verification_code.strip():
+        print_error("Verification code is required")
+        raise typer.Exit(1)
+    verification_code = verification_code.strip()
+
+    # Step 3: Prompt for new password with confirmation
+    while True:
+        new_password = getpass("New password: ")
+        if not new_password:
+            print_error("Password is required")
+            continue
+
+        if len(new_password) < 12:
+            print_error("Password must be at least 12 characters")
+            continue
+
+        confirm_password = getpass("Confirm new password: ")
+        if new_password != confirm_password:
+            print_error("Passwords do not match")
+            continue
+
+        break
+
+    # Step 4: Confirm the reset with the fresh code
+    try:
+        print_info("Resetting password...")
+        auth_client.confirm_password_reset(
+            username=email,
+            confirmation_code=verification_code,
+            new_password=new_password,
+        )
+    except auth.AuthenticationError as reset_error:
+        print_error(f"Password reset failed: {reset_error}")
+        raise typer.Exit(1) from reset_error
+
+    print_success("Password has been reset successfully!")
+    console.print("\n[bold cyan]Next Steps:[/bold cyan]")
+    console.print("  1. Run [bold]geni login[/bold] to sign in with your new password")
+    console.print("  2. Run [bold]geni init[/bold] to configure your settings")
+
+
+@app.command()
+def login(
+    email: str | None = _EMAIL_OPTION,
+    no_keyring: bool = _NO_KEYRING_OPTION,
+    reset: bool = _RESET_OPTION,
+    debug: bool = _DEBUG_OPTION,
+) -> None:
+    """Login to Geni cloud service.
+
+    Authenticates with AWS Cognito and stores tokens securely in the
+    system keyring (macOS Keychain, Windows Credential Store) or
+    encrypted file if --no-keyring is specified.
+
+    If an administrator has reset your password, use --reset or answer
+    'y' when prompted to enter your verification code and set a new password.
+    """
+    from getpass import getpass
+
+    from cli.output_formatter import console, print_error, print_info, print_success, print_warning
+
+    auth = _auth()
+
+    # Get email if not provided
+    if not email:
+        email = typer.prompt("Email")
+
+    # Get auth client
+    auth_client = auth.get_auth_client(use_keyring=not no_keyring)
+
+    # Enable debug logging if requested
+    if debug:
+        import logging
+
+        logging.basicConfig(level=logging.DEBUG, format="%(name)s %(message)s")
+        console.print("[dim]Debug mode enabled[/dim]")
+
+    # If --reset flag, go directly to password reset flow
+    if reset:
+        _handle_password_reset(auth_client, email, getpass)
+        return
+
+    # Normal login flow
+    password = getpass("Password: ")
+
+    if not password:
+        print_error("Password is required")
+        raise typer.Exit(1)
+
+    try:
+        # Attempt login
+        print_info("Authenticating...")
+        tokens = auth_client.login(email, password)
+
+        print_success(f"Successfully logged in as {email}")
+
+        # Auto-install agents if project is initialized
+        ensure_skills_installed()
+
+        # Show token expiry
+        if tokens.expires_at:
+            expiry_str = tokens.expires_at.strftime("%Y-%m-%d %H:%M:%S %Z")
+            print_info(f"Session expires: {expiry_str}")
+
+        # Show next steps
+        console.print("\n[bold cyan]Next Steps:[/bold cyan]")
+        console.print("  1. Run 'geni init' to configure your settings")
+        console.print("  2. Your credentials will be stored securely in AWS")
+
+    except auth.PasswordChangeRequired as e:
+        # Handle first-time login with temporary password
+        print_warning("Password change required for new account.")
+        console.print("\n[cyan]Please set a new permanent password.[/cyan]")
+        console.print("[dim]Requirements: min 12 chars, uppercase, lowercase, numbers[/dim]\n")
+
+        # Prompt for new password with confirmation
+        while True:
+            new_password = getpass("New password: ")
+            if not new_password:
+                print_error("Password is required")
+                continue
+
+            if len(new_password) < 12:
+                print_error("Password must be at least 12 characters")
+                continue
+
+            confirm_password = getpass("Confirm new password: ")
+            if new_password != confirm_password:
+                print_error("Passwords do not match")
+                continue
+
+            break
+
+        try:
+            print_info("Setting new password...")
+            tokens = auth_client.complete_password_change(
+                session=e.session,
+                user_id=e.user_id,
+                new_password=new_password,
+                email=email,
+            )
+
+            print_success("Password changed successfully!")
+            print_success(f"Logged in as {email}")
+
+            # Auto-install agents if project is initialized
+            ensure_skills_installed()
+
+            # Show next steps
+            console.print("\n[bold cyan]Next Steps:[/bold cyan]")
+            console.print("  1. Run 'geni init' to configure your settings")
+            console.print("  2. Your credentials will be stored securely in AWS")
+
+        except auth.AuthenticationError as pw_error:
+            print_error(f"Password change failed: {pw_error}")
+            raise typer.Exit(1) from pw_error
+
+    except auth.PasswordResetRequired:
+        # Handle admin-initiated password reset detected during SRP auth
+        _handle_password_reset(auth_client, email, getpass)
+
+    except auth.AuthenticationError as e:
+        print_error(f"Authentication failed: {e}")
+
+        # Offer password reset if login failed — the user may be in
+        # RESET_REQUIRED state which SRP auth cannot distinguish from
+        # a wrong password.
+        if typer.confirm(
+            "\nDo you want to reset your password?",
+            default=False,
+        ):
+            _handle_password_reset(auth_client, email, getpass)
+        else:
+            raise typer.Exit(1) from e
+    except Exception as e:
+        print_error(f"Login failed: {e}")
+        raise typer.Exit(1) from e
+
+
+@app.command()
+def logout() -> None:
+    """Logout and clear stored authentication tokens.
+
+    Removes tokens from the system keyring or encrypted file storage.
+    """
+    from cli.output_formatter import print_error, print_success, print_warning
+
+    auth = _auth()
+
+    try:
+        auth_client = auth.get_auth_client()
+
+        if not auth_client.is_authenticated():
+            print_warning("Not currently logged in")
+            return
+
+        auth_client.logout()
+
+        from cli.secrets_manager import clear_secret_cache
+        from cli.wizard import clear_sync_hash
+
+        clear_secret_cache()
+        clear_sync_hash()
+        print_success("Successfully logged out")
+
+    except Exception as e:
+        print_error(f"Logout failed: {e}")
+        raise typer.Exit(1) from e
+
+
+@app.command()
+def whoami() -> None:
+    """Show current authentication status and user information.
+
+    Displays the currently logged-in user, token expiry, and
+    authentication status.
+    """
+    from cli.output_formatter import (
+        console,
+        print_error,
+        print_header,
+        print_info,
+        print_success,
+        print_warning,
+    )
+
+    # Auto-update skills/agents if package has newer versions
+    ensure_skills_installed()
+
+    auth = _auth()
+
+    try:
+        auth_client = auth.get_auth_client()
+
+        if not auth_client.is_authenticated():
+            print_warning("Not logged in")
+            print_info("Run 'geni login' to authenticate")
+            raise typer.Exit(1)
+
+        tokens = auth_client.get_current_tokens()
+
+        if not tokens:
+            print_warning("No valid session found")
+            print_info("Run 'geni login' to authenticate")
+            raise typer.Exit(1)
+
+        print_header("Authentication Status")
+
+        # Decode JWT to get user info (without verification - just for display)
+        try:
+            payload = auth.decode_jwt_payload(tokens.id_token)
+
+            email = payload.get("email", "Unknown")
+            user_id = payload.get("sub", "Unknown")
+
+            console.print(f"\n[cyan]Email:[/cyan] {email}")
+            console.print(f"[cyan]User ID:[/cyan] {user_id}")
+
+        except Exception:
+            console.print("\n[cyan]Status:[/cyan] Authenticated")
+
+        # Show token expiry
+        remaining = tokens.seconds_until_expiry()
+        if remaining is not None and tokens.expires_at:
+            if remaining > 0:
+                hours, remainder = divmod(int(remaining), 3600)
+                minutes, _ = divmod(remainder, 60)
+                console.print(f"[cyan]Session expires in:[/cyan] {hours}h {minutes}m")
+                expiry_str = tokens.expires_at.strftime("%Y-%m-%d %H:%M:%S UTC")
+                console.print(f"[dim]({expiry_str})[/dim]")
+            else:
+                print_warning("Session expired - run 'geni login' to reauthenticate")
+
+        print_success("\nAuthenticated and ready")
+
+    except typer.Exit:
+        raise
+    except Exception as e:
+        print_error(f"Failed to get authentication status: {e}")
+        raise typer.Exit(1) from e
@@ -21,6 +21,7 @@ from cli.output_formatter import (
     print_error,
     print_info,
     print_success,
+    print_traceback,
     print_warning,
 )
 
@@ -373,7 +374,7 @@ def issues_list(
     except Exception as e:
         print_error(f"Failed to list issues: {e}")
         if verbose:
-            console.print_exception()
+            print_traceback()
         raise typer.Exit(1) from e
 
 
@@ -446,7 +447,7 @@ def issues_resolve(
     except Exception as e:
         print_error(f"Failed to resolve issue: {e}")
         if verbose:
-            console.print_exception()
+            print_traceback()
         raise typer.Exit(1) from e
 
 
@@ -502,5 +503,5 @@ def issues_mark_done(
     except Exception as e:
         print_error(f"Failed to mark issue as done: {e}")
         if verbose:
-            console.print_exception()
+            print_traceback()
         raise typer.Exit(1) from e
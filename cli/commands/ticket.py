@@ -1,29 +1,41 @@
 """Ticket management commands."""
 
-import json
+from __future__ import annotations
+
+import functools
 import logging
+from typing import TYPE_CHECKING
 
 import typer
-from rich.console import Console
 
 from cli.config_manager import ConfigManager
 from cli.output_formatter import (
+    console,
     print_error,
     print_info,
     print_success,
+    print_traceback,
 )
+from shared.utils.serialization import dumps
+
+if TYPE_CHECKING:
+    from cli.auth import CognitoAuthClient
 
-console = Console()
 app = typer.Typer(help="Ticket management commands")
 
 
+@functools.lru_cache(maxsize=1)
+def _get_auth_client() -> CognitoAuthClient:
+    """Get the Cognito auth client, created once per process."""
+    from cli.auth import get_auth_client
+
+    return get_auth_client()
+
+
 def _require_auth() -> None:
     """Require authentication before proceeding."""
     try:
-        from cli.auth import get_auth_client
-
-        auth_client = get_auth_client()
-        if not auth_client.is_authenticated():
+        if not _get_auth_client().is_authenticated():
             print_error("Authentication required")
             print_info("Run 'geni login' to authenticate first")
             raise typer.Exit(1)
@@ -45,10 +57,7 @@ def _get_auth_token() -> str | None:
         The ID token if authenticated, None otherwise
     """
     try:
-        from cli.auth import get_auth_client
-
-        auth_client = get_auth_client()
-        tokens = auth_client.get_current_tokens()
+        tokens = _get_auth_client().get_current_tokens()
         if tokens:
             return tokens.id_token
     except Exception:
@@ -56,6 +65,24 @@ def _get_auth_token() -> str | None:
     return None
 
 
+@functools.lru_cache(maxsize=2)
+def _setup_logging(verbose: bool) -> None:
+    """Configure logging for ticket commands, once per verbosity level.
+
+    Args:
+        verbose: Enable debug logging
+    """
+    if verbose:
+        logging.basicConfig(
+            level=logging.DEBUG,
+            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        )
+    else:
+        logging.basicConfig(level=logging.WARNING)
+        logging.getLogger("agent").setLevel(logging.WARNING)
+        logging.getLogger("urllib3").setLevel(logging.WARNING)
+
+
 @app.command("create")
 def create_ticket(
     issue_json: str = typer.Argument(..., help="IssueCard JSON string"),
@@ -83,15 +110,7 @@ def create_ticket(
     _require_auth()
 
     # Set up logging
-    if verbose:
-        logging.basicConfig(
-            level=logging.DEBUG,
-            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        )
-    else:
-        logging.basicConfig(level=logging.WARNING)
-        logging.getLogger("agent").setLevel(logging.WARNING)
-        logging.getLogger("urllib3").setLevel(logging.WARNING)
+    _setup_logging(verbose)
 
     try:
         # Load configuration
@@ -105,24 +124,23 @@ def create_ticket(
             print_info("Supported providers: jira, notion")
             raise typer.Exit(1)
 
-        # Parse and validate JSON
-        try:
-            issue_data = json.loads(issue_json)
-        except json.JSONDecodeError as e:
-            print_error(f"Invalid JSON: {e}")
-            raise typer.Exit(1) from None
+        # Parse and validate against IssueCard schema in a single pass
+        from pydantic import ValidationError
 
-        # Validate against IssueCard schema
         from shared.models.issue_card import IssueCard
 
         try:
-            issue_card = IssueCard(**issue_data)
+            issue_card = IssueCard.model_validate_json(issue_json)
             if verbose:
                 print_success("IssueCard validation passed")
                 console.print(f"  [dim]Title:[/dim] {issue_card.title}")
                 console.print(f"  [dim]Priority:[/dim] {issue_card.priority}")
                 console.print(f"  [dim]Category:[/dim] {issue_card.category}")
-        except Exception as e:
+        except ValidationError as e:
+            errors = e.errors()
+            if errors and errors[0]["type"] == "json_invalid":
+                print_error(f"Invalid JSON: {errors[0]['msg']}")
+                raise typer.Exit(1) from None
             print_error(f"IssueCard validation failed: {e}")
             print_info("Ensure all required fields are present: title, priority, category, "
                       "status, details, description, recommendation, sources")
@@ -158,12 +176,12 @@ def create_ticket(
         # Create ticket
         print_info(f"Creating {ticket_provider.upper()} ticket...")
 
-        # Convert IssueCard to dict for API
-        issue_dict = issue_card.model_dump(mode="json", exclude_none=True)
+        # Encode IssueCard once; the client splices the bytes into the request body
+        issue_body = issue_card.model_dump_json(exclude_none=True).encode()
 
         response = integration.create_ticket(
             provider=ticket_provider,
-            issue_data=issue_dict,
+            raw_issue_json=issue_body,
         )
 
         # Extract response details
@@ -178,7 +196,7 @@ def create_ticket(
         if verbose:
             console.print()
             console.print("[dim]Response:[/dim]")
-            console.print(json.dumps(response, indent=2))
+            console.print(dumps(response, indent=True).decode())
 
     except typer.Exit:
         raise
@@ -189,5 +207,5 @@ def create_ticket(
     except Exception as e:
         print_error(f"Failed to create ticket: {e}")
         if verbose:
-            console.print_exception()
+            print_traceback()
         raise typer.Exit(1) from None
@@ -8,8 +8,122 @@ import yaml
 
 from shared.models.config import AppConfig
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 DEFAULT_CONFIG_PATH = Path.home() / ".geniable.yaml"
 
+# Environment variable -> top-level config key
+_TOP_LEVEL_ENV_OVERRIDES: tuple[tuple[str, str], ...] = (
+    ("TRACE_SOURCE", "trace_source"),
+    ("ISSUE_PROVIDER", "provider"),
+)
+
+# Config section -> (environment variable, key) pairs
+_SECTION_ENV_OVERRIDES: dict[str, tuple[tuple[str, str], ...]] = {
+    "langsmith": (
+        ("LANGSMITH_API_KEY", "api_key"),
+        ("LANGSMITH_PROJECT", "project"),
+        ("LANGSMITH_QUEUE", "queue"),
+    ),
+    "langfuse": (
+        ("LANGFUSE_PUBLIC_KEY", "public_key"),
+        ("LANGFUSE_SECRET_KEY", "secret_key"),
+        ("LANGFUSE_HOST", "host"),
+        ("LANGFUSE_DATASET", "dataset"),
+    ),
+    "aws": (
+        ("AWS_REGION", "region"),
+        ("INTEGRATION_ENDPOINT", "integration_endpoint"),
+        ("EVALUATION_ENDPOINT", "evaluation_endpoint"),
+    ),
+    "jira": (
+        ("JIRA_BASE_URL", "base_url"),
+        ("JIRA_EMAIL", "email"),
+        ("JIRA_API_TOKEN", "api_token"),
+        ("JIRA_PROJECT_KEY", "project_key"),
+    ),
+    "notion": (
+        ("NOTION_API_KEY", "api_key"),
+        ("NOTION_DATABASE_ID", "database_id"),
+    ),
+}
+
+_ENV_OVERRIDE_NAMES: tuple[str, ...] = tuple(name for name, _ in _TOP_LEVEL_ENV_OVERRIDES) + tuple(
+    name for overrides in _SECTION_ENV_OVERRIDES.values() for name, _ in overrides
+)
+
+# Configs already validated in this process, keyed by
+# (path, mtime_ns, override env values)
+_VALIDATED_CONFIGS: dict[tuple[str, int, tuple[str | None, ...]], AppConfig] = {}
+
+
+def _env_override_values() -> tuple[str | None, ...]:
+    """Snapshot the environment variables that can override config values."""
+    env = os.environ
+    return tuple(env.get(name) for name in _ENV_OVERRIDE_NAMES)
+
+
+# Section templates used by ConfigManager._generate_yaml_content
+_YAML_HEADER = """\
+# Geniable Configuration
+# Created by: geni init
+
+trace_source: "{trace_source}"
+
+"""
+_YAML_LANGSMITH = """\
+langsmith:
+  api_key: "{api_key}"
+  project: "{project}"
+  queue: "{queue}"
+
+"""
+_YAML_LANGFUSE = """\
+langfuse:
+  public_key: "{public_key}"
+  secret_key: "{secret_key}"
+  host: "{host}"
+  dataset: "{dataset}"
+
+"""
+_LANGFUSE_DEFAULTS = {"host": "https://cloud.langfuse.com", "dataset": ""}
+_YAML_AWS = """\
+aws:
+  region: "{region}"
+  integration_endpoint: "{integration_endpoint}"
+  evaluation_endpoint: "{evaluation_endpoint}"
+  api_key: "{api_key}"
+
+"""
+_YAML_PROVIDER = """\
+provider: "{provider}"
+
+"""
+_YAML_JIRA = """\
+jira:
+  base_url: "{base_url}"
+  email: "{email}"
+  api_token: "{api_token}"
+  project_key: "{project_key}"
+"""
+_YAML_JIRA_ISSUE_TYPE = """\
+  issue_type: "{issue_type}"
+"""
+_YAML_NOTION = """\
+notion:
+  api_key: "{api_key}"
+  database_id: "{database_id}"
+
+"""
+_YAML_DEFAULTS = """\
+defaults:
+  report_dir: "{report_dir}"
+  log_level: "{log_level}"
+"""
+
 
 class ConfigManager:
     """Manages application configuration from file and environment."""
@@ -22,11 +136,31 @@ class ConfigManager:
         """
         self.config_path = config_path or DEFAULT_CONFIG_PATH
         self._config: AppConfig | None = None
+        self._loaded_mtime_ns: int | None = None
+        self._stat: os.stat_result | None = None
+
+    def exists(self) -> bool:
+        """Check whether the config file exists.
+
+        The stat result is kept for the next load() so an existence check
+        followed by a load costs a single stat call.
+
+        Returns:
+            True if the config file exists
+        """
+        try:
+            self._stat = self.config_path.stat()
+        except FileNotFoundError:
+            self._stat = None
+            return False
+        return True
 
     def load(self) -> AppConfig:
         """Load configuration from file and environment.
 
-        Environment variables override file values.
+        Environment variables override file values. The validated config is
+        reused (across ConfigManager instances in this process) until the
+        file's modification time or the override variables change.
 
         Returns:
             Loaded configuration
@@ -35,98 +169,66 @@ class ConfigManager:
             FileNotFoundError: If config file doesn't exist
             ValueError: If configuration is invalid
         """
-        if not self.config_path.exists():
+        # Reuse the stat from a preceding exists() call, once
+        stat, self._stat = self._stat, None
+        try:
+            mtime_ns = (stat or self.config_path.stat()).st_mtime_ns
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Configuration file not found: {self.config_path}\n"
                 f"Run 'geni configure' to create it."
-            )
+            ) from None
+
+        if self._config is not None and self._loaded_mtime_ns == mtime_ns:
+            return self._config
+
+        cache_key = (str(self.config_path), mtime_ns, _env_override_values())
+        cached = _VALIDATED_CONFIGS.get(cache_key)
+        if cached is not None:
+            self._config = cached
+            self._loaded_mtime_ns = mtime_ns
+            return cached
 
         # Load from file
-        with open(self.config_path) as f:
-            file_config = yaml.safe_load(f)
+        file_config = yaml.load(self.config_path.read_bytes(), Loader=_SafeLoader)
 
         # Apply environment variable overrides
         config_dict = self._apply_env_overrides(file_config)
 
         # Validate and create config
-        self._config = AppConfig(**config_dict)
+        self._config = AppConfig.model_validate(config_dict)
+        self._loaded_mtime_ns = mtime_ns
+        _VALIDATED_CONFIGS[cache_key] = self._config
         return self._config
 
     def _apply_env_overrides(self, config: dict[str, Any]) -> dict[str, Any]:
         """Apply environment variable overrides to config.
 
-        Supports:
-        - LANGSMITH_API_KEY
-        - LANGSMITH_PROJECT
-        - LANGSMITH_QUEUE
-        - JIRA_API_TOKEN
-        - NOTION_API_KEY
-        - etc.
+        See _TOP_LEVEL_ENV_OVERRIDES and _SECTION_ENV_OVERRIDES for the
+        supported variables (LANGSMITH_API_KEY, JIRA_API_TOKEN, ...). The
+        langsmith and aws sections are always present; langfuse only when
+        configured or LANGFUSE_PUBLIC_KEY is set; jira/notion only for the
+        active provider.
         """
-        # LangSmith overrides
-        if "langsmith" not in config:
-            config["langsmith"] = {}
-
-        if os.environ.get("LANGSMITH_API_KEY"):
-            config["langsmith"]["api_key"] = os.environ["LANGSMITH_API_KEY"]
-        if os.environ.get("LANGSMITH_PROJECT"):
-            config["langsmith"]["project"] = os.environ["LANGSMITH_PROJECT"]
-        if os.environ.get("LANGSMITH_QUEUE"):
-            config["langsmith"]["queue"] = os.environ["LANGSMITH_QUEUE"]
-
-        # Trace source override
-        if os.environ.get("TRACE_SOURCE"):
-            config["trace_source"] = os.environ["TRACE_SOURCE"]
-
-        # Langfuse overrides
-        if os.environ.get("LANGFUSE_PUBLIC_KEY") or config.get("langfuse"):
-            if "langfuse" not in config:
-                config["langfuse"] = {}
-            if os.environ.get("LANGFUSE_PUBLIC_KEY"):
-                config["langfuse"]["public_key"] = os.environ["LANGFUSE_PUBLIC_KEY"]
-            if os.environ.get("LANGFUSE_SECRET_KEY"):
-                config["langfuse"]["secret_key"] = os.environ["LANGFUSE_SECRET_KEY"]
-            if os.environ.get("LANGFUSE_HOST"):
-                config["langfuse"]["host"] = os.environ["LANGFUSE_HOST"]
-            if os.environ.get("LANGFUSE_DATASET"):
-                config["langfuse"]["dataset"] = os.environ["LANGFUSE_DATASET"]
-
-        # AWS overrides
-        if "aws" not in config:
-            config["aws"] = {}
-
-        if os.environ.get("AWS_REGION"):
-            config["aws"]["region"] = os.environ["AWS_REGION"]
-        if os.environ.get("INTEGRATION_ENDPOINT"):
-            config["aws"]["integration_endpoint"] = os.environ["INTEGRATION_ENDPOINT"]
-        if os.environ.get("EVALUATION_ENDPOINT"):
-            config["aws"]["evaluation_endpoint"] = os.environ["EVALUATION_ENDPOINT"]
-
-        # Provider overrides
-        if os.environ.get("ISSUE_PROVIDER"):
-            config["provider"] = os.environ["ISSUE_PROVIDER"]
-
-        # Jira overrides
-        if config.get("provider") == "jira":
-            if "jira" not in config:
-                config["jira"] = {}
-            if os.environ.get("JIRA_BASE_URL"):
-                config["jira"]["base_url"] = os.environ["JIRA_BASE_URL"]
-            if os.environ.get("JIRA_EMAIL"):
-                config["jira"]["email"] = os.environ["JIRA_EMAIL"]
-            if os.environ.get("JIRA_API_TOKEN"):
-                config["jira"]["api_token"] = os.environ["JIRA_API_TOKEN"]
-            if os.environ.get("JIRA_PROJECT_KEY"):
-                config["jira"]["project_key"] = os.environ["JIRA_PROJECT_KEY"]
-
-        # Notion overrides
-        if config.get("provider") == "notion":
-            if "notion" not in config:
-                config["notion"] = {}
-            if os.environ.get("NOTION_API_KEY"):
-                config["notion"]["api_key"] = os.environ["NOTION_API_KEY"]
-            if os.environ.get("NOTION_DATABASE_ID"):
-                config["notion"]["database_id"] = os.environ["NOTION_DATABASE_ID"]
+        env = os.environ
+
+        for name, key in _TOP_LEVEL_ENV_OVERRIDES:
+            if value := env.get(name):
+                config[key] = value
+
+        provider = config.get("provider")
+        for section, overrides in _SECTION_ENV_OVERRIDES.items():
+            if section in ("jira", "notion") and provider != section:
+                continue
+            if section == "langfuse" and not (
+                env.get("LANGFUSE_PUBLIC_KEY") or config.get("langfuse")
+            ):
+                continue
+
+            target = config.setdefault(section, {})
+            for name, key in overrides:
+                if value := env.get(name):
+                    target[key] = value
 
         return config
 
@@ -143,11 +245,13 @@ class ConfigManager:
     def validate(self) -> bool:
         """Validate the configuration.
 
+        Reuses the already loaded config when there is one.
+
         Returns:
             True if valid
         """
         try:
-            config = self.load()
+            config = self._config or self.load()
             config.get_provider_config()
             return True
         except Exception:
@@ -238,24 +342,24 @@ defaults:
     def _transform_to_yaml_format(wizard_config: dict[str, Any]) -> dict[str, Any]:
         """Transform wizard configuration to YAML structure.
 
+        The wizard config is already in the expected shape; this only fills
+        in missing sections. The dict is updated in place (callers pass a
+        freshly built dict).
+
         Args:
             wizard_config: Configuration from wizard
 
         Returns:
-            Configuration in expected YAML format
+            The same dict, in expected YAML format
         """
-        # The wizard config should already be in the correct format
-        # Just ensure all required sections exist
-        config = wizard_config.copy()
-
-        # Ensure defaults exist
-        if "defaults" not in config:
-            config["defaults"] = {
+        wizard_config.setdefault(
+            "defaults",
+            {
                 "report_dir": "./reports",
                 "log_level": "INFO",
-            }
-
-        return config
+            },
+        )
+        return wizard_config
 
     @staticmethod
     def _generate_yaml_content(config: dict[str, Any]) -> str:
@@ -267,94 +371,72 @@ defaults:
         Returns:
             YAML string with comments
         """
-        lines = [
-            "# Geniable Configuration",
-            "# Created by: geni init",
-            "",
-        ]
-
-        # Trace source
-        trace_source = config.get("trace_source", "langsmith")
-        lines.append(f'trace_source: "{trace_source}"')
-        lines.append("")
-
-        # LangSmith section
+        parts = [_YAML_HEADER.format(trace_source=config.get("trace_source", "langsmith"))]
+
         if "langsmith" in config:
-            lines.extend(
-                [
-                    "langsmith:",
-                    f'  api_key: "{config["langsmith"]["api_key"]}"',
-                    f'  project: "{config["langsmith"]["project"]}"',
-                    f'  queue: "{config["langsmith"]["queue"]}"',
-                    "",
-                ]
-            )
-
-        # Langfuse section
+            parts.append(_YAML_LANGSMITH.format_map(config["langsmith"]))
         if "langfuse" in config:
-            lines.extend(
-                [
-                    "langfuse:",
-                    f'  public_key: "{config["langfuse"]["public_key"]}"',
-                    f'  secret_key: "{config["langfuse"]["secret_key"]}"',
-                    f'  host: "{config["langfuse"].get("host", "https://cloud.langfuse.com")}"',
-                    f'  dataset: "{config["langfuse"].get("dataset", "")}"',
-                    "",
-                ]
-            )
-
-        # AWS section
+            parts.append(_YAML_LANGFUSE.format_map({**_LANGFUSE_DEFAULTS, **config["langfuse"]}))
         if "aws" in config:
-            lines.extend(
-                [
-                    "aws:",
-                    f'  region: "{config["aws"]["region"]}"',
-                    f'  integration_endpoint: "{config["aws"]["integration_endpoint"]}"',
-                    f'  evaluation_endpoint: "{config["aws"]["evaluation_endpoint"]}"',
-                    f'  api_key: "{config["aws"].get("api_key", "")}"',
-                    "",
-                ]
-            )
-
-        # Provider
-        provider = config.get("provider", "none")
-        lines.append(f'provider: "{provider}"')
-        lines.append("")
-
-        # Jira section
+            parts.append(_YAML_AWS.format_map({"api_key": "", **config["aws"]}))
+
+        parts.append(_YAML_PROVIDER.format(provider=config.get("provider", "none")))
+
         if "jira" in config:
-            lines.extend(
-                [
-                    "jira:",
-                    f'  base_url: "{config["jira"]["base_url"]}"',
-                    f'  email: "{config["jira"]["email"]}"',
-                    f'  api_token: "{config["jira"]["api_token"]}"',
-                    f'  project_key: "{config["jira"]["project_key"]}"',
-                ]
-            )
+            parts.append(_YAML_JIRA.format_map(config["jira"]))
             if "issue_type" in config["jira"]:
-                lines.append(f'  issue_type: "{config["jira"]["issue_type"]}"')
-            lines.append("")
-
-        # Notion section
+                parts.append(_YAML_JIRA_ISSUE_TYPE.format_map(config["jira"]))
+            parts.append("\n")
         if "notion" in config:
-            lines.extend(
-                [
-                    "notion:",
-                    f'  api_key: "{config["notion"]["api_key"]}"',
-                    f'  database_id: "{config["notion"]["database_id"]}"',
-                    "",
-                ]
-            )
-
-        # Defaults section
+            parts.append(_YAML_NOTION.format_map(config["notion"]))
         if "defaults" in config:
-            lines.extend(
-                [
-                    "defaults:",
-                    f'  report_dir: "{config["defaults"]["report_dir"]}"',
-                    f'  log_level: "{config["defaults"]["log_level"]}"',
-                ]
-            )
-
-        return "\n".join(lines) + "\n"
+            parts.append(_YAML_DEFAULTS.format_map(config["defaults"]))
+
+        return "".join(parts)
+
+
+def build_service_config_dict(config: AppConfig, *, include_endpoints: bool) -> dict[str, Any]:
+    """Build the plain config dict used for service validation and secret sync.
+
+    Args:
+        config: Loaded application config
+        include_endpoints: Include the AWS endpoints and API key (for service
+            validation); otherwise include the LangSmith project and queue
+            (for per-user secret sync)
+
+    Returns:
+        Config dict with langsmith, provider and any configured provider section
+    """
+    langsmith, jira, notion = config.langsmith, config.jira, config.notion
+    config_dict: dict[str, Any] = {
+        "langsmith": {"api_key": langsmith.api_key},
+        "provider": config.provider,
+    }
+
+    if include_endpoints:
+        aws = config.aws
+        config_dict["aws"] = {
+            "integration_endpoint": aws.integration_endpoint,
+            "evaluation_endpoint": aws.evaluation_endpoint,
+            "api_key": aws.api_key,
+        }
+    else:
+        config_dict["langsmith"]["project"] = langsmith.project
+        config_dict["langsmith"]["queue"] = langsmith.queue
+
+    if jira:
+        config_dict["jira"] = {
+            "base_url": jira.base_url,
+            "email": jira.email,
+            "api_token": jira.api_token,
+            "project_key": jira.project_key,
+            "issue_type": jira.issue_type,
+        }
+
+    if notion:
+        config_dict["notion"] = {
+            "api_key": notion.api_key,
+            "database_id": notion.database_id,
+        }
+
+    return config_dict
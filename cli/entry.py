@@ -0,0 +1,159 @@
+"""Console-script entry point.
+
+Kept free of third-party imports so trivial invocations (``geni version``,
+``geni --version``, ``geni --help``) can be answered without loading Typer,
+Rich or the configuration stack, and lazily registered commands
+(``geni login``, ``geni analyze ...``) run without importing the top-level
+command module.
+"""
+
+import sys
+
+_VERSION_ARGS = (["version"], ["--version"], ["-V"])
+_HELP_ARGS = (["--help"], ["-h"])
+
+# Subcommand groups: name -> (module defining `app`, help shown in `geni --help`)
+SUBCOMMAND_GROUPS: dict[str, tuple[str, str]] = {
+    "analyze": ("cli.commands.analyze", "Thread analysis commands"),
+    "ticket": ("cli.commands.ticket", "Ticket management commands"),
+    "issues": ("cli.commands.issues", "Jira issue management"),
+    "new": ("cli.commands.scaffold", "Generate agent project scaffolds"),
+}
+
+# Top-level commands defined in cli.main, as listed by `geni --help`; kept
+# in sync with cli.main by tests/cli/test_main.py.
+_TOP_LEVEL_COMMANDS: tuple[tuple[str, str], ...] = (
+    ("init", "Initialize configuration with interactive wizard."),
+    ("inject", "Inject agent code for Claude Code visibility."),
+    ("configure", "Configure the analyzer with credentials and settings."),
+    ("run", "Run the analysis pipeline on annotated threads."),
+    ("status", "Show current processing status and statistics."),
+    ("discover", "Discover available evaluation tools from the Evaluation Service."),
+    ("stats", "Show processing statistics and history."),
+    ("clear-state", "Clear processing state (allows reprocessing all threads)."),
+    ("version", "Show version information."),
+)
+
+# Top-level commands defined outside cli.main: name -> (module defining
+# `app`, help shown in `geni --help`)
+LAZY_COMMANDS: dict[str, tuple[str, str]] = {
+    "login": ("cli.commands.auth", "Login to Geni cloud service."),
+    "logout": ("cli.commands.auth", "Logout and clear stored authentication tokens."),
+    "whoami": (
+        "cli.commands.auth",
+        "Show current authentication status and user information.",
+    ),
+    "analyze-latest": (
+        "cli.commands.aliases",
+        "Analyze latest annotated threads (alias for 'analyze latest').",
+    ),
+    "issues-list": ("cli.commands.aliases", "List open Jira issues (alias for 'issues list')."),
+    "analyze-specific": (
+        "cli.commands.aliases",
+        "Select and analyze a specific thread (alias for 'analyze specific').",
+    ),
+}
+
+_APP_HELP = (
+    "Geni - AI Agent Framework Harness for building performant, security-hardened agents "
+    "with evaluation-driven development built in."
+)
+
+
+def _help_text() -> str:
+    """Build the plain-text `geni --help` output.
+
+    Returns:
+        Help text listing options and all commands
+    """
+    commands = [
+        *_TOP_LEVEL_COMMANDS,
+        *((name, help_text) for name, (_, help_text) in LAZY_COMMANDS.items()),
+        *((name, help_text) for name, (_, help_text) in SUBCOMMAND_GROUPS.items()),
+    ]
+    width = max(len(name) for name, _ in commands)
+    lines = [
+        "Usage: geni [OPTIONS] COMMAND [ARGS]...",
+        "",
+        f"  {_APP_HELP}",
+        "",
+        "Options:",
+        "  -V, --version  Show version and exit.",
+        "  --help         Show this message and exit.",
+        "",
+        "Commands:",
+        *(f"  {name:<{width}}  {help_text}" for name, help_text in commands),
+    ]
+    return "\n".join(lines)
+
+
+def _package_version() -> str:
+    """Return the installed geniable version, or 'unknown'."""
+    from importlib.metadata import version as get_version
+
+    try:
+        return get_version("geniable")
+    except Exception:
+        return "unknown"
+
+
+def run_update_check() -> None:
+    """Warn about a newer release, unless the invoked command is exempt.
+
+    This is the work the root `geni` callback in cli.main does before any
+    command; the lazy dispatch below calls it too, so both paths agree.
+    """
+    from cli.version_check import check_for_updates, should_skip
+
+    if not should_skip():
+        check_for_updates()
+
+
+def _run_lazy_command(name: str, args: list[str]) -> None:
+    """Run a lazily registered command under a root app that registers only it.
+
+    Skips importing cli.main and building its top-level commands.
+
+    Args:
+        name: Command name (key of LAZY_COMMANDS or SUBCOMMAND_GROUPS)
+        args: Command-line arguments, starting with the command name
+    """
+    import importlib
+
+    import typer
+
+    run_update_check()
+
+    root = typer.Typer(add_completion=False)
+    if name in SUBCOMMAND_GROUPS:
+        module_name, help_text = SUBCOMMAND_GROUPS[name]
+        root.add_typer(importlib.import_module(module_name).app, name=name, help=help_text)
+    else:
+        root.add_typer(importlib.import_module(LAZY_COMMANDS[name][0]).app)
+    root(args=args)
+
+
+def main() -> None:
+    """Main entry point."""
+    args = sys.argv[1:]
+    if args in _VERSION_ARGS:
+        print(f"Geni v{_package_version()}")
+        if args == ["version"]:
+            print("QA Pipeline for LLM Applications")
+
+        from cli.version_check import check_for_updates
+
+        check_for_updates()
+        return
+
+    if args in _HELP_ARGS:
+        print(_help_text())
+        return
+
+    if args and (args[0] in LAZY_COMMANDS or args[0] in SUBCOMMAND_GROUPS):
+        _run_lazy_command(args[0], args)
+        return
+
+    from cli.main import main as cli_main
+
+    cli_main()
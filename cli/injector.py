@@ -1,6 +1,9 @@
 """Agent code injection for Claude Code visibility."""
 
+import functools
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -9,7 +12,23 @@ from rich.progress import Progress, SpinnerColumn, TextColumn
 
 console = Console()
 
+# Python caches, version control, IDE settings and test artefacts
+_IGNORED_NAMES = frozenset(
+    {
+        "__pycache__",
+        ".git",
+        ".gitignore",
+        ".idea",
+        ".vscode",
+        ".pytest_cache",
+        ".coverage",
+    }
+)
+# Compiled files and egg info
+_IGNORED_SUFFIXES = (".pyc", ".pyo", ".egg-info")
+
 
+@functools.cache
 def get_agent_source_dir() -> Path:
     """Get the source directory for agent code.
 
@@ -42,6 +61,7 @@ def get_agent_source_dir() -> Path:
     )
 
 
+@functools.cache
 def get_shared_source_dir() -> Path | None:
     """Get the source directory for shared code.
 
@@ -68,25 +88,71 @@ def _ignore_patterns(directory: str, files: list[str]) -> set[str]:
     Returns:
         Set of filenames to ignore
     """
-    ignored = set()
-    for f in files:
-        # Ignore Python cache and compiled files
-        if f == "__pycache__" or f.endswith(".pyc") or f.endswith(".pyo"):
-            ignored.add(f)
-        # Ignore version control
-        if f == ".git" or f == ".gitignore":
-            ignored.add(f)
-        # Ignore IDE settings
-        if f == ".idea" or f == ".vscode":
-            ignored.add(f)
-        # Ignore pytest cache
-        if f == ".pytest_cache" or f == ".coverage":
-            ignored.add(f)
-        # Ignore egg info
-        if f.endswith(".egg-info"):
-            ignored.add(f)
-
-    return ignored
+    return {f for f in files if f in _IGNORED_NAMES or f.endswith(_IGNORED_SUFFIXES)}
+
+
+def _copy_file(src: str, dst: str) -> str:
+    """Copy a file with metadata, cloning it in the kernel where supported.
+
+    Uses os.copy_file_range (which can reflink on copy-on-write filesystems
+    such as btrfs and XFS) and falls back to shutil.copy2.
+
+    Args:
+        src: Source file path
+        dst: Destination file path
+
+    Returns:
+        Destination path
+    """
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            if remaining == 0:
+                shutil.copystat(src, dst)
+                return dst
+        except OSError:
+            pass
+
+    return shutil.copy2(src, dst)
+
+
+def _replace_tree(source: Path, target: Path) -> int:
+    """Copy a source tree over target, removing any existing copy first.
+
+    Args:
+        source: Directory to copy
+        target: Destination directory
+
+    Returns:
+        Number of Python files copied
+    """
+    if target.exists():
+        shutil.rmtree(target)
+
+    # Count Python files as they are copied rather than re-walking the target
+    py_files = 0
+
+    def _copy(src: str, dst: str) -> str:
+        nonlocal py_files
+        if src.endswith(".py"):
+            py_files += 1
+        return _copy_file(src, dst)
+
+    shutil.copytree(
+        source,
+        target,
+        ignore=_ignore_patterns,
+        copy_function=_copy,
+        dirs_exist_ok=False,
+    )
+
+    return py_files
 
 
 def inject_agent_code(
@@ -134,61 +200,47 @@ def inject_agent_code(
             f"Shared directory already exists: {shared_target}\n" "Use --force to overwrite."
         )
 
+    # The two trees are independent I/O-bound copies, so run them side by side
+    # unless the shared target lives inside the agent target.
+    shared_nested = shared_target is not None and shared_target.is_relative_to(agent_target)
+
     with Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
         console=console,
     ) as progress:
-        # Copy agent directory
         task = progress.add_task("Copying agent code...", total=None)
 
-        try:
-            # Remove existing if overwriting
-            if agent_target.exists():
-                shutil.rmtree(agent_target)
-
-            # Copy with ignore patterns
-            shutil.copytree(
-                agent_source,
-                agent_target,
-                ignore=_ignore_patterns,
-                dirs_exist_ok=False,
-            )
-
-            # Count copied files
-            agent_files = sum(1 for _ in agent_target.rglob("*.py"))
-            results["agent_dir"] = str(agent_target)
-            results["files_copied"] += agent_files
-
-        except Exception as e:
-            results["errors"].append(f"Agent copy failed: {e}")
-
-        progress.update(task, description="Agent code copied")
-
-        # Copy shared directory if available
-        if shared_source:
-            progress.update(task, description="Copying shared module...")
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            agent_future = executor.submit(_replace_tree, agent_source, agent_target)
+            shared_future = None
+            if shared_source and not shared_nested:
+                assert shared_target is not None
+                shared_future = executor.submit(_replace_tree, shared_source, shared_target)
 
             try:
-                assert shared_target is not None
-                if shared_target.exists():
-                    shutil.rmtree(shared_target)
+                results["files_copied"] += agent_future.result()
+                results["agent_dir"] = str(agent_target)
+            except Exception as e:
+                results["errors"].append(f"Agent copy failed: {e}")
 
-                shutil.copytree(
-                    shared_source,
-                    shared_target,
-                    ignore=_ignore_patterns,
-                    dirs_exist_ok=False,
-                )
+            progress.update(task, description="Agent code copied")
 
-                shared_files = sum(1 for _ in shared_target.rglob("*.py"))
-                results["shared_dir"] = str(shared_target)
-                results["files_copied"] += shared_files
+            # Copy shared directory if available
+            if shared_source:
+                progress.update(task, description="Copying shared module...")
 
-            except Exception as e:
-                results["errors"].append(f"Shared copy failed: {e}")
+                if shared_future is None:
+                    assert shared_target is not None
+                    shared_future = executor.submit(_replace_tree, shared_source, shared_target)
+
+                try:
+                    results["files_copied"] += shared_future.result()
+                    results["shared_dir"] = str(shared_target)
+                except Exception as e:
+                    results["errors"].append(f"Shared copy failed: {e}")
 
-            progress.update(task, description="Shared module copied")
+                progress.update(task, description="Shared module copied")
 
         progress.remove_task(task)
 
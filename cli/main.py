@@ -2,36 +2,33 @@
 
 from __future__ import annotations
 
-import json
-import logging
-from collections.abc import Callable
-from datetime import UTC, datetime
+import functools
+import importlib
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING
+
+import click
+import typer
+from typer.core import TyperGroup
+
+from cli.entry import LAZY_COMMANDS, SUBCOMMAND_GROUPS, run_update_check
 
 if TYPE_CHECKING:
-    from cli.auth import CognitoAuthClient
+    from cli.auth import AuthTokens, CognitoAuthClient
 
-import typer
 
-from cli.commands.analyze import app as analyze_app
-from cli.commands.issues import app as issues_app
-from cli.commands.scaffold import app as scaffold_app
-from cli.commands.ticket import app as ticket_app
-from cli.config_manager import DEFAULT_CONFIG_PATH, ConfigManager
-from cli.output_formatter import (
-    console,
-    create_progress,
-    print_config,
-    print_error,
-    print_header,
-    print_info,
-    print_run_summary,
-    print_success,
-    print_threads,
-    print_tools,
-    print_warning,
-)
+@functools.lru_cache(maxsize=1)
+def _get_auth_client() -> CognitoAuthClient:
+    """Get the Cognito auth client, created once per process."""
+    from cli.auth import get_auth_client
+
+    return get_auth_client()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_current_tokens() -> AuthTokens | None:
+    """Get the stored auth tokens, looked up once per process."""
+    return _get_auth_client().get_current_tokens()
 
 
 # Auth middleware - authentication is required for all commands
@@ -40,11 +37,10 @@ def require_auth() -> None:
 
     Checks if user is authenticated and exits with error if not.
     """
-    try:
-        from cli.auth import get_auth_client
+    from cli.output_formatter import print_error, print_info
 
-        auth_client = get_auth_client()
-        if not auth_client.is_authenticated():
+    try:
+        if _get_current_tokens() is None:
             print_error("Authentication required")
             print_info("Run 'geni login' to authenticate first")
             raise typer.Exit(1)
@@ -62,14 +58,13 @@ def require_auth() -> None:
 def _get_auth_token() -> str | None:
     """Get the current Cognito auth token.
 
+    Reuses the tokens looked up by require_auth().
+
     Returns:
         The ID token if authenticated, None otherwise
     """
     try:
-        from cli.auth import get_auth_client
-
-        auth_client = get_auth_client()
-        tokens = auth_client.get_current_tokens()
+        tokens = _get_current_tokens()
         if tokens:
             return tokens.id_token
     except Exception:
@@ -82,6 +77,8 @@ def _version_callback(value: bool) -> None:
     if value:
         from importlib.metadata import version as get_version
 
+        from cli.output_formatter import console
+
         try:
             pkg_version = get_version("geniable")
         except Exception:
@@ -93,8 +90,54 @@ def _version_callback(value: bool) -> None:
         raise typer.Exit()
 
 
+class _LazySubcommandGroup(TyperGroup):
+    """Root group that imports command modules only when they are invoked.
+
+    Help listings are rendered from LAZY_COMMANDS and SUBCOMMAND_GROUPS, so
+    `geni --help` and the commands defined here don't pay for the auth,
+    analyze, issues or scaffold imports.
+    """
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        names = [n for n in super().list_commands(ctx) if n not in _LAZY_NAMES]
+        return names + list(LAZY_COMMANDS) + list(SUBCOMMAND_GROUPS)
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        command = super().get_command(ctx, cmd_name)
+        if command is not None:
+            return command
+        # Placeholders carrying the help text; resolve_command loads the real ones
+        if cmd_name in LAZY_COMMANDS:
+            return click.Command(cmd_name, help=LAZY_COMMANDS[cmd_name][1])
+        if cmd_name in SUBCOMMAND_GROUPS:
+            return click.Group(cmd_name, help=SUBCOMMAND_GROUPS[cmd_name][1])
+        return None
+
+    def resolve_command(
+        self, ctx: click.Context, args: list[str]
+    ) -> tuple[str | None, click.Command | None, list[str]]:
+        if args and args[0] in _LAZY_NAMES and args[0] not in self.commands:
+            self._load_subcommand(args[0])
+        return super().resolve_command(ctx, args)
+
+    def _load_subcommand(self, cmd_name: str) -> None:
+        if cmd_name in LAZY_COMMANDS:
+            module = importlib.import_module(LAZY_COMMANDS[cmd_name][0])
+            for name, command in typer.main.get_group(module.app).commands.items():
+                self.add_command(command, name)
+            return
+
+        module_name, help_text = SUBCOMMAND_GROUPS[cmd_name]
+        group = typer.main.get_group(importlib.import_module(module_name).app)
+        group.help = help_text
+        self.add_command(group, cmd_name)
+
+
+_LAZY_NAMES = LAZY_COMMANDS.keys() | SUBCOMMAND_GROUPS.keys()
+
 app = typer.Typer(
     name="geni",
+    cls=_LazySubcommandGroup,
     help="Geni - AI Agent Framework Harness for building performant, security-hardened agents with evaluation-driven development built in.",
     add_completion=False,
 )
@@ -113,19 +156,15 @@ def app_callback(
     ),
 ) -> None:
     """Geni - AI Agent Framework Harness for building performant, security-hardened agents with evaluation-driven development built in."""
-    from cli.version_check import check_for_updates, should_skip
+    from cli.output_formatter import console
 
-    if not should_skip():
-        check_for_updates()
+    run_update_check()
 
     if ctx.invoked_subcommand is None and not version:
         console.print(ctx.get_help())
 
-# Add subcommands
-app.add_typer(analyze_app, name="analyze", help="Thread analysis commands")
-app.add_typer(ticket_app, name="ticket", help="Ticket management commands")
-app.add_typer(issues_app, name="issues", help="Jira issue management")
-app.add_typer(scaffold_app, name="new", help="Generate agent project scaffolds")
+# Auth commands, top-level aliases and subcommand groups (analyze, ticket,
+# issues, new) are registered lazily by _LazySubcommandGroup.
 
 
 @app.command()
@@ -147,11 +186,12 @@ def init(
     Note: Authentication with AWS Cognito is required before running init.
     Run 'geni login' first if not already authenticated.
     """
+    from cli.config_manager import DEFAULT_CONFIG_PATH, ConfigManager
+    from cli.output_formatter import console, print_error, print_info, print_success, print_warning
+
     # Require authentication first
     require_auth()
 
-    from cli.wizard import ConfigWizard
-
     # Check for existing config
     if DEFAULT_CONFIG_PATH.exists() and not force:
         print_warning(f"Configuration already exists: {DEFAULT_CONFIG_PATH}")
@@ -159,20 +199,22 @@ def init(
             print_info("Use 'geni configure --show' to view current config")
             raise typer.Abort()
 
+    from cli.wizard import ConfigWizard
+
     try:
         # Run wizard (includes mandatory Secrets Manager sync)
-        wizard = ConfigWizard()
-        config = wizard.run(skip_validation=skip_validation)
+        wizard = ConfigWizard(tokens=_get_current_tokens())
+        config = wizard.run(skip_validation=skip_validation, force_sync=force)
 
         # Save configuration
         path = ConfigManager.save_config(config)
         print_success(f"\nConfiguration saved to: {path}")
 
-        # Validate saved config by reloading it
+        # Validate saved config by reloading it; this is the check that the
+        # generated YAML parses, so it reads the file rather than the dict
         print_info("Verifying saved configuration...")
         try:
-            config_manager = ConfigManager()
-            config_manager.load()
+            ConfigManager(config_path=path).load()
             print_success("Configuration validated successfully")
         except Exception as e:
             print_error(f"Configuration validation failed: {e}")
@@ -188,7 +230,7 @@ def init(
         # Initialize empty processing state
         state_file = report_dir / "processing_state.json"
         if not state_file.exists():
-            import json
+            from shared.utils.serialization import dumps
 
             trace_source = config.get("trace_source", "langsmith")
             if trace_source == "langfuse":
@@ -200,7 +242,7 @@ def init(
                 "processed_threads": {},
                 "last_poll": None,
             }
-            state_file.write_text(json.dumps(initial_state, indent=2))
+            state_file.write_bytes(dumps(initial_state, indent=True))
             print_info(f"Processing state initialized: {state_file}")
 
         # Install agents and skills into .claude/ directory
@@ -255,6 +297,8 @@ def inject(
     Copies the agent module to a local directory so Claude Code
     can read and understand the evaluation pipeline.
     """
+    from cli.output_formatter import console, print_error, print_info, print_success
+
     # Require authentication
     require_auth()
 
@@ -317,16 +361,27 @@ def configure(
     ),
 ) -> None:
     """Configure the analyzer with credentials and settings."""
+    from cli.config_manager import DEFAULT_CONFIG_PATH, ConfigManager, build_service_config_dict
+    from cli.output_formatter import (
+        console,
+        print_config,
+        print_error,
+        print_info,
+        print_success,
+        print_warning,
+    )
+    from cli.skills import ensure_skills_installed
+
     # Require authentication
     require_auth()
 
     # Auto-update skills/agents if package has newer versions
-    _ensure_skills_installed()
+    ensure_skills_installed()
 
     config_manager = ConfigManager()
 
     if reset:
-        if DEFAULT_CONFIG_PATH.exists() and not typer.confirm(
+        if config_manager.exists() and not typer.confirm(
             "This will overwrite existing config. Continue?"
         ):
             raise typer.Abort()
@@ -336,7 +391,7 @@ def configure(
         print_info("Edit the file to add your credentials.")
         return
 
-    if not DEFAULT_CONFIG_PATH.exists():
+    if not config_manager.exists():
         print_warning("No configuration file found.")
         if typer.confirm("Create configuration template?"):
             path = ConfigManager.create_template()
@@ -356,10 +411,10 @@ def configure(
     if list_secrets:
         print_info("Listing secrets in AWS Secrets Manager...")
         try:
-            from cli.secrets_manager import SecretsManagerClient
+            from cli.secrets_manager import get_secrets_client
 
             config = config_manager.load()
-            client = SecretsManagerClient(region=config.aws.region)
+            client = get_secrets_client(config.aws.region)
 
             if not client.validate_connection():
                 print_error("Cannot connect to AWS Secrets Manager")
@@ -391,10 +446,10 @@ def configure(
     if sync_secrets:
         print_info("Syncing credentials to cloud backend...")
         try:
-            from cli.secrets_manager import SecretsManagerClient, format_sync_results
+            from cli.secrets_manager import format_sync_results, get_secrets_client
 
             config = config_manager.load()
-            client = SecretsManagerClient(region=config.aws.region)
+            client = get_secrets_client(config.aws.region)
 
             if not client.validate_connection():
                 print_error("Cannot connect to AWS Secrets Manager")
@@ -407,38 +462,13 @@ def configure(
                 print_error("Not authenticated — run 'geni login' first")
                 raise typer.Exit(1)
 
-            import base64
+            from cli.auth import decode_jwt_payload
 
-            payload = auth_token.split(".")[1]
-            payload += "=" * (4 - len(payload) % 4)
-            claims = json.loads(base64.b64decode(payload))
+            claims = decode_jwt_payload(auth_token)
             user_id = claims["sub"]
             email = claims.get("email", "")
 
-            # Build full config dict for per-user sync
-            config_dict: dict[str, Any] = {
-                "langsmith": {
-                    "api_key": config.langsmith.api_key,
-                    "project": config.langsmith.project,
-                    "queue": config.langsmith.queue,
-                },
-                "provider": config.provider,
-            }
-
-            if config.jira:
-                config_dict["jira"] = {
-                    "base_url": config.jira.base_url,
-                    "email": config.jira.email,
-                    "api_token": config.jira.api_token,
-                    "project_key": config.jira.project_key,
-                    "issue_type": getattr(config.jira, "issue_type", "Task"),
-                }
-
-            if config.notion:
-                config_dict["notion"] = {
-                    "api_key": config.notion.api_key,
-                    "database_id": config.notion.database_id,
-                }
+            config_dict = build_service_config_dict(config, include_endpoints=False)
 
             # Sync to per-user paths (Secrets Manager + DynamoDB)
             results = client.sync_user_config(
@@ -489,43 +519,15 @@ def configure(
             console.print("\n[cyan]Testing service connections...[/cyan]")
             from cli.service_validator import ServiceValidator
 
-            validator = ServiceValidator()
-
-            # Convert AppConfig to dict for validator
-            config_dict = {
-                "langsmith": {"api_key": config.langsmith.api_key},
-                "aws": {
-                    "integration_endpoint": config.aws.integration_endpoint,
-                    "evaluation_endpoint": config.aws.evaluation_endpoint,
-                    "api_key": config.aws.api_key,
-                },
-                "provider": config.provider,
-            }
-
-            if config.jira:
-                config_dict["jira"] = {
-                    "base_url": config.jira.base_url,
-                    "email": config.jira.email,
-                    "api_token": config.jira.api_token,
-                    "project_key": config.jira.project_key,
-                }
-
-            if config.notion:
-                config_dict["notion"] = {
-                    "api_key": config.notion.api_key,
-                    "database_id": config.notion.database_id,
-                }
-
-            validation_results = validator.validate_all(config_dict, auth_token=_get_auth_token())
+            config_dict = build_service_config_dict(config, include_endpoints=True)
+            with ServiceValidator() as validator:
+                validation_results = validator.validate_all(
+                    config_dict,
+                    auth_token=_get_auth_token(),
+                    on_result=lambda result: console.print(validator.format_result(result)),
+                )
 
-            all_passed = True
-            for result in validation_results:
-                status = "[green]✓[/green]" if result.success else "[red]✗[/red]"
-                console.print(f"  {status} {result.service}: {result.message}")
-                if not result.success:
-                    all_passed = False
-
-            if all_passed:
+            if all(result.success for result in validation_results):
                 print_success("\nAll services validated successfully!")
             else:
                 print_warning("\nSome service connections failed")
@@ -563,10 +565,26 @@ def run(
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
 ) -> None:
     """Run the analysis pipeline on annotated threads."""
+    from cli.config_manager import ConfigManager
+    from cli.output_formatter import (
+        console,
+        create_progress,
+        print_error,
+        print_info,
+        print_run_summary,
+        print_success,
+        print_threads,
+        print_tools,
+        print_traceback,
+        print_warning,
+    )
+
     # Check auth status (optional for now)
     require_auth()
 
     # Set up logging
+    import logging
+
     log_level = logging.DEBUG if verbose else logging.INFO
     logging.basicConfig(
         level=log_level,
@@ -582,45 +600,28 @@ def run(
         # Import agent here to avoid import errors if dependencies missing
         from agent.agent import Agent, AgentConfig
 
-        # Get provider-specific config
-        jira_project_key = None
-        notion_database_id = None
-        if config.jira:
-            jira_project_key = config.jira.project_key
-        if config.notion:
-            notion_database_id = config.notion.database_id
-
         # Get auth token for API calls
         auth_token = _get_auth_token()
 
         # Build agent config
-        agent_config = AgentConfig(
-            integration_endpoint=config.aws.integration_endpoint,
-            evaluation_endpoint=config.aws.evaluation_endpoint,
-            api_key=config.aws.api_key,
-            auth_token=auth_token,
-            provider=provider or config.provider,
-            report_dir=config.defaults.report_dir,
-            project=config.langsmith.project,
-            jira_project_key=jira_project_key,
-            notion_database_id=notion_database_id,
+        agent_config = AgentConfig.from_app_config(
+            config, auth_token=auth_token, provider=provider or config.provider
         )
 
         # Create agent
         agent = Agent(agent_config)
 
-        # Discover tools
         with create_progress() as progress:
+            # Discover tools
             task = progress.add_task("Discovering evaluation tools...", total=None)
             tools = agent.discover_tools()
             progress.remove_task(task)
 
-        print_success(f"Discovered {len(tools)} evaluation tools")
-        if verbose:
-            print_tools(tools)
+            print_success(f"Discovered {len(tools)} evaluation tools")
+            if verbose:
+                print_tools(tools)
 
-        # Fetch threads
-        with create_progress() as progress:
+            # Fetch threads
             task = progress.add_task("Fetching annotated threads...", total=None)
             threads = agent.fetch_threads(limit=limit)
             progress.remove_task(task)
@@ -662,7 +663,7 @@ def run(
     except Exception as e:
         print_error(f"Analysis failed: {e}")
         if verbose:
-            console.print_exception()
+            print_traceback()
         raise typer.Exit(1) from e
 
 
@@ -671,6 +672,15 @@ def status(
     verbose: bool = typer.Option(False, "--verbose", "-v", help="Show detailed status"),
 ) -> None:
     """Show current processing status and statistics."""
+    from cli.config_manager import ConfigManager
+    from cli.output_formatter import (
+        create_progress,
+        print_error,
+        print_header,
+        print_info,
+        print_success,
+    )
+
     # Check auth status (optional for now)
     require_auth()
 
@@ -686,34 +696,40 @@ def status(
         print_info(f"Queue: {config.langsmith.queue}")
 
         # Test connections
+        from concurrent.futures import ThreadPoolExecutor
+
         from agent.api_clients.evaluation_client import EvaluationServiceClient
         from agent.api_clients.integration_client import IntegrationServiceClient
 
         # Get auth token for API calls
         auth_token = _get_auth_token()
 
+        integration = IntegrationServiceClient(
+            endpoint=config.aws.integration_endpoint,
+            api_key=config.aws.api_key,
+            auth_token=auth_token,
+        )
+        evaluation = EvaluationServiceClient(
+            endpoint=config.aws.evaluation_endpoint,
+            api_key=config.aws.api_key,
+            auth_token=auth_token,
+        )
+
         with create_progress() as progress:
             task = progress.add_task("Testing connections...", total=None)
 
-            # Test integration service
-            integration = IntegrationServiceClient(
-                endpoint=config.aws.integration_endpoint,
-                api_key=config.aws.api_key,
-                auth_token=auth_token,
-            )
-            if integration.validate_connection():
+            # Both checks are independent round trips; run them side by side
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                integration_future = executor.submit(integration.validate_connection)
+                tools_future = executor.submit(evaluation.discover_tools)
+
+            if integration_future.result():
                 print_success("Integration Service: Connected")
             else:
                 print_error("Integration Service: Connection failed")
 
-            # Test evaluation service
-            evaluation = EvaluationServiceClient(
-                endpoint=config.aws.evaluation_endpoint,
-                api_key=config.aws.api_key,
-                auth_token=auth_token,
-            )
             try:
-                tools = evaluation.discover_tools()
+                tools = tools_future.result()
                 print_success(f"Evaluation Service: Connected ({len(tools)} tools)")
             except Exception as e:
                 print_error(f"Evaluation Service: {e}")
@@ -732,6 +748,9 @@ def status(
 @app.command()
 def discover() -> None:
     """Discover available evaluation tools from the Evaluation Service."""
+    from cli.config_manager import ConfigManager
+    from cli.output_formatter import console, print_error, print_header, print_info, print_success
+
     # Check auth status (optional for now)
     require_auth()
 
@@ -770,6 +789,9 @@ def discover() -> None:
 @app.command()
 def stats() -> None:
     """Show processing statistics and history."""
+    from cli.config_manager import ConfigManager
+    from cli.output_formatter import console, print_error, print_header
+
     # Check auth status (optional for now)
     require_auth()
 
@@ -821,6 +843,9 @@ def clear_state(
     confirm: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation"),
 ) -> None:
     """Clear processing state (allows reprocessing all threads)."""
+    from cli.config_manager import ConfigManager
+    from cli.output_formatter import print_error, print_success
+
     # Check auth status (optional for now)
     require_auth()
 
@@ -855,6 +880,8 @@ def version() -> None:
     """Show version information."""
     from importlib.metadata import version as get_version
 
+    from cli.output_formatter import console
+
     try:
         pkg_version = get_version("geniable")
     except Exception:
@@ -864,413 +891,6 @@ def version() -> None:
     console.print("QA Pipeline for LLM Applications")
 
 
-# =====================================================================
-# Authentication Commands
-# =====================================================================
-
-
-def _handle_password_reset(
-    auth_client: CognitoAuthClient, email: str, getpass: Callable[[str], str]
-) -> None:
-    """Handle password reset via the standard ForgotPassword flow.
-
-    Initiates a fresh ForgotPassword request (sends a new verification code),
-    then completes the reset with ConfirmForgotPassword. This is more reliable
-    than using the admin-provided code directly, which can fail to transition
-    the user out of RESET_REQUIRED status.
-
-    Args:
-        auth_client: CognitoAuthClient instance
-        email: User's email address
-        getpass: getpass function for secure password input
-    """
-    from cli.auth import AuthenticationError
-
-    # Step 1: Initiate ForgotPassword to send a fresh verification code
-    print_info("Sending a fresh verification code to your email...")
-    try:
-        delivery = auth_client.initiate_forgot_password(username=email)
-        destination = delivery.get("Destination", "your email")
-        console.print(f"\n[cyan]We just sent a verification code to {destination}.[/cyan]")
-        console.print("[cyan]Please check your email and enter the code below.[/cyan]")
-    except AuthenticationError as e:
-        print_error(f"Could not initiate password reset: {e}")
-        raise typer.Exit(1) from e
-
-    console.print("[dim]Password requirements: min 12 chars, uppercase, lowercase, numbers[/dim]\n")
-
-    # Step 2: Prompt for the fresh verification code
-    verification_code = typer.prompt("Verification code from email")
-    if not verification_code or not verification_code.strip():
-        print_error("Verification code is required")
-        raise typer.Exit(1)
-    verification_code = verification_code.strip()
-
-    # Step 3: Prompt for new password with confirmation
-    while True:
-        new_password = getpass("New password: ")
-        if not new_password:
-            print_error("Password is required")
-            continue
-
-        if len(new_password) < 12:
-            print_error("Password must be at least 12 characters")
-            continue
-
-        confirm_password = getpass("Confirm new password: ")
-        if new_password != confirm_password:
-            print_error("Passwords do not match")
-            continue
-
-        break
-
-    # Step 4: Confirm the reset with the fresh code
-    try:
-        print_info("Resetting password...")
-        auth_client.confirm_password_reset(
-            username=email,
-            confirmation_code=verification_code,
-            new_password=new_password,
-        )
-    except AuthenticationError as reset_error:
-        print_error(f"Password reset failed: {reset_error}")
-        raise typer.Exit(1) from reset_error
-
-    print_success("Password has been reset successfully!")
-    console.print("\n[bold cyan]Next Steps:[/bold cyan]")
-    console.print("  1. Run [bold]geni login[/bold] to sign in with your new password")
-    console.print("  2. Run [bold]geni init[/bold] to configure your settings")
-
-
-def _ensure_skills_installed() -> None:
-    """Ensure Geniable agents and skills are installed (non-force).
-
-    Called after successful login to make sure the Issue Resolver
-    and other agents/skills are available. Does not overwrite existing files.
-    """
-    try:
-        from cli.agents import install_agents
-        from cli.skills import install_skills
-
-        project_root = Path.cwd()
-
-        # Only install if the target directory's parent (.claude) exists
-        # This indicates the project has been initialized
-        if (project_root / ".claude").exists():
-            install_agents(
-                target_dir=project_root / ".claude" / "agents",
-                force=False,
-                project_root=project_root,
-            )
-            install_skills(
-                target_dir=project_root / ".claude" / "commands",
-                force=False,
-                project_root=project_root,
-            )
-    except Exception:
-        # Non-critical — don't fail login over agent/skill installation
-        pass
-
-
-@app.command()
-def login(
-    email: str | None = typer.Option(None, "--email", "-e", help="Email address"),
-    no_keyring: bool = typer.Option(
-        False, "--no-keyring", help="Use file storage instead of system keyring"
-    ),
-    reset: bool = typer.Option(
-        False, "--reset", help="Reset password using a verification code from email"
-    ),
-    debug: bool = typer.Option(False, "--debug", help="Show verbose auth diagnostics"),
-) -> None:
-    """Login to Geni cloud service.
-
-    Authenticates with AWS Cognito and stores tokens securely in the
-    system keyring (macOS Keychain, Windows Credential Store) or
-    encrypted file if --no-keyring is specified.
-
-    If an administrator has reset your password, use --reset or answer
-    'y' when prompted to enter your verification code and set a new password.
-    """
-    from getpass import getpass
-
-    try:
-        from cli.auth import (
-            AuthenticationError,
-            PasswordChangeRequired,
-            PasswordResetRequired,
-            get_auth_client,
-        )
-    except ImportError as e:
-        print_error(f"Authentication module not available: {e}")
-        print_info("Ensure all dependencies are installed: pip install -e '.[dev]'")
-        raise typer.Exit(1) from e
-
-    # Get email if not provided
-    if not email:
-        email = typer.prompt("Email")
-
-    # Get auth client
-    auth_client = get_auth_client(use_keyring=not no_keyring)
-
-    # Enable debug logging if requested
-    if debug:
-        import logging
-
-        logging.basicConfig(level=logging.DEBUG, format="%(name)s %(message)s")
-        console.print("[dim]Debug mode enabled[/dim]")
-
-    # If --reset flag, go directly to password reset flow
-    if reset:
-        _handle_password_reset(auth_client, email, getpass)
-        return
-
-    # Normal login flow
-    password = getpass("Password: ")
-
-    if not password:
-        print_error("Password is required")
-        raise typer.Exit(1)
-
-    try:
-        # Attempt login
-        print_info("Authenticating...")
-        tokens = auth_client.login(email, password)
-
-        print_success(f"Successfully logged in as {email}")
-
-        # Auto-install agents if project is initialized
-        _ensure_skills_installed()
-
-        # Show token expiry
-        if tokens.expires_at:
-            expiry_str = tokens.expires_at.strftime("%Y-%m-%d %H:%M:%S %Z")
-            print_info(f"Session expires: {expiry_str}")
-
-        # Show next steps
-        console.print("\n[bold cyan]Next Steps:[/bold cyan]")
-        console.print("  1. Run 'geni init' to configure your settings")
-        console.print("  2. Your credentials will be stored securely in AWS")
-
-    except PasswordChangeRequired as e:
-        # Handle first-time login with temporary password
-        print_warning("Password change required for new account.")
-        console.print("\n[cyan]Please set a new permanent password.[/cyan]")
-        console.print("[dim]Requirements: min 12 chars, uppercase, lowercase, numbers[/dim]\n")
-
-        # Prompt for new password with confirmation
-        while True:
-            new_password = getpass("New password: ")
-            if not new_password:
-                print_error("Password is required")
-                continue
-
-            if len(new_password) < 12:
-                print_error("Password must be at least 12 characters")
-                continue
-
-            confirm_password = getpass("Confirm new password: ")
-            if new_password != confirm_password:
-                print_error("Passwords do not match")
-                continue
-
-            break
-
-        try:
-            print_info("Setting new password...")
-            tokens = auth_client.complete_password_change(
-                session=e.session,
-                user_id=e.user_id,
-                new_password=new_password,
-                email=email,
-            )
-
-            print_success("Password changed successfully!")
-            print_success(f"Logged in as {email}")
-
-            # Auto-install agents if project is initialized
-            _ensure_skills_installed()
-
-            # Show next steps
-            console.print("\n[bold cyan]Next Steps:[/bold cyan]")
-            console.print("  1. Run 'geni init' to configure your settings")
-            console.print("  2. Your credentials will be stored securely in AWS")
-
-        except AuthenticationError as pw_error:
-            print_error(f"Password change failed: {pw_error}")
-            raise typer.Exit(1) from pw_error
-
-    except PasswordResetRequired:
-        # Handle admin-initiated password reset detected during SRP auth
-        _handle_password_reset(auth_client, email, getpass)
-
-    except AuthenticationError as e:
-        print_error(f"Authentication failed: {e}")
-
-        # Offer password reset if login failed — the user may be in
-        # RESET_REQUIRED state which SRP auth cannot distinguish from
-        # a wrong password.
-        if typer.confirm(
-            "\nDo you want to reset your password?",
-            default=False,
-        ):
-            _handle_password_reset(auth_client, email, getpass)
-        else:
-            raise typer.Exit(1) from e
-    except Exception as e:
-        print_error(f"Login failed: {e}")
-        raise typer.Exit(1) from e
-
-
-@app.command()
-def logout() -> None:
-    """Logout and clear stored authentication tokens.
-
-    Removes tokens from the system keyring or encrypted file storage.
-    """
-    try:
-        from cli.auth import get_auth_client
-    except ImportError as e:
-        print_error(f"Authentication module not available: {e}")
-        raise typer.Exit(1) from e
-
-    try:
-        auth_client = get_auth_client()
-
-        if not auth_client.is_authenticated():
-            print_warning("Not currently logged in")
-            return
-
-        auth_client.logout()
-        print_success("Successfully logged out")
-
-    except Exception as e:
-        print_error(f"Logout failed: {e}")
-        raise typer.Exit(1) from e
-
-
-@app.command()
-def whoami() -> None:
-    """Show current authentication status and user information.
-
-    Displays the currently logged-in user, token expiry, and
-    authentication status.
-    """
-    # Auto-update skills/agents if package has newer versions
-    _ensure_skills_installed()
-
-    try:
-        from cli.auth import get_auth_client
-    except ImportError as e:
-        print_error(f"Authentication module not available: {e}")
-        raise typer.Exit(1) from e
-
-    try:
-        auth_client = get_auth_client()
-
-        if not auth_client.is_authenticated():
-            print_warning("Not logged in")
-            print_info("Run 'geni login' to authenticate")
-            raise typer.Exit(1)
-
-        tokens = auth_client.get_current_tokens()
-
-        if not tokens:
-            print_warning("No valid session found")
-            print_info("Run 'geni login' to authenticate")
-            raise typer.Exit(1)
-
-        print_header("Authentication Status")
-
-        # Decode JWT to get user info (without verification - just for display)
-        import base64
-        import json
-
-        try:
-            # JWT format: header.payload.signature
-            payload_b64 = tokens.id_token.split(".")[1]
-            # Add padding if needed
-            padding = 4 - len(payload_b64) % 4
-            if padding != 4:
-                payload_b64 += "=" * padding
-            payload = json.loads(base64.urlsafe_b64decode(payload_b64))
-
-            email = payload.get("email", "Unknown")
-            user_id = payload.get("sub", "Unknown")
-
-            console.print(f"\n[cyan]Email:[/cyan] {email}")
-            console.print(f"[cyan]User ID:[/cyan] {user_id}")
-
-        except Exception:
-            console.print("\n[cyan]Status:[/cyan] Authenticated")
-
-        # Show token expiry
-        if tokens.expires_at:
-            now = datetime.now(UTC)
-            if tokens.expires_at > now:
-                remaining = tokens.expires_at - now
-                hours, remainder = divmod(int(remaining.total_seconds()), 3600)
-                minutes, _ = divmod(remainder, 60)
-                console.print(f"[cyan]Session expires in:[/cyan] {hours}h {minutes}m")
-                expiry_str = tokens.expires_at.strftime("%Y-%m-%d %H:%M:%S UTC")
-                console.print(f"[dim]({expiry_str})[/dim]")
-            else:
-                print_warning("Session expired - run 'geni login' to reauthenticate")
-
-        print_success("\nAuthenticated and ready")
-
-    except typer.Exit:
-        raise
-    except Exception as e:
-        print_error(f"Failed to get authentication status: {e}")
-        raise typer.Exit(1) from e
-
-
-# Top-level aliases for analyze commands (convenience)
-@app.command("analyze-latest")
-def analyze_latest_alias(
-    limit: int = typer.Option(50, "--limit", "-l", help="Maximum threads to analyze"),
-    dry_run: bool = typer.Option(False, "--dry-run", help="Analyze without creating tickets"),
-    verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
-    ci: bool = typer.Option(
-        False,
-        "--ci",
-        help="Enable LLM-powered reports using Anthropic API (for CI/CD pipelines)",
-    ),
-) -> None:
-    """Analyze latest annotated threads (alias for 'analyze latest')."""
-    from cli.commands.analyze import analyze_latest
-
-    analyze_latest(limit=limit, dry_run=dry_run, verbose=verbose, ci=ci)
-
-
-@app.command("issues-list")
-def issues_list_alias(
-    verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
-    limit: int = typer.Option(50, "--limit", "-l", help="Maximum issues to fetch"),
-) -> None:
-    """List open Jira issues (alias for 'issues list')."""
-    from cli.commands.issues import issues_list
-
-    issues_list(verbose=verbose, limit=limit)
-
-
-@app.command("analyze-specific")
-def analyze_specific_alias(
-    count: int = typer.Option(10, "--count", "-c", help="Number of recent threads to show"),
-    verbose: bool = typer.Option(False, "--verbose", "-v", help="Verbose output"),
-    ci: bool = typer.Option(
-        False,
-        "--ci",
-        help="Enable LLM-powered reports using Anthropic API (for CI/CD pipelines)",
-    ),
-) -> None:
-    """Select and analyze a specific thread (alias for 'analyze specific')."""
-    from cli.commands.analyze import analyze_specific
-
-    analyze_specific(count=count, verbose=verbose, ci=ci)
-
-
 def main() -> None:
     """Main entry point."""
     app()
@@ -1,20 +1,41 @@
-"""Output formatting for CLI commands."""
+"""Output formatting for CLI commands.
 
-from typing import Any
+Rich is imported by the helpers that render with it, and the shared
+console is created on first use, so importing this module is cheap.
+"""
 
-from rich.console import Console
-from rich.live import Live
-from rich.panel import Panel
-from rich.progress import (
-    Progress,
-    SpinnerColumn,
-    TextColumn,
-)
-from rich.spinner import Spinner
-from rich.table import Table
-from rich.text import Text
+from __future__ import annotations
 
-console = Console()
+import functools
+import re
+from itertools import islice
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.live import Live
+    from rich.progress import Progress, TaskID
+
+# Config keys whose values are masked by print_config
+_SENSITIVE_RE = re.compile(r"key|token|secret|password", re.IGNORECASE)
+
+# Rows shown by print_threads
+MAX_THREAD_ROWS = 20
+
+
+@functools.lru_cache(maxsize=1)
+def get_console() -> Console:
+    """Get the console shared by all CLI output, created on first use."""
+    from rich.console import Console
+
+    return Console()
+
+
+def __getattr__(name: str) -> Any:
+    # `from cli.output_formatter import console` creates the console lazily
+    if name == "console":
+        return get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class ThreadLoadingProgress:
@@ -24,11 +45,17 @@ class ThreadLoadingProgress:
         self._live: Live | None = None
         self._phase = "summaries"
         self._total_threads = 0
-        self._current_thread = 0
-        self._current_thread_id = ""
+        self._progress: Progress | None = None
+        self._task: TaskID | None = None
+
+    def __enter__(self) -> ThreadLoadingProgress:
+        if not get_console().is_terminal:
+            # Piped or CI output: skip the animation; start_details prints a line
+            return self
 
-    def __enter__(self) -> "ThreadLoadingProgress":
-        self._live = Live(console=console, refresh_per_second=10)
+        from rich.live import Live
+
+        self._live = Live(console=get_console(), refresh_per_second=10)
         self._live.__enter__()
         self._update_display()
         return self
@@ -41,43 +68,19 @@ class ThreadLoadingProgress:
         """Update the live display based on current phase."""
         if self._live is None:
             return
+
+        from rich.spinner import Spinner
+        from rich.text import Text
+
         if self._phase == "summaries":
             spinner = Spinner("dots", text=" Fetching thread summaries...")
             self._live.update(spinner)
-        elif self._phase == "details":
-            # Create a progress display with bar
-            progress_text = Text()
-            progress_text.append("📥 ", style="blue")
-            progress_text.append("Loading thread details: ", style="white")
-            progress_text.append(f"{self._current_thread}/{self._total_threads}", style="cyan bold")
-
-            # Add progress bar
-            bar_width = 30
-            filled = (
-                int((self._current_thread / self._total_threads) * bar_width)
-                if self._total_threads > 0
-                else 0
-            )
-            empty = bar_width - filled
-            bar = "━" * filled + "╺" + "─" * max(0, empty - 1)
-
-            progress_text.append("\n")
-            progress_text.append("    [", style="dim")
-            progress_text.append(bar[:filled], style="cyan")
-            progress_text.append(bar[filled:], style="dim")
-            progress_text.append("]", style="dim")
-
-            # Add current thread ID if available
-            if self._current_thread_id:
-                progress_text.append("\n    Thread: ", style="dim")
-                progress_text.append(self._current_thread_id[:20] + "...", style="dim italic")
-
-            self._live.update(progress_text)
+        elif self._phase == "details" and self._progress is not None:
+            # Live re-renders the progress on each refresh, so counter updates
+            # only need to touch the task
+            self._live.update(self._progress)
         elif self._phase == "complete":
-            complete_text = Text()
-            complete_text.append("✓ ", style="green")
-            complete_text.append(f"Loaded {self._total_threads} threads", style="green")
-            self._live.update(complete_text)
+            self._live.update(Text(f"✓ Loaded {self._total_threads} threads", style="green"))
 
     def start_summaries(self) -> None:
         """Start the summaries loading phase."""
@@ -86,50 +89,89 @@ class ThreadLoadingProgress:
 
     def start_details(self, total: int) -> None:
         """Start the details loading phase."""
+        from rich.progress import (
+            BarColumn,
+            MofNCompleteColumn,
+            Progress,
+            TextColumn,
+            TimeElapsedColumn,
+        )
+
         self._phase = "details"
         self._total_threads = total
-        self._current_thread = 0
+        if self._live is None:
+            print_info(f"Loading details for {total} threads...")
+            return
+
+        self._progress = Progress(
+            TextColumn("[blue]📥[/blue] Loading thread details:"),
+            MofNCompleteColumn(),
+            BarColumn(bar_width=30),
+            TimeElapsedColumn(),
+            TextColumn("[dim italic]{task.description}"),
+            console=get_console(),
+            auto_refresh=False,
+        )
+        self._task = self._progress.add_task("", total=total)
         self._update_display()
 
     def update_details(self, current: int, thread_id: str = "") -> None:
         """Update the details loading progress."""
-        self._current_thread = current
-        self._current_thread_id = thread_id
-        self._update_display()
+        if self._progress is None or self._task is None:
+            return
+        self._progress.update(
+            self._task,
+            completed=current,
+            description=f"Thread: {thread_id[:20]}..." if thread_id else "",
+        )
 
     def complete(self) -> None:
         """Mark loading as complete."""
         self._phase = "complete"
+        if self._live is None:
+            print_success(f"Loaded {self._total_threads} threads")
+            return
         self._update_display()
 
 
 def print_success(message: str) -> None:
     """Print a success message."""
-    console.print(f"[green]✓[/green] {message}")
+    get_console().print(f"[green]✓[/green] {message}")
 
 
 def print_error(message: str) -> None:
     """Print an error message."""
-    console.print(f"[red]✗[/red] {message}")
+    get_console().print(f"[red]✗[/red] {message}")
 
 
 def print_warning(message: str) -> None:
     """Print a warning message."""
-    console.print(f"[yellow]⚠[/yellow] {message}")
+    get_console().print(f"[yellow]⚠[/yellow] {message}")
+
+
+def print_info(*messages: str) -> None:
+    """Print one or more info messages, one per line, in a single render."""
+    get_console().print("\n".join(f"[blue]ℹ[/blue] {message}" for message in messages))
 
 
-def print_info(message: str) -> None:
-    """Print an info message."""
-    console.print(f"[blue]ℹ[/blue] {message}")
+def print_traceback() -> None:
+    """Print the exception currently being handled as a Rich traceback."""
+    from rich.traceback import Traceback
+
+    get_console().print(Traceback())
 
 
 def print_header(title: str) -> None:
     """Print a section header."""
-    console.print(Panel(title, style="bold blue"))
+    from rich.panel import Panel
+
+    get_console().print(Panel(title, style="bold blue"))
 
 
 def print_config(config: dict[str, Any]) -> None:
     """Print configuration summary."""
+    from rich.table import Table
+
     table = Table(title="Configuration")
     table.add_column("Setting", style="cyan")
     table.add_column("Value", style="green")
@@ -141,17 +183,18 @@ def print_config(config: dict[str, Any]) -> None:
             else:
                 # Mask sensitive values
                 display_value = str(value)
-                if any(s in key.lower() for s in ["key", "token", "secret", "password"]):
-                    if display_value and len(display_value) > 4:
-                        display_value = display_value[:4] + "..." + "*" * 4
+                if len(display_value) > 4 and _SENSITIVE_RE.search(key):
+                    display_value = f"{display_value[:4]}...****"
                 table.add_row(f"{prefix}{key}", display_value)
 
     add_dict(config)
-    console.print(table)
+    get_console().print(table)
 
 
 def print_tools(tools: list[str]) -> None:
     """Print discovered evaluation tools."""
+    from rich.table import Table
+
     table = Table(title="Available Evaluation Tools")
     table.add_column("#", style="dim")
     table.add_column("Tool Name", style="cyan")
@@ -159,11 +202,13 @@ def print_tools(tools: list[str]) -> None:
     for i, tool in enumerate(tools, 1):
         table.add_row(str(i), tool)
 
-    console.print(table)
+    get_console().print(table)
 
 
 def print_threads(threads: list[dict[str, Any]]) -> None:
     """Print thread summary."""
+    from rich.table import Table
+
     table = Table(title="Annotated Threads")
     table.add_column("Thread ID", style="dim", max_width=12)
     table.add_column("Name", max_width=40)
@@ -171,7 +216,7 @@ def print_threads(threads: list[dict[str, Any]]) -> None:
     table.add_column("Duration", justify="right")
     table.add_column("Tokens", justify="right")
 
-    for thread in threads[:20]:  # Limit display
+    for thread in islice(threads, MAX_THREAD_ROWS):
         table.add_row(
             thread.get("thread_id", "")[:12],
             thread.get("name", "")[:40],
@@ -180,15 +225,17 @@ def print_threads(threads: list[dict[str, Any]]) -> None:
             f"{thread.get('total_tokens', 0):,}",
         )
 
-    if len(threads) > 20:
-        table.add_row("...", f"({len(threads) - 20} more)", "", "", "")
+    if len(threads) > MAX_THREAD_ROWS:
+        table.add_row("...", f"({len(threads) - MAX_THREAD_ROWS} more)", "", "", "")
 
-    console.print(table)
+    get_console().print(table)
 
 
 def print_run_summary(summary: dict[str, Any]) -> None:
     """Print analysis run summary."""
-    console.print()
+    from rich.table import Table
+
+    get_console().print()
     print_header("Analysis Complete")
 
     table = Table(show_header=False, box=None)
@@ -204,14 +251,22 @@ def print_run_summary(summary: dict[str, Any]) -> None:
     if summary.get("dry_run"):
         table.add_row("Mode", "[yellow]DRY RUN[/yellow]")
 
-    console.print(table)
-    console.print()
+    get_console().print(table)
+    get_console().print()
+
+
+def create_progress(transient: bool = False) -> Progress:
+    """Create a progress indicator.
 
+    Args:
+        transient: Clear the indicator when it stops instead of leaving its last frame
+    """
+    from rich.progress import Progress, SpinnerColumn, TextColumn
 
-def create_progress() -> Progress:
-    """Create a progress indicator."""
+    # Columns keep per-task render state, so each indicator gets its own
     return Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
-        console=console,
+        console=get_console(),
+        transient=transient,
     )
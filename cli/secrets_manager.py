@@ -7,14 +7,45 @@ Syncs local configuration to:
 These per-user paths are what the Lambda backend reads at request time.
 """
 
+import functools
 import json
 import logging
+import math
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from pathlib import Path
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Local cache for secrets fetched from Secrets Manager (same dir as token storage)
+SECRET_CACHE_FILE = Path.home() / ".geniable" / "cache" / "secrets.json"
+SECRET_CACHE_TTL_SECONDS = 3600
+
+# Serializes read-modify-write of the cache file between concurrent syncs
+_SECRET_CACHE_LOCK = threading.Lock()
+
+# HTTP pool size for the shared boto3 client; sync_all runs requests in parallel
+MAX_POOL_CONNECTIONS = 10
+
+# Concurrent secret writes in sync_all
+SYNC_MAX_WORKERS = 4
+
+# Largest page ListSecrets allows, to keep round trips down
+LIST_PAGE_SIZE = 100
+
+# How long get_secret reuses a fetched value within one process; short so
+# rotated secrets are picked up
+SECRET_MEMORY_TTL_SECONDS = 60
+
+# After a failed validate_connection, how long to report the failure before
+# probing AWS again
+VALIDATION_RETRY_SECONDS = 10
+
 
 @dataclass
 class SecretSyncResult:
@@ -36,26 +67,27 @@ class SecretsManagerClient:
     # Default secret names - can be overridden via config
     DEFAULT_SECRET_PREFIX = "geniable"
 
-    SECRET_MAPPINGS = {
+    # Fields are frozensets: sync_secret only tests membership
+    SECRET_MAPPINGS: dict[str, dict[str, Any]] = {
         "langsmith": {
             "secret_suffix": "langsmith",
-            "fields": ["api_key"],
+            "fields": frozenset({"api_key"}),
         },
         "jira": {
             "secret_suffix": "jira",
-            "fields": ["api_token", "email", "base_url", "project_key"],
+            "fields": frozenset({"api_token", "email", "base_url", "project_key"}),
         },
         "notion": {
             "secret_suffix": "notion",
-            "fields": ["api_key", "database_id"],
+            "fields": frozenset({"api_key", "database_id"}),
         },
         "aws": {
             "secret_suffix": "aws-gateway",
-            "fields": ["api_key"],
+            "fields": frozenset({"api_key"}),
         },
         "anthropic": {
             "secret_suffix": "anthropic",
-            "fields": ["api_key"],
+            "fields": frozenset({"api_key"}),
         },
     }
 
@@ -76,21 +108,124 @@ class SecretsManagerClient:
         self.secret_prefix = secret_prefix or self.DEFAULT_SECRET_PREFIX
         self.kms_key_id = kms_key_id
         self._client = None
+        self._client_lock = threading.Lock()
+        self._validated = False
+        self._validation_failed_at: float | None = None
+        # Category secret names known to exist; None until first listed
+        self._existing_secrets: set[str] | None = None
+        self._existing_lock = threading.Lock()
+        # secret_name -> (monotonic expiry, value) for recent get_secret calls
+        self._secret_memo: dict[str, tuple[float, dict[str, Any]]] = {}
 
     def _get_client(self) -> Any:
-        """Get or create boto3 Secrets Manager client."""
-        if self._client is None:
-            try:
-                import boto3
-
-                self._client = boto3.client("secretsmanager", region_name=self.region)
-            except ImportError as exc:
-                raise ImportError(
-                    "boto3 is required for AWS Secrets Manager integration. "
-                    "Install with: pip install boto3"
-                ) from exc
+        """Get or create boto3 Secrets Manager client.
+
+        The client is built once per instance, even when called from several
+        threads, and shares one connection pool across all requests.
+        """
+        if self._client is not None:
+            return self._client
+
+        with self._client_lock:
+            if self._client is None:
+                try:
+                    import boto3
+                    from botocore.config import Config
+                except ImportError as exc:
+                    raise ImportError(
+                        "boto3 is required for AWS Secrets Manager integration. "
+                        "Install with: pip install boto3"
+                    ) from exc
+
+                session = boto3.session.Session()
+                self._client = session.client(
+                    "secretsmanager",
+                    region_name=self.region,
+                    config=Config(
+                        retries={"max_attempts": 3, "mode": "standard"},
+                        max_pool_connections=MAX_POOL_CONNECTIONS,
+                    ),
+                )
         return self._client
 
+    def _secret_exists(self, secret_name: str) -> bool | None:
+        """Check whether a category secret exists, listing them once per client.
+
+        Only the fixed category names (geniable/langsmith, ...) are listed;
+        other names, such as per-user secrets, are left to put-then-create.
+
+        Args:
+            secret_name: Full secret name
+
+        Returns:
+            True/False if known, None if not a category secret or the
+            secrets could not be listed
+        """
+        category_names = [self._get_secret_name(category) for category in self.SECRET_MAPPINGS]
+        if secret_name not in category_names:
+            return None
+
+        with self._existing_lock:
+            if self._existing_secrets is None:
+                try:
+                    client = self._get_client()
+                    paginator = client.get_paginator("list_secrets")
+                    self._existing_secrets = {
+                        secret["Name"]
+                        for page in paginator.paginate(
+                            Filters=[{"Key": "name", "Values": category_names}],
+                            PaginationConfig={"PageSize": LIST_PAGE_SIZE},
+                        )
+                        for secret in page.get("SecretList", [])
+                    }
+                except Exception as e:
+                    logger.debug(f"Could not list existing secrets: {e}")
+                    return None
+            return secret_name in self._existing_secrets
+
+    def _put_or_create_secret(
+        self, secret_name: str, secret_string: str, create_kwargs: dict[str, Any]
+    ) -> tuple[bool, dict[str, Any]]:
+        """Write a secret value, creating the secret if it does not exist yet.
+
+        Args:
+            secret_name: Full secret name
+            secret_string: Serialized secret value
+            create_kwargs: Extra create_secret arguments (Description, Tags, ...)
+
+        Returns:
+            Tuple of (created, AWS response)
+        """
+        client = self._get_client()
+
+        if self._secret_exists(secret_name) is not False:
+            try:
+                response = client.put_secret_value(
+                    SecretId=secret_name,
+                    SecretString=secret_string,
+                )
+                return False, response
+            except client.exceptions.ResourceNotFoundException:
+                pass
+
+        if self.kms_key_id:
+            create_kwargs = {**create_kwargs, "KmsKeyId": self.kms_key_id}
+        try:
+            response = client.create_secret(
+                Name=secret_name, SecretString=secret_string, **create_kwargs
+            )
+        except client.exceptions.ResourceExistsException:
+            # Created elsewhere since we listed
+            response = client.put_secret_value(SecretId=secret_name, SecretString=secret_string)
+            created = False
+        else:
+            created = True
+
+        with self._existing_lock:
+            if self._existing_secrets is not None:
+                self._existing_secrets.add(secret_name)
+        return created, response
+
     def _get_secret_name(self, category: str) -> str:
         """Get the full secret name for a category.
 
@@ -122,7 +257,7 @@ class SecretsManagerClient:
         """
         secret_name = self._get_secret_name(category)
         mapping = self.SECRET_MAPPINGS.get(category, {})
-        fields = mapping.get("fields", list(credentials.keys()))
+        fields = mapping.get("fields", credentials.keys())
 
         # Filter to only specified fields
         secret_value = {k: v for k, v in credentials.items() if k in fields and v}
@@ -134,41 +269,36 @@ class SecretsManagerClient:
                 message="No credentials to sync",
             )
 
+        # Skip the write (and the new secret version) if we already hold
+        # this exact value
+        memo = self._secret_memo.get(secret_name)
+        if memo is not None and memo[0] > time.monotonic() and memo[1] == secret_value:
+            return SecretSyncResult(
+                secret_name=secret_name,
+                success=True,
+                message="Secret unchanged",
+            )
+
         try:
-            client = self._get_client()
             secret_string = json.dumps(secret_value)
+            _invalidate_cached_secret(_secret_cache_key(self, category))
+            self._secret_memo.pop(secret_name, None)
 
-            # Try to update existing secret first
-            try:
-                response = client.put_secret_value(
-                    SecretId=secret_name,
-                    SecretString=secret_string,
-                )
-                return SecretSyncResult(
-                    secret_name=secret_name,
-                    success=True,
-                    message="Secret updated",
-                    version_id=response.get("VersionId"),
-                )
-
-            except client.exceptions.ResourceNotFoundException:
-                # Secret doesn't exist, create it
-                create_kwargs = {
-                    "Name": secret_name,
-                    "SecretString": secret_string,
-                    "Description": description or f"LangSmith Analyzer {category} credentials",
-                }
-
-                if self.kms_key_id:
-                    create_kwargs["KmsKeyId"] = self.kms_key_id
-
-                response = client.create_secret(**create_kwargs)
-                return SecretSyncResult(
-                    secret_name=secret_name,
-                    success=True,
-                    message="Secret created",
-                    version_id=response.get("VersionId"),
-                )
+            created, response = self._put_or_create_secret(
+                secret_name,
+                secret_string,
+                {"Description": description or f"LangSmith Analyzer {category} credentials"},
+            )
+            self._secret_memo[secret_name] = (
+                time.monotonic() + SECRET_MEMORY_TTL_SECONDS,
+                secret_value,
+            )
+            return SecretSyncResult(
+                secret_name=secret_name,
+                success=True,
+                message="Secret created" if created else "Secret updated",
+                version_id=response.get("VersionId"),
+            )
 
         except Exception as e:
             logger.error(f"Failed to sync {category} credentials: {e}")
@@ -184,35 +314,40 @@ class SecretsManagerClient:
         Args:
             config: Configuration dictionary (from wizard or loaded config)
 
+        Categories are independent, so they are synced concurrently; results
+        keep the order below.
+
         Returns:
             List of SecretSyncResult for each category
         """
-        results = []
+        tasks: list[tuple[str, dict[str, Any]]] = []
 
         # Sync LangSmith credentials
         if "langsmith" in config:
-            results.append(self.sync_secret("langsmith", config["langsmith"]))
+            tasks.append(("langsmith", config["langsmith"]))
 
         # Sync AWS Gateway API key (if set)
         if "aws" in config and config["aws"].get("api_key"):
-            results.append(self.sync_secret("aws", {"api_key": config["aws"]["api_key"]}))
+            tasks.append(("aws", {"api_key": config["aws"]["api_key"]}))
 
         # Sync provider credentials
         provider = config.get("provider", "none")
 
         if provider == "jira" and "jira" in config:
-            results.append(self.sync_secret("jira", config["jira"]))
+            tasks.append(("jira", config["jira"]))
 
         if provider == "notion" and "notion" in config:
-            results.append(self.sync_secret("notion", config["notion"]))
+            tasks.append(("notion", config["notion"]))
 
         # Sync Anthropic API key (for LLM-powered reports)
         if "anthropic" in config and config["anthropic"].get("api_key"):
-            results.append(
-                self.sync_secret("anthropic", {"api_key": config["anthropic"]["api_key"]})
-            )
+            tasks.append(("anthropic", {"api_key": config["anthropic"]["api_key"]}))
 
-        return results
+        if len(tasks) <= 1:
+            return [self.sync_secret(*task) for task in tasks]
+
+        with ThreadPoolExecutor(max_workers=SYNC_MAX_WORKERS) as executor:
+            return list(executor.map(lambda task: self.sync_secret(*task), tasks))
 
     def sync_user_config(
         self,
@@ -227,6 +362,8 @@ class SecretsManagerClient:
         - Secrets Manager: geniable/users/{user_id} with sensitive keys
         - DynamoDB: USER#{user_id}/CONFIG with non-sensitive config
 
+        The two writes are independent and run concurrently.
+
         Args:
             user_id: Cognito user ID (sub claim from JWT)
             email: User's email address
@@ -236,9 +373,6 @@ class SecretsManagerClient:
         Returns:
             List of SecretSyncResult for each sync operation
         """
-        results: list[SecretSyncResult] = []
-
-        # --- 1. Secrets Manager: geniable/users/{user_id} ---
         secret_name = f"{self.secret_prefix}/users/{user_id}"
         secrets_payload: dict[str, str] = {}
 
@@ -252,55 +386,85 @@ class SecretsManagerClient:
         if provider == "notion" and "notion" in config and config["notion"].get("api_key"):
             secrets_payload["notion_api_key"] = config["notion"]["api_key"]
 
-        if secrets_payload:
-            try:
-                client = self._get_client()
-                secret_string = json.dumps(secrets_payload)
+        if not secrets_payload:
+            return [self._sync_user_item(user_id, email, config, config_table, secret_name)]
 
-                try:
-                    response = client.put_secret_value(
-                        SecretId=secret_name,
-                        SecretString=secret_string,
-                    )
-                    results.append(SecretSyncResult(
-                        secret_name=secret_name,
-                        success=True,
-                        message="User secrets updated",
-                        version_id=response.get("VersionId"),
-                    ))
-                except client.exceptions.ResourceNotFoundException:
-                    create_kwargs: dict[str, Any] = {
-                        "Name": secret_name,
-                        "SecretString": secret_string,
-                        "Description": f"Geniable credentials for user {user_id}",
-                        "Tags": [
-                            {"Key": "Application", "Value": "geniable"},
-                            {"Key": "UserId", "Value": user_id},
-                        ],
-                    }
-                    if self.kms_key_id:
-                        create_kwargs["KmsKeyId"] = self.kms_key_id
-
-                    response = client.create_secret(**create_kwargs)
-                    results.append(SecretSyncResult(
-                        secret_name=secret_name,
-                        success=True,
-                        message="User secrets created",
-                        version_id=response.get("VersionId"),
-                    ))
-            except Exception as e:
-                logger.error(f"Failed to sync user secrets: {e}")
-                results.append(SecretSyncResult(
-                    secret_name=secret_name,
-                    success=False,
-                    message=str(e),
-                ))
-
-        # --- 2. DynamoDB: USER#{user_id}/CONFIG ---
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            secret_future = executor.submit(
+                self._sync_user_secret, user_id, secret_name, secrets_payload
+            )
+            item_future = executor.submit(
+                self._sync_user_item, user_id, email, config, config_table, secret_name
+            )
+            return [secret_future.result(), item_future.result()]
+
+    def _sync_user_secret(
+        self, user_id: str, secret_name: str, secrets_payload: dict[str, str]
+    ) -> SecretSyncResult:
+        """Write the per-user secret to Secrets Manager.
+
+        Args:
+            user_id: Cognito user ID (sub claim from JWT)
+            secret_name: Full secret name (geniable/users/{user_id})
+            secrets_payload: Sensitive keys to store
+
+        Returns:
+            SecretSyncResult for the secret write
+        """
+        try:
+            created, response = self._put_or_create_secret(
+                secret_name,
+                json.dumps(secrets_payload),
+                {
+                    "Description": f"Geniable credentials for user {user_id}",
+                    "Tags": [
+                        {"Key": "Application", "Value": "geniable"},
+                        {"Key": "UserId", "Value": user_id},
+                    ],
+                },
+            )
+            return SecretSyncResult(
+                secret_name=secret_name,
+                success=True,
+                message="User secrets created" if created else "User secrets updated",
+                version_id=response.get("VersionId"),
+            )
+        except Exception as e:
+            logger.error(f"Failed to sync user secrets: {e}")
+            return SecretSyncResult(
+                secret_name=secret_name,
+                success=False,
+                message=str(e),
+            )
+
+    def _sync_user_item(
+        self,
+        user_id: str,
+        email: str,
+        config: dict[str, Any],
+        config_table: str,
+        secret_name: str,
+    ) -> SecretSyncResult:
+        """Write the non-sensitive per-user config item to DynamoDB.
+
+        Args:
+            user_id: Cognito user ID (sub claim from JWT)
+            email: User's email address
+            config: Full config dict (langsmith, jira, notion, provider, etc.)
+            config_table: DynamoDB table name for user configs
+            secret_name: Per-user secret name referenced by the item
+
+        Returns:
+            SecretSyncResult for the DynamoDB write
+        """
+        provider = config.get("provider", "none")
         try:
             import boto3
 
-            dynamodb = boto3.resource("dynamodb", region_name=self.region)
+            # Own session: the default one is shared with the Secrets Manager
+            # write running on the other thread.
+            session = boto3.session.Session()
+            dynamodb = session.resource("dynamodb", region_name=self.region)
             table = dynamodb.Table(config_table)
 
             now = datetime.now(UTC).isoformat()
@@ -340,21 +504,19 @@ class SecretsManagerClient:
             )
 
             table.put_item(Item=item)
-            results.append(SecretSyncResult(
+            return SecretSyncResult(
                 secret_name=config_table,
                 success=True,
                 message="User config synced to DynamoDB",
-            ))
+            )
 
         except Exception as e:
             logger.error(f"Failed to sync user config to DynamoDB: {e}")
-            results.append(SecretSyncResult(
+            return SecretSyncResult(
                 secret_name=config_table,
                 success=False,
                 message=f"DynamoDB sync failed: {e}",
-            ))
-
-        return results
+            )
 
     def get_secret(self, category: str) -> dict[str, Any] | None:
         """Retrieve a secret from Secrets Manager.
@@ -367,10 +529,18 @@ class SecretsManagerClient:
         """
         secret_name = self._get_secret_name(category)
 
+        memo = self._secret_memo.get(secret_name)
+        if memo is not None and memo[0] > time.monotonic():
+            return dict(memo[1])
+
         try:
             client = self._get_client()
             response = client.get_secret_value(SecretId=secret_name)
             result: dict[str, Any] = json.loads(response["SecretString"])
+            self._secret_memo[secret_name] = (
+                time.monotonic() + SECRET_MEMORY_TTL_SECONDS,
+                dict(result),
+            )
             return result
 
         except client.exceptions.ResourceNotFoundException:
@@ -396,6 +566,7 @@ class SecretsManagerClient:
             SecretSyncResult with success status
         """
         secret_name = self._get_secret_name(category)
+        self._secret_memo.pop(secret_name, None)
 
         try:
             client = self._get_client()
@@ -429,8 +600,12 @@ class SecretsManagerClient:
                 message=str(e),
             )
 
-    def list_secrets(self) -> list[dict[str, Any]]:
-        """List all secrets with the configured prefix.
+    def list_secrets(self, limit: int | None = None) -> list[dict[str, Any]]:
+        """List secrets with the configured prefix.
+
+        Args:
+            limit: Maximum number of secrets to return; stops fetching pages
+                once reached (default: all)
 
         Returns:
             List of secret metadata dicts
@@ -439,9 +614,14 @@ class SecretsManagerClient:
             client = self._get_client()
             secrets = []
 
+            pagination_config: dict[str, int] = {"PageSize": LIST_PAGE_SIZE}
+            if limit is not None:
+                pagination_config["MaxItems"] = limit
+
             paginator = client.get_paginator("list_secrets")
             for page in paginator.paginate(
-                Filters=[{"Key": "name", "Values": [f"{self.secret_prefix}/"]}]
+                Filters=[{"Key": "name", "Values": [f"{self.secret_prefix}/"]}],
+                PaginationConfig=pagination_config,
             ):
                 for secret in page.get("SecretList", []):
                     secrets.append(
@@ -452,6 +632,8 @@ class SecretsManagerClient:
                             "created": secret.get("CreatedDate"),
                         }
                     )
+                    if limit is not None and len(secrets) >= limit:
+                        return secrets
 
             return secrets
 
@@ -462,22 +644,157 @@ class SecretsManagerClient:
     def validate_connection(self) -> bool:
         """Validate connection to AWS Secrets Manager.
 
+        Only the first successful check talks to AWS; later calls on the
+        same client return immediately. A failed check is reported again
+        without re-probing for VALIDATION_RETRY_SECONDS.
+
         Returns:
             True if connection is valid
         """
+        if self._validated:
+            return True
+        if (
+            self._validation_failed_at is not None
+            and time.monotonic() - self._validation_failed_at < VALIDATION_RETRY_SECONDS
+        ):
+            return False
+
         try:
             client = self._get_client()
             # Try to list secrets with our prefix (even if none exist)
             client.list_secrets(
                 MaxResults=1, Filters=[{"Key": "name", "Values": [f"{self.secret_prefix}/"]}]
             )
+            self._validated = True
             return True
 
         except Exception as e:
             logger.debug(f"Secrets Manager connection failed: {e}")
+            self._validation_failed_at = time.monotonic()
             return False
 
 
+@functools.lru_cache(maxsize=4)
+def get_secrets_client(region: str) -> SecretsManagerClient:
+    """Get the shared Secrets Manager client for a region.
+
+    Reusing one instance keeps the boto3 client and its validated
+    connection for the rest of the process.
+
+    Args:
+        region: AWS region for Secrets Manager
+
+    Returns:
+        SecretsManagerClient for the region
+    """
+    return SecretsManagerClient(region=region)
+
+
+def _secret_cache_key(client: SecretsManagerClient, category: str) -> str:
+    """Get the local cache key for a category as seen by a client.
+
+    Includes the region and secret prefix, so switching either never
+    serves a secret cached for the other.
+
+    Args:
+        client: Client the secret is fetched with
+        category: Secret category
+
+    Returns:
+        Cache key (e.g., us-east-1:geniable/anthropic)
+    """
+    return f"{client.region}:{client.secret_prefix}/{category}"
+
+
+def _read_secret_cache() -> dict[str, Any]:
+    """Read the local secret cache file.
+
+    Returns:
+        Cache contents keyed by _secret_cache_key, or an empty dict if unavailable
+    """
+    try:
+        data = json.loads(SECRET_CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_secret_cache(cache: dict[str, Any]) -> None:
+    """Atomically write the local secret cache file with user-only permissions."""
+    try:
+        SECRET_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = SECRET_CACHE_FILE.with_suffix(f".{os.getpid()}.tmp")
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            json.dump(cache, f)
+        os.replace(tmp_file, SECRET_CACHE_FILE)
+    except OSError as e:
+        logger.debug(f"Could not write secret cache: {e}")
+
+
+def get_cached_secret(
+    category: str,
+    ttl: int = SECRET_CACHE_TTL_SECONDS,
+    client: SecretsManagerClient | None = None,
+) -> dict[str, Any] | None:
+    """Retrieve a secret, serving it from the local cache while it is fresh.
+
+    Entries are keyed by region and secret prefix as well as category.
+    Entries older than ``ttl`` seconds are refreshed from Secrets Manager.
+    Entries without a ``cached_at`` timestamp fall back to the cache file's
+    mtime; a malformed timestamp counts as stale.
+
+    Args:
+        category: Secret category (langsmith, jira, notion, aws, anthropic)
+        ttl: Cache lifetime in seconds
+        client: Optional SecretsManagerClient to use on cache miss
+
+    Returns:
+        Dictionary of credentials or None if not found
+    """
+    client = client or SecretsManagerClient()
+    key = _secret_cache_key(client, category)
+    entry = _read_secret_cache().get(key)
+    if isinstance(entry, dict) and isinstance(entry.get("value"), dict):
+        cached_at = entry.get("cached_at")
+        if cached_at is None:
+            try:
+                cached_at = SECRET_CACHE_FILE.stat().st_mtime
+            except OSError:
+                cached_at = 0.0
+        try:
+            age = time.time() - float(cached_at)
+        except (TypeError, ValueError):
+            age = math.inf
+        if age < ttl:
+            value: dict[str, Any] = entry["value"]
+            return value
+
+    secret = client.get_secret(category)
+    if secret:
+        with _SECRET_CACHE_LOCK:
+            cache = _read_secret_cache()
+            cache[key] = {"cached_at": time.time(), "value": secret}
+            _write_secret_cache(cache)
+    return secret
+
+
+def _invalidate_cached_secret(key: str) -> None:
+    """Drop a single entry (see _secret_cache_key) from the local secret cache."""
+    with _SECRET_CACHE_LOCK:
+        cache = _read_secret_cache()
+        if cache.pop(key, None) is not None:
+            _write_secret_cache(cache)
+
+
+def clear_secret_cache() -> None:
+    """Remove the local secret cache (e.g. on logout)."""
+    try:
+        SECRET_CACHE_FILE.unlink(missing_ok=True)
+    except OSError as e:
+        logger.debug(f"Could not clear secret cache: {e}")
+
+
 def format_sync_results(results: list[SecretSyncResult]) -> str:
     """Format sync results for display.
 
@@ -1,15 +1,80 @@
-"""Service validation for testing credentials and endpoints during init."""
+"""Service validation for testing credentials and endpoints during init.
+
+requests is imported by the methods that use it, so importing this module
+(e.g. via the wizard) doesn't load the HTTP stack until a check runs.
+"""
+
+from __future__ import annotations
 
 import logging
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from typing import Any
+from functools import partial
+from typing import TYPE_CHECKING, Any
 
-import requests
+from cli.validators import validate_api_key, validate_url
+from shared.utils.serialization import loads
+
+if TYPE_CHECKING:
+    import requests
 
 logger = logging.getLogger(__name__)
 
+LANGSMITH_API_URL = "https://api.smith.langchain.com/api/v1"
+
+# Seconds to wait for a TCP connection (just over a multiple of the 3s
+# SYN retransmit interval)
+CONNECT_TIMEOUT = 3.05
+
+# Largest response body a check will decode, so a misconfigured proxy
+# answering with a huge page can't balloon memory
+MAX_RESPONSE_BYTES = 1_000_000
+
+# Deletes spaces; queue names are compared lowercased with spaces removed
+_DROP_SPACES = str.maketrans("", "", " ")
+
+# How long a successful LangSmith listing (workspaces, annotation queues)
+# is reused
+LISTING_CACHE_TTL_SECONDS = 60
+
+
+def _normalize_queue_name(name: str) -> str:
+    """Normalize a queue name for typo-tolerant comparison."""
+    return name.translate(_DROP_SPACES).lower()
+
+
+def _read_json(response: requests.Response) -> Any:
+    """Decode the JSON body of a streamed response, then release it.
+
+    Only 200 responses are read; others are closed unread, since the checks
+    report their status code alone.
+
+    Args:
+        response: Response from a request made with stream=True
 
-@dataclass
+    Returns:
+        Decoded JSON body, or None for non-200 responses
+
+    Raises:
+        ValueError: If the body is larger than MAX_RESPONSE_BYTES
+    """
+    try:
+        if response.status_code != 200:
+            return None
+        if int(response.headers.get("Content-Length") or 0) > MAX_RESPONSE_BYTES:
+            raise ValueError(f"Response larger than {MAX_RESPONSE_BYTES} bytes")
+        body = response.raw.read(MAX_RESPONSE_BYTES + 1, decode_content=True)
+    finally:
+        response.close()
+
+    if len(body) > MAX_RESPONSE_BYTES:
+        raise ValueError(f"Response larger than {MAX_RESPONSE_BYTES} bytes")
+    return loads(body)
+
+
+@dataclass(frozen=True, slots=True)
 class ValidationResult:
     """Result of a validation check."""
 
@@ -19,6 +84,52 @@ class ValidationResult:
     details: dict[str, Any] | None = None
 
 
+def _auth_headers(api_key: str | None, auth_token: str | None) -> dict[str, str]:
+    """Build the auth headers for a backend request.
+
+    Args:
+        api_key: Optional API Gateway key
+        auth_token: Optional Cognito auth token (Bearer token)
+
+    Returns:
+        Headers to send on top of the session defaults
+    """
+    headers: dict[str, str] = {}
+    if auth_token:
+        headers["Authorization"] = f"Bearer {auth_token}"
+    if api_key:
+        headers["X-Api-Key"] = api_key
+    return headers
+
+
+def _invalid_result(service: str, message: str) -> ValidationResult:
+    """Build the failed result for a value rejected before any request."""
+    return ValidationResult(service=service, success=False, message=message)
+
+
+def _error_result(service: str, error: Exception, connection_hint: str) -> ValidationResult:
+    """Map an exception raised by a check to a failed result.
+
+    Args:
+        service: Service name for the result
+        error: Exception raised while validating
+        connection_hint: What to check when the connection fails
+
+    Returns:
+        Failed validation result
+    """
+    import requests
+
+    # Timeout first: ConnectTimeout is also a ConnectionError
+    if isinstance(error, requests.exceptions.Timeout):
+        message = "Connection timeout"
+    elif isinstance(error, requests.exceptions.ConnectionError):
+        message = f"Connection failed - {connection_hint}"
+    else:
+        message = f"Validation error: {error}"
+    return ValidationResult(service=service, success=False, message=message)
+
+
 class ServiceValidator:
     """Validates service credentials and endpoints.
 
@@ -28,13 +139,122 @@ class ServiceValidator:
     # Integration Service can be slow due to LangSmith API calls
     INTEGRATION_SERVICE_TIMEOUT = 30
 
-    def __init__(self, timeout: int = 15):
+    def __init__(
+        self,
+        timeout: int = 15,
+        connect_timeout: float = CONNECT_TIMEOUT,
+        session: requests.Session | None = None,
+    ):
         """Initialize the validator.
 
         Args:
-            timeout: Request timeout in seconds (default 15s, Integration Service uses 30s)
+            timeout: Read timeout in seconds (default 15s, Integration Service uses 30s)
+            connect_timeout: Connect timeout in seconds, so unreachable hosts
+                fail fast while slow responses still get the full read timeout
+            session: Existing session to send the checks on, so connections
+                the caller already opened to the backend are reused. It is
+                left open by close(); by default the validator makes its own
         """
         self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        # (path, api_key) -> (monotonic expiry, decoded body) for successful
+        # LangSmith listings, so re-validating the same key stays off the network
+        self._listing_cache: dict[tuple[str, str], tuple[float, Any]] = {}
+
+        self._owns_session = session is None
+        self._session = session if session is not None else self._create_session()
+        # The backend checks all send JSON; only their auth headers vary
+        self._session.headers["Content-Type"] = "application/json"
+
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Create the pooled session used when the caller doesn't supply one.
+
+        One session serves all checks: the LangSmith check makes two calls
+        to the same host, and validate_all runs checks in parallel.
+        """
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            # Retry gateway errors only; connection failures and timeouts are
+            # reported straight away rather than multiplying the wait
+            max_retries=Retry(
+                total=2,
+                connect=0,
+                read=0,
+                backoff_factor=0.3,
+                status_forcelist=(502, 503, 504),
+                raise_on_status=False,
+            ),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def close(self) -> None:
+        """Close pooled connections, unless the session was supplied by the caller."""
+        if self._owns_session:
+            self._session.close()
+
+    def __enter__(self) -> ServiceValidator:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def _get_langsmith(self, path: str, api_key: str) -> requests.Response:
+        """GET a LangSmith API path with the given API key."""
+        return self._session.get(
+            f"{LANGSMITH_API_URL}/{path}",
+            headers={"x-api-key": api_key},
+            timeout=(self.connect_timeout, self.timeout),
+            stream=True,
+        )
+
+    def _get_langsmith_listing(self, path: str, api_key: str) -> tuple[int, Any]:
+        """GET a LangSmith listing, reusing a recent successful response.
+
+        Only 200 responses are cached, so a rejected key is re-checked on the
+        next call.
+
+        Args:
+            path: API path relative to the LangSmith API root
+            api_key: LangSmith API key
+
+        Returns:
+            Tuple of (status_code, decoded body); the body is None on failure
+        """
+        key = (path, api_key)
+        cached = self._listing_cache.get(key)
+        if cached is not None and cached[0] > time.monotonic():
+            return 200, cached[1]
+
+        response = self._get_langsmith(path, api_key)
+        data = _read_json(response)
+        if response.status_code != 200:
+            return response.status_code, None
+
+        self._listing_cache[key] = (time.monotonic() + LISTING_CACHE_TTL_SECONDS, data)
+        return 200, data
+
+    def _fetch_queue_names(self, api_key: str) -> list[str] | None:
+        """Get the LangSmith annotation queue names.
+
+        Args:
+            api_key: LangSmith API key
+
+        Returns:
+            Queue names, or None if the listing request failed
+        """
+        status_code, data = self._get_langsmith_listing("annotation-queues", api_key)
+        if status_code != 200:
+            return None
+        return [q.get("name", "") for q in data]
 
     def validate_langsmith(
         self, api_key: str, queue_name: str | None = None
@@ -49,58 +269,49 @@ class ServiceValidator:
             Validation result
         """
         try:
-            # First validate API key
-            response = requests.get(
-                "https://api.smith.langchain.com/api/v1/workspaces",
-                headers={"x-api-key": api_key},
-                timeout=self.timeout,
-            )
+            # Validate the API key, fetching the queue list alongside it rather
+            # than after; the queues are only inspected if the key works
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                queue_future = (
+                    executor.submit(self._fetch_queue_names, api_key) if queue_name else None
+                )
+                status_code, data = self._get_langsmith_listing("workspaces", api_key)
 
-            if response.status_code == 401:
+            if status_code == 401:
                 return ValidationResult(
                     service="LangSmith",
                     success=False,
                     message="Invalid API key",
                     details={"status_code": 401},
                 )
-            elif response.status_code != 200:
+            elif status_code != 200:
                 return ValidationResult(
                     service="LangSmith",
                     success=False,
-                    message=f"Unexpected response: {response.status_code}",
-                    details={"status_code": response.status_code},
+                    message=f"Unexpected response: {status_code}",
+                    details={"status_code": status_code},
                 )
 
-            data = response.json()
             workspace_count = len(data) if isinstance(data, list) else 1
 
             # If queue name provided, validate it exists
-            if queue_name:
-                queue_response = requests.get(
-                    "https://api.smith.langchain.com/api/v1/annotation-queues",
-                    headers={"x-api-key": api_key},
-                    timeout=self.timeout,
-                )
-
-                if queue_response.status_code == 200:
-                    queues = queue_response.json()
-                    queue_names = [q.get("name", "") for q in queues]
-                    if queue_name not in queue_names:
-                        # Provide helpful suggestion for typos
-                        suggestion = ""
-                        for q in queue_names:
-                            if q.lower().replace(" ", "") == queue_name.lower().replace(" ", ""):
-                                suggestion = f" Did you mean '{q}'?"
-                                break
-                        return ValidationResult(
-                            service="LangSmith",
-                            success=False,
-                            message=f"Annotation queue '{queue_name}' not found.{suggestion}",
-                            details={
-                                "status_code": 200,
-                                "available_queues": queue_names[:5],  # Show first 5
-                            },
-                        )
+            if queue_name and queue_future is not None:
+                queue_names = queue_future.result()
+
+                if queue_names is not None and queue_name not in queue_names:
+                    # Provide helpful suggestion for typos (first match wins)
+                    normalized = {_normalize_queue_name(q): q for q in reversed(queue_names)}
+                    match = normalized.get(_normalize_queue_name(queue_name))
+                    suggestion = f" Did you mean '{match}'?" if match else ""
+                    return ValidationResult(
+                        service="LangSmith",
+                        success=False,
+                        message=f"Annotation queue '{queue_name}' not found.{suggestion}",
+                        details={
+                            "status_code": 200,
+                            "available_queues": queue_names[:5],  # Show first 5
+                        },
+                    )
 
             return ValidationResult(
                 service="LangSmith",
@@ -109,24 +320,8 @@ class ServiceValidator:
                 details={"status_code": 200},
             )
 
-        except requests.exceptions.Timeout:
-            return ValidationResult(
-                service="LangSmith",
-                success=False,
-                message="Connection timeout",
-            )
-        except requests.exceptions.ConnectionError:
-            return ValidationResult(
-                service="LangSmith",
-                success=False,
-                message="Connection failed - check network",
-            )
         except Exception as e:
-            return ValidationResult(
-                service="LangSmith",
-                success=False,
-                message=f"Validation error: {str(e)}",
-            )
+            return _error_result("LangSmith", e, "check network")
 
     def validate_integration_endpoint(
         self, endpoint: str, api_key: str | None = None, auth_token: str | None = None
@@ -142,21 +337,18 @@ class ServiceValidator:
             Validation result
         """
         try:
-            headers = {"Content-Type": "application/json"}
-            if api_key:
-                headers["X-Api-Key"] = api_key
-            if auth_token:
-                headers["Authorization"] = f"Bearer {auth_token}"
-
             # Try to fetch threads with limit=1 as a health check
             # Use longer timeout as this endpoint calls LangSmith API
             params: dict[str, str | int] = {"limit": 1, "with_details": "false"}
-            response = requests.get(
+            response = self._session.get(
                 f"{endpoint.rstrip('/')}/threads/annotated",
                 params=params,
-                headers=headers,
-                timeout=self.INTEGRATION_SERVICE_TIMEOUT,
+                headers=_auth_headers(api_key, auth_token),
+                timeout=(self.connect_timeout, self.INTEGRATION_SERVICE_TIMEOUT),
+                stream=True,
             )
+            # Only the status matters, so the thread payload is never downloaded
+            response.close()
 
             if response.status_code == 200:
                 return ValidationResult(
@@ -180,24 +372,8 @@ class ServiceValidator:
                     details={"status_code": response.status_code},
                 )
 
-        except requests.exceptions.Timeout:
-            return ValidationResult(
-                service="Integration Service",
-                success=False,
-                message="Connection timeout",
-            )
-        except requests.exceptions.ConnectionError:
-            return ValidationResult(
-                service="Integration Service",
-                success=False,
-                message="Connection failed - check URL",
-            )
         except Exception as e:
-            return ValidationResult(
-                service="Integration Service",
-                success=False,
-                message=f"Validation error: {str(e)}",
-            )
+            return _error_result("Integration Service", e, "check URL")
 
     def validate_evaluation_endpoint(
         self, endpoint: str, api_key: str | None = None, auth_token: str | None = None
@@ -213,21 +389,16 @@ class ServiceValidator:
             Validation result
         """
         try:
-            headers = {"Content-Type": "application/json"}
-            if auth_token:
-                headers["Authorization"] = f"Bearer {auth_token}"
-            if api_key:
-                headers["X-Api-Key"] = api_key
-
             # Try to discover tools as a health check
-            response = requests.get(
+            response = self._session.get(
                 f"{endpoint.rstrip('/')}/evaluations/discovery",
-                headers=headers,
-                timeout=self.timeout,
+                headers=_auth_headers(api_key, auth_token),
+                timeout=(self.connect_timeout, self.timeout),
+                stream=True,
             )
+            data = _read_json(response)
 
             if response.status_code == 200:
-                data = response.json()
                 tools = data.get("tools", [])
                 return ValidationResult(
                     service="Evaluation Service",
@@ -250,24 +421,8 @@ class ServiceValidator:
                     details={"status_code": response.status_code},
                 )
 
-        except requests.exceptions.Timeout:
-            return ValidationResult(
-                service="Evaluation Service",
-                success=False,
-                message="Connection timeout",
-            )
-        except requests.exceptions.ConnectionError:
-            return ValidationResult(
-                service="Evaluation Service",
-                success=False,
-                message="Connection failed - check URL",
-            )
         except Exception as e:
-            return ValidationResult(
-                service="Evaluation Service",
-                success=False,
-                message=f"Validation error: {str(e)}",
-            )
+            return _error_result("Evaluation Service", e, "check URL")
 
     def validate_provider_via_lambda(
         self,
@@ -292,21 +447,16 @@ class ServiceValidator:
         """
         service_name = provider.capitalize()
         try:
-            headers: dict[str, str] = {"Content-Type": "application/json"}
-            if auth_token:
-                headers["Authorization"] = f"Bearer {auth_token}"
-            if api_key:
-                headers["X-Api-Key"] = api_key
-
-            response = requests.post(
+            response = self._session.post(
                 f"{endpoint.rstrip('/')}/integrations/provider/validate",
                 json={"provider": provider},
-                headers=headers,
-                timeout=self.INTEGRATION_SERVICE_TIMEOUT,
+                headers=_auth_headers(api_key, auth_token),
+                timeout=(self.connect_timeout, self.INTEGRATION_SERVICE_TIMEOUT),
+                stream=True,
             )
+            data = _read_json(response)
 
             if response.status_code == 200:
-                data = response.json()
                 if data.get("success"):
                     info = data.get("provider_info", {})
                     detail = info.get("project_name") or info.get("base_url") or ""
@@ -340,47 +490,44 @@ class ServiceValidator:
                     details={"status_code": response.status_code},
                 )
 
-        except requests.exceptions.Timeout:
-            return ValidationResult(
-                service=service_name,
-                success=False,
-                message="Connection timeout",
-            )
-        except requests.exceptions.ConnectionError:
-            return ValidationResult(
-                service=service_name,
-                success=False,
-                message="Connection failed - check network",
-            )
         except Exception as e:
-            return ValidationResult(
-                service=service_name,
-                success=False,
-                message=f"Validation error: {str(e)}",
-            )
+            return _error_result(service_name, e, "check network")
 
     def validate_all(
-        self, config: dict[str, Any], auth_token: str | None = None
+        self,
+        config: dict[str, Any],
+        auth_token: str | None = None,
+        on_result: Callable[[ValidationResult], None] | None = None,
     ) -> list[ValidationResult]:
         """Validate all services based on configuration.
 
+        Values that are malformed fail straight away without a request. The
+        remaining checks run concurrently; results keep the order below.
+
         Args:
             config: Configuration dictionary from wizard
             auth_token: Optional Cognito auth token for authenticated endpoints
+            on_result: Called with each result as soon as its check finishes,
+                so callers can show progress before the slowest check is done
 
         Returns:
             List of validation results
         """
-        results = []
+        tasks: list[Callable[[], ValidationResult]] = []
 
         # Validate LangSmith (API key + queue name)
         if "langsmith" in config:
-            results.append(
-                self.validate_langsmith(
-                    api_key=config["langsmith"]["api_key"],
-                    queue_name=config["langsmith"].get("queue"),
+            ls_api_key = config["langsmith"]["api_key"]
+            if not validate_api_key(ls_api_key, prefix="ls"):
+                tasks.append(partial(_invalid_result, "LangSmith", "Invalid API key format"))
+            else:
+                tasks.append(
+                    partial(
+                        self.validate_langsmith,
+                        api_key=ls_api_key,
+                        queue_name=config["langsmith"].get("queue"),
+                    )
                 )
-            )
 
         # Validate AWS endpoints
         endpoint = ""
@@ -389,19 +536,33 @@ class ServiceValidator:
             aws = config["aws"]
             api_key_val = aws.get("api_key") or None
             endpoint = aws["integration_endpoint"]
+            evaluation_endpoint = aws["evaluation_endpoint"]
 
-            results.append(
-                self.validate_integration_endpoint(endpoint, api_key_val, auth_token)
-            )
-            results.append(
-                self.validate_evaluation_endpoint(aws["evaluation_endpoint"], api_key_val, auth_token)
-            )
+            if not validate_url(endpoint):
+                tasks.append(partial(_invalid_result, "Integration Service", "Invalid URL format"))
+                endpoint = ""  # the provider check goes through this endpoint
+            else:
+                tasks.append(
+                    partial(self.validate_integration_endpoint, endpoint, api_key_val, auth_token)
+                )
+            if not validate_url(evaluation_endpoint):
+                tasks.append(partial(_invalid_result, "Evaluation Service", "Invalid URL format"))
+            else:
+                tasks.append(
+                    partial(
+                        self.validate_evaluation_endpoint,
+                        evaluation_endpoint,
+                        api_key_val,
+                        auth_token,
+                    )
+                )
 
         # Validate provider via Lambda (uses per-user credentials)
         provider = config.get("provider", "none")
         if provider in ("jira", "notion") and endpoint:
-            results.append(
-                self.validate_provider_via_lambda(
+            tasks.append(
+                partial(
+                    self.validate_provider_via_lambda,
                     endpoint=endpoint,
                     provider=provider,
                     auth_token=auth_token,
@@ -409,7 +570,27 @@ class ServiceValidator:
                 )
             )
 
-        return results
+        if len(tasks) <= 1:
+            results = [task() for task in tasks]
+            if on_result is not None:
+                for result in results:
+                    on_result(result)
+            return results
+
+        # Checks hit independent services; run them concurrently so the total
+        # wait is the slowest probe rather than the sum of all of them
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = [executor.submit(task) for task in tasks]
+            if on_result is not None:
+                for future in as_completed(futures):
+                    on_result(future.result())
+            return [future.result() for future in futures]
+
+    @staticmethod
+    def format_result(result: ValidationResult) -> str:
+        """Format one validation result as a status line."""
+        status = "[green]✓[/green]" if result.success else "[red]✗[/red]"
+        return f"  {status} {result.service}: {result.message}"
 
     def format_results(self, results: list[ValidationResult]) -> tuple[bool, str]:
         """Format validation results for display.
@@ -424,8 +605,7 @@ class ServiceValidator:
         all_passed = True
 
         for result in results:
-            status = "[green]✓[/green]" if result.success else "[red]✗[/red]"
-            lines.append(f"  {status} {result.service}: {result.message}")
+            lines.append(self.format_result(result))
             if not result.success:
                 all_passed = False
 
@@ -7,9 +7,11 @@ skills and agents.
 
 import logging
 import shutil
-from importlib import resources
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from cli.agents import _list_dir_names, _package_dir
+
 logger = logging.getLogger(__name__)
 
 # Skills included in this package
@@ -20,6 +22,9 @@ SKILLS = [
     "issues.md",
 ]
 
+# Upper bound on concurrent file copies in install_skills
+INSTALL_MAX_WORKERS = 4
+
 
 def get_skills_dir() -> Path:
     """Get the path to the skills directory in the package.
@@ -27,9 +32,7 @@ def get_skills_dir() -> Path:
     Returns:
         Path to the skills directory
     """
-    # Use importlib.resources for Python 3.9+
-    with resources.as_file(resources.files(__package__)) as skills_path:
-        return skills_path
+    return _package_dir(__package__)
 
 
 def install_skills(
@@ -55,31 +58,41 @@ def install_skills(
     # Create target directory if it doesn't exist
     target_dir.mkdir(parents=True, exist_ok=True)
 
-    results: dict[str, bool] = {}
+    # Assume success; copies that fail flip their entry below
+    results = dict.fromkeys(SKILLS, True)
 
     # Get the source skills directory
     source_dir = get_skills_dir()
+    # Forced installs copy everything, so they don't need the listing
+    existing = set() if force else _list_dir_names(target_dir)
 
+    pending: list[str] = []
     for skill_name in SKILLS:
-        source_file = source_dir / skill_name
-        target_file = target_dir / skill_name
-
         try:
-            if target_file.exists() and not force:
+            if skill_name in existing:
                 # Compare content — update if package version is newer/different
-                if source_file.read_text() == target_file.read_text():
-                    results[skill_name] = True
+                if (source_dir / skill_name).read_text() == (target_dir / skill_name).read_text():
                     continue
                 logger.info(f"Updating outdated skill: {skill_name}")
-
-            shutil.copy2(source_file, target_file)
-            logger.info(f"Installed skill: {skill_name} -> {target_file}")
-            results[skill_name] = True
-
+            pending.append(skill_name)
         except Exception as e:
             logger.error(f"Failed to install skill {skill_name}: {e}")
             results[skill_name] = False
 
+    def _copy(skill_name: str) -> bool:
+        target_file = target_dir / skill_name
+        try:
+            shutil.copy2(source_dir / skill_name, target_file)
+        except Exception as e:
+            logger.error(f"Failed to install skill {skill_name}: {e}")
+            return False
+        logger.info(f"Installed skill: {skill_name} -> {target_file}")
+        return True
+
+    if pending:
+        with ThreadPoolExecutor(max_workers=min(INSTALL_MAX_WORKERS, len(pending))) as executor:
+            results.update(zip(pending, executor.map(_copy, pending), strict=True))
+
     return results
 
 
@@ -101,12 +114,8 @@ def get_installed_skills(
             project_root = Path.cwd()
         target_dir = project_root / ".claude" / "commands"
 
-    installed = []
-    for skill_name in SKILLS:
-        if (target_dir / skill_name).exists():
-            installed.append(skill_name)
-
-    return installed
+    existing = _list_dir_names(target_dir)
+    return [skill_name for skill_name in SKILLS if skill_name in existing]
 
 
 def install_agents(
@@ -149,3 +158,30 @@ def get_installed_agents(
     from cli.agents import get_installed_agents as _get_installed_agents
 
     return _get_installed_agents(target_dir=target_dir, project_root=project_root)
+
+
+def ensure_skills_installed(project_root: Path | None = None) -> None:
+    """Install any missing Geniable agents and skills (non-force).
+
+    Only runs for initialized projects (a .claude/ directory exists) and
+    never overwrites existing files. Failures are ignored, since this is
+    called opportunistically from other commands.
+
+    Args:
+        project_root: Project root directory. Defaults to current working directory
+    """
+    try:
+        project_root = project_root or Path.cwd()
+        if (project_root / ".claude").exists():
+            install_agents(
+                target_dir=project_root / ".claude" / "agents",
+                force=False,
+                project_root=project_root,
+            )
+            install_skills(
+                target_dir=project_root / ".claude" / "commands",
+                force=False,
+                project_root=project_root,
+            )
+    except Exception:
+        logger.debug("Could not install agents/skills", exc_info=True)
@@ -3,6 +3,20 @@
 import re
 from pathlib import Path
 
+# Patterns are matched with fullmatch; hostnames are built from dot-separated
+# labels so a failed match can't backtrack across label boundaries
+_URL_RE = re.compile(
+    r"https?://"  # http:// or https://
+    r"(?:(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+[a-z]{2,63}\.?"  # domain
+    r"|localhost"  # localhost
+    r"|\d{1,3}(?:\.\d{1,3}){3})"  # or IPv4
+    r"(?::\d{1,5})?"  # optional port
+    r"(?:[/?]\S*)?",  # optional path/query
+    re.IGNORECASE,
+)
+_EMAIL_RE = re.compile(r"[a-z0-9._%+-]+@[a-z0-9-]+(?:\.[a-z0-9-]+)*\.[a-z]{2,}", re.IGNORECASE)
+_PROJECT_KEY_RE = re.compile(r"[A-Z][A-Z0-9_]{1,9}")
+
 
 def validate_url(url: str) -> bool:
     """Validate a URL format.
@@ -13,16 +27,7 @@ def validate_url(url: str) -> bool:
     Returns:
         True if valid
     """
-    pattern = re.compile(
-        r"^https?://"  # http:// or https://
-        r"(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|"  # domain
-        r"localhost|"  # localhost
-        r"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})"  # or IP
-        r"(?::\d+)?"  # optional port
-        r"(?:/?|[/?]\S+)$",
-        re.IGNORECASE,
-    )
-    return bool(pattern.match(url))
+    return _URL_RE.fullmatch(url) is not None
 
 
 def validate_email(email: str) -> bool:
@@ -34,8 +39,7 @@ def validate_email(email: str) -> bool:
     Returns:
         True if valid
     """
-    pattern = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
-    return bool(pattern.match(email))
+    return _EMAIL_RE.fullmatch(email) is not None
 
 
 def validate_api_key(key: str, prefix: str | None = None) -> bool:
@@ -66,8 +70,7 @@ def validate_project_key(key: str) -> bool:
     Returns:
         True if valid
     """
-    pattern = re.compile(r"^[A-Z][A-Z0-9_]{1,9}$")
-    return bool(pattern.match(key.upper()))
+    return _PROJECT_KEY_RE.fullmatch(key.upper()) is not None
 
 
 def validate_path(path: str, must_exist: bool = False) -> bool:
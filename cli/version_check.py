@@ -7,7 +7,6 @@ import json
 import re
 import sys
 import time
-import urllib.request
 from pathlib import Path
 
 _CACHE_FILE = Path.home() / ".geniable_version_cache"
@@ -72,7 +71,10 @@ def _do_check() -> None:
                 _show_notice(current, latest)
             return
 
-    # Fetch from PyPI using stdlib (no requests dependency for startup path)
+    # Fetch from PyPI using stdlib (no requests dependency for startup path);
+    # urllib.request pulls in http.client/ssl, so only import it on a cache miss
+    import urllib.request
+
     req = urllib.request.Request(
         "https://pypi.org/pypi/geniable/json",
         headers={"Accept": "application/json"},
@@ -1,19 +1,277 @@
 """Interactive configuration wizard for onboarding."""
 
+from __future__ import annotations
+
+import contextlib
+import functools
+import hashlib
 import logging
+import os
+import sys
+from collections.abc import Callable
 from pathlib import Path
-from typing import Any
-
-import questionary
-from rich.console import Console
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, TypeVar
 
-from cli.claude_code_setup import ClaudeCodeSetup
-from cli.service_validator import ServiceValidator
+from cli.output_formatter import get_console
 from cli.validators import validate_api_key, validate_email, validate_project_key, validate_url
 
-console = Console()
+if TYPE_CHECKING:
+    import requests
+
+    from cli.auth import AuthTokens
+
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+@functools.lru_cache(maxsize=1)
+def _session() -> requests.Session:
+    """Create the HTTP session used for cloud sync and service validation.
+
+    Both steps talk to the same API Gateway host, so validation reuses the
+    connection the sync opened instead of a second TLS handshake. Gateway
+    errors (Lambda cold starts, throttling) are retried with backoff,
+    honouring Retry-After: the sync overwrites the user's stored config,
+    so sending it again is safe, and the validation requests only read.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        # API Gateway and LangSmith; validation checks the backend in parallel
+        pool_connections=2,
+        pool_maxsize=4,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"GET", "POST"}),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+# Digest of the last config payload synced to the cloud. Re-running the
+# wizard with unchanged answers skips the POST when this still matches;
+# `geni init --force` ignores it and `geni logout` removes it
+SYNC_HASH_FILE = Path.home() / ".geniable" / "cache" / "last_sync_hash"
+
+
+def _read_sync_hash() -> str | None:
+    """Read the digest of the last synced payload, if any."""
+    try:
+        return SYNC_HASH_FILE.read_text().strip()
+    except OSError:
+        return None
+
+
+def _write_sync_hash(digest: str) -> None:
+    """Atomically record the digest of a synced payload with user-only permissions."""
+    try:
+        SYNC_HASH_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = SYNC_HASH_FILE.with_suffix(f".{os.getpid()}.tmp")
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            f.write(digest)
+        os.replace(tmp_file, SYNC_HASH_FILE)
+    except OSError as e:
+        logger.debug(f"Could not write sync hash: {e}")
+
+
+def clear_sync_hash() -> None:
+    """Forget the last synced payload, so the next sync always posts."""
+    with contextlib.suppress(OSError):
+        SYNC_HASH_FILE.unlink()
+
+
+# Geniable cloud API (API Gateway stage serving both services)
+_AWS_API_URL = "https://qdu9vpxw26.execute-api.ap-southeast-2.amazonaws.com/dev"
+
+# Prompt validators for questionary: return True, or the message to show.
+# Defined once here since questionary re-runs them on every keystroke
+
+
+def _required(message: str) -> Callable[[str], bool | str]:
+    """Build a validator that rejects empty input with the given message."""
+
+    def check(value: str) -> bool | str:
+        return len(value) > 0 or message
+
+    return check
+
+
+_check_project_name = _required("Project name is required")
+_check_queue_name = _required("Queue name is required")
+_check_dataset_name = _required("Dataset name is required")
+
+
+def _check_langsmith_key(value: str) -> bool | str:
+    return validate_api_key(value, prefix="ls") or "Invalid API key format (should start with 'ls')"
+
+
+def _check_langfuse_public_key(value: str) -> bool | str:
+    return value.startswith("pk-lf-") or "Public key should start with 'pk-lf-'"
+
+
+def _check_langfuse_secret_key(value: str) -> bool | str:
+    return value.startswith("sk-lf-") or "Secret key should start with 'sk-lf-'"
+
+
+def _check_url(value: str) -> bool | str:
+    return validate_url(value) or "Invalid URL format"
+
+
+def _check_email(value: str) -> bool | str:
+    return validate_email(value) or "Invalid email format"
+
+
+def _check_jira_token(value: str) -> bool | str:
+    return len(value) > 10 or "API token seems too short"
+
+
+def _check_project_key(value: str) -> bool | str:
+    return validate_project_key(value) or "Invalid project key format (use uppercase letters)"
+
+
+def _check_notion_key(value: str) -> bool | str:
+    return value.startswith("secret_") or "Notion API key should start with 'secret_'"
+
+
+# Notion database IDs are UUIDs, written without or with dashes
+_NOTION_DATABASE_ID_LENGTHS = frozenset((32, 36))
+
+
+def _check_notion_database_id(value: str) -> bool | str:
+    return (
+        len(value) in _NOTION_DATABASE_ID_LENGTHS
+        or "Database ID should be 32 characters (without dashes) or 36 (with dashes)"
+    )
+
+
+def _read_line(message: str) -> str | None:
+    """Read one line of piped input for a prompt.
+
+    Returns:
+        The stripped line, or None at end of input
+    """
+    try:
+        return input(f"{message} ").strip()
+    except EOFError:
+        return None
+
+
+def _answered(answer: T | None) -> T:
+    """Return a prompt's answer, treating a missing one as cancelling the wizard.
+
+    Raises:
+        KeyboardInterrupt: If the prompt was cancelled or input ran out
+    """
+    if answer is None:
+        raise KeyboardInterrupt("Wizard cancelled")
+    return answer
+
+
+def _ask_text(
+    message: str,
+    validate: Callable[[str], bool | str],
+    default: str = "",
+    password: bool = False,
+) -> str:
+    """Ask for a line of text.
+
+    Terminals get questionary's prompt. Piped input (CI, scripted setup)
+    skips the prompt rendering: lines are read plainly and the question is
+    repeated until validate accepts the answer.
+
+    Args:
+        message: Question to show
+        validate: Validator returning True or an error message
+        default: Answer used for empty input
+        password: Hide the input on terminals
+
+    Returns:
+        The answer
+
+    Raises:
+        KeyboardInterrupt: If the prompt was cancelled or input ran out
+    """
+    if sys.stdin.isatty():
+        import questionary
+
+        ask = questionary.password if password else questionary.text
+        text: str | None = ask(message, default=default, validate=validate).ask()
+        return _answered(text)
+
+    while (answer := _read_line(message)) is not None:
+        answer = answer or default
+        result = validate(answer)
+        if result is True:
+            return answer
+        get_console().print(f"[red]{result}[/red]")
+    raise KeyboardInterrupt("Wizard cancelled")
+
+
+def _ask_select(message: str, choices: list[str], default: str | None = None) -> str:
+    """Ask the user to pick one of several choices.
+
+    Piped input is matched against the choice names; empty input picks the
+    default (or the first choice).
+
+    Args:
+        message: Question to show
+        choices: Names to choose from
+        default: Choice preselected on terminals and used for empty input
+
+    Returns:
+        The chosen name
+
+    Raises:
+        KeyboardInterrupt: If the prompt was cancelled or input ran out
+    """
+    if sys.stdin.isatty():
+        import questionary
+
+        choice: str | None = questionary.select(message, choices=choices, default=default).ask()
+        return _answered(choice)
+
+    while (answer := _read_line(f"{message} [{' / '.join(choices)}]")) is not None:
+        answer = answer or default or choices[0]
+        if answer in choices:
+            return answer
+        get_console().print(f"[red]Choose one of: {', '.join(choices)}[/red]")
+    raise KeyboardInterrupt("Wizard cancelled")
+
+
+def _ask_confirm(message: str, default: bool = True) -> bool:
+    """Ask a yes/no question.
+
+    Args:
+        message: Question to show
+        default: Answer used for empty input
+
+    Returns:
+        The answer
+
+    Raises:
+        KeyboardInterrupt: If the prompt was cancelled or input ran out
+    """
+    if sys.stdin.isatty():
+        import questionary
+
+        confirmed: bool | None = questionary.confirm(message, default=default).ask()
+        return _answered(confirmed)
+
+    answer = _answered(_read_line(f"{message} [{'Y/n' if default else 'y/N'}]"))
+    return default if not answer else answer.lower() in ("y", "yes")
+
 
 class ConfigWizard:
     """Interactive wizard for capturing configuration."""
@@ -29,20 +287,54 @@ class ConfigWizard:
         {"name": "None (reports only)", "value": "none"},
     ]
 
-    # Hardcoded AWS configuration - users connect to our cloud service
-    AWS_CONFIG = {
-        "region": "ap-southeast-2",
-        "integration_endpoint": "https://qdu9vpxw26.execute-api.ap-southeast-2.amazonaws.com/dev",
-        "evaluation_endpoint": "https://qdu9vpxw26.execute-api.ap-southeast-2.amazonaws.com/dev",
-        "api_key": "",  # Not required for Cognito-authenticated endpoints
+    # Display name -> value lookups for the select prompts
+    _TRACING_NAME_TO_VALUE = {c["name"]: c["value"] for c in TRACING_CHOICES}
+    _INTEGRATION_NAME_TO_VALUE = {c["name"]: c["value"] for c in INTEGRATION_CHOICES}
+
+    # Hardcoded AWS configuration - users connect to our cloud service.
+    # Read-only, so every wizard run can share it instead of copying it
+    AWS_CONFIG = MappingProxyType(
+        {
+            "region": "ap-southeast-2",
+            "integration_endpoint": _AWS_API_URL,
+            "evaluation_endpoint": _AWS_API_URL,
+            "api_key": "",  # Not required for Cognito-authenticated endpoints
+        }
+    )
+
+    # What _sync_to_cloud sends per config section: secret name -> field
+    # stored as a per-user secret, and the fields stored as plain config
+    SYNC_SCHEMA: dict[str, tuple[dict[str, str], tuple[str, ...]]] = {
+        "langsmith": ({"langsmith_api_key": "api_key"}, ("project", "queue")),
+        "langfuse": (
+            {"langfuse_public_key": "public_key", "langfuse_secret_key": "secret_key"},
+            ("host", "dataset"),
+        ),
+        "aws": (
+            {"aws_api_key": "api_key"},
+            ("region", "integration_endpoint", "evaluation_endpoint"),
+        ),
+        "jira": (
+            {"jira_api_token": "api_token"},
+            ("base_url", "email", "project_key", "issue_type"),
+        ),
+        "notion": ({"notion_api_key": "api_key"}, ("database_id",)),
     }
 
-    def __init__(self) -> None:
-        """Initialize the wizard."""
+    def __init__(self, tokens: AuthTokens | None = None) -> None:
+        """Initialize the wizard.
+
+        Args:
+            tokens: Auth tokens the caller already looked up; read from the
+                stored session when omitted
+        """
         self.config: dict[str, Any] = {}
+        self._tokens = tokens
         self._user_email: str | None = None
         self._user_id: str | None = None
         self._id_token: str | None = None
+        # Resolved once; every project file the wizard touches lives here
+        self._project_root = Path.cwd()
 
     def _load_auth_context(self) -> None:
         """Load authentication context from current session.
@@ -50,17 +342,18 @@ class ConfigWizard:
         The init command requires authentication, so we can assume
         the user is already authenticated when this runs.
         """
-        try:
-            from cli.auth import get_auth_client
-
-            auth_client = get_auth_client()
-            tokens = auth_client.get_current_tokens()
-            if tokens:
-                self._user_email = tokens.email
-                self._user_id = tokens.user_id
-                self._id_token = tokens.id_token
-        except Exception as e:
-            logger.warning(f"Failed to load auth context: {e}")
+        if self._tokens is None:
+            try:
+                from cli.auth import get_auth_client
+
+                self._tokens = get_auth_client().get_current_tokens()
+            except Exception as e:
+                logger.warning(f"Failed to load auth context: {e}")
+
+        if self._tokens:
+            self._user_email = self._tokens.email
+            self._user_id = self._tokens.user_id
+            self._id_token = self._tokens.id_token
 
     def _setup_claude_code(self) -> None:
         """Set up Claude Code agent integration.
@@ -72,7 +365,9 @@ class ConfigWizard:
         Also installs Geniable skills to ~/.claude/commands/ for the
         /analyze-latest slash command.
         """
-        setup = ClaudeCodeSetup(project_root=Path.cwd())
+        from cli.claude_code_setup import ClaudeCodeSetup
+
+        setup = ClaudeCodeSetup(project_root=self._project_root)
         setup.run_setup_check()
 
         # Install Geniable skills
@@ -80,41 +375,60 @@ class ConfigWizard:
 
     def _install_skills(self) -> None:
         """Install Geniable Claude Code skills and agents to project directory."""
+        from concurrent.futures import ThreadPoolExecutor
+
         from cli.skills import install_agents, install_skills
 
-        project_root = Path.cwd()
+        console = get_console()
+
+        project_root = self._project_root
         console.print("\n[dim]Installing Geniable skills and agents to project...[/dim]")
 
         try:
-            # Install skills to .claude/commands/ in project
-            skill_results = install_skills(force=True, project_root=project_root)
+            # Install skills to .claude/commands/ and agents to .claude/agents/
+            # in the project; the two sets of copies are independent
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                skill_future = executor.submit(
+                    install_skills, force=True, project_root=project_root
+                )
+                agent_future = executor.submit(
+                    install_agents, force=True, project_root=project_root
+                )
+                skill_results = skill_future.result()
+                agent_results = agent_future.result()
+
             skill_installed = [name for name, success in skill_results.items() if success]
             skill_failed = [name for name, success in skill_results.items() if not success]
 
+            # Build each group of lines up front and print it in one call
+            groups = []
             if skill_installed:
-                console.print(f"[green]✓[/green] Installed {len(skill_installed)} skill(s):")
-                for skill in skill_installed:
-                    console.print(f"  - .claude/commands/{skill}")
-
+                groups.append(
+                    [f"[green]✓[/green] Installed {len(skill_installed)} skill(s):"]
+                    + [f"  - .claude/commands/{skill}" for skill in skill_installed]
+                )
             if skill_failed:
-                console.print(f"[yellow]![/yellow] Failed to install {len(skill_failed)} skill(s):")
-                for skill in skill_failed:
-                    console.print(f"  - {skill}")
+                groups.append(
+                    [f"[yellow]![/yellow] Failed to install {len(skill_failed)} skill(s):"]
+                    + [f"  - {skill}" for skill in skill_failed]
+                )
 
-            # Install agents to .claude/agents/ in project
-            agent_results = install_agents(force=True, project_root=project_root)
             agent_installed = [name for name, success in agent_results.items() if success]
             agent_failed = [name for name, success in agent_results.items() if not success]
 
             if agent_installed:
-                console.print(f"[green]✓[/green] Installed {len(agent_installed)} agent(s):")
-                for agent in agent_installed:
-                    console.print(f"  - .claude/agents/{agent}")
-
+                groups.append(
+                    [f"[green]✓[/green] Installed {len(agent_installed)} agent(s):"]
+                    + [f"  - .claude/agents/{agent}" for agent in agent_installed]
+                )
             if agent_failed:
-                console.print(f"[yellow]![/yellow] Failed to install {len(agent_failed)} agent(s):")
-                for agent in agent_failed:
-                    console.print(f"  - {agent}")
+                groups.append(
+                    [f"[yellow]![/yellow] Failed to install {len(agent_failed)} agent(s):"]
+                    + [f"  - {agent}" for agent in agent_failed]
+                )
+
+            for lines in groups:
+                console.print("\n".join(lines))
 
             # Configure Claude Code permissions for geni commands
             self._configure_claude_code_permissions()
@@ -137,10 +451,11 @@ class ConfigWizard:
 
         Claude Code uses colon-based patterns: Bash(command:*) matches any command starting with 'command'.
         """
-        import json
+        from shared.utils.serialization import dumps, loads
 
-        project_root = Path.cwd()
-        settings_path = project_root / ".claude" / "settings.local.json"
+        console = get_console()
+
+        settings_path = self._project_root / ".claude" / "settings.local.json"
 
         # Permission patterns using Claude Code's colon format
         # Bash(prefix:*) matches any command starting with 'prefix'
@@ -156,10 +471,10 @@ class ConfigWizard:
 
         try:
             # Load existing settings or create new
-            if settings_path.exists():
-                with open(settings_path) as f:
-                    settings = json.load(f)
-            else:
+            try:
+                with open(settings_path, "rb") as f:
+                    settings = loads(f.read())
+            except FileNotFoundError:
                 settings = {}
 
             # Ensure permissions.allow structure exists
@@ -169,20 +484,24 @@ class ConfigWizard:
                 settings["permissions"]["allow"] = []
 
             # Add geni permissions if not already present
-            added = []
-            for permission in geni_permissions:
-                if permission not in settings["permissions"]["allow"]:
-                    settings["permissions"]["allow"].append(permission)
-                    added.append(permission)
+            allow = settings["permissions"]["allow"]
+            existing = set(allow)
+            added = [permission for permission in geni_permissions if permission not in existing]
+            allow.extend(added)
 
             if added:
-                # Write back settings
+                # Write back settings in one write to a temp file, then swap it
+                # in so Claude Code never sees a half-written file
                 settings_path.parent.mkdir(parents=True, exist_ok=True)
-                with open(settings_path, "w") as f:
-                    json.dump(settings, f, indent=2)
-
-                console.print("[green]✓[/green] Configured Claude Code permissions:")
-                console.print(f"  - Added {len(added)} permission(s) to .claude/settings.local.json")
+                tmp_path = settings_path.with_suffix(f".{os.getpid()}.tmp")
+                with open(tmp_path, "wb") as f:
+                    f.write(dumps(settings, indent=True))
+                os.replace(tmp_path, settings_path)
+
+                console.print(
+                    "[green]✓[/green] Configured Claude Code permissions:\n"
+                    f"  - Added {len(added)} permission(s) to .claude/settings.local.json"
+                )
             else:
                 console.print("[green]✓[/green] Claude Code permissions already configured")
 
@@ -193,11 +512,13 @@ class ConfigWizard:
                 ".claude/settings.local.json permissions.allow[/dim]"
             )
 
-    def run(self, skip_validation: bool = False) -> dict[str, Any]:
+    def run(self, skip_validation: bool = False, force_sync: bool = False) -> dict[str, Any]:
         """Run the complete wizard flow.
 
         Args:
             skip_validation: Skip service validation step
+            force_sync: Post the config to the cloud even if it is unchanged
+                since the last sync
 
         Returns:
             Configuration dictionary ready for saving
@@ -205,6 +526,7 @@ class ConfigWizard:
         Raises:
             RuntimeError: If cloud sync fails (required)
         """
+        console = get_console()
         console.print("\n[bold cyan]Geni Setup Wizard[/bold cyan]")
         console.print("This wizard will help you configure the analyzer.\n")
 
@@ -223,7 +545,7 @@ class ConfigWizard:
         self._capture_tracing_config()
 
         # Set hardcoded AWS configuration (users connect to our cloud service)
-        self.config["aws"] = self.AWS_CONFIG.copy()
+        self.config["aws"] = self.AWS_CONFIG
 
         # Step 3: Integration selection
         console.print(f"\n[bold]Step 3/{total_steps}: Issue Tracker Integration[/bold]")
@@ -244,7 +566,16 @@ class ConfigWizard:
 
         # Step 4: Sync to cloud FIRST (required - credentials must be stored before validation)
         console.print(f"\n[bold]Step 4/{total_steps}: Cloud Sync[/bold]")
-        self._sync_to_cloud()
+        # Gateway errors are already retried by the session; for anything
+        # else, offer another attempt rather than discarding the answers
+        while True:
+            try:
+                self._sync_to_cloud(force=force_sync)
+                break
+            except RuntimeError as e:
+                console.print(f"[red]✗ {e}[/red]")
+                if not _ask_confirm("Retry cloud sync? (your answers are kept)"):
+                    raise RuntimeError("Cloud sync was not completed") from e
 
         # Step 5: Validate services (now Lambda has the credentials)
         if not skip_validation:
@@ -253,19 +584,26 @@ class ConfigWizard:
 
         return self.config
 
-    def _sync_to_cloud(self) -> None:
+    def _sync_to_cloud(self, force: bool = False) -> None:
         """Sync configuration to cloud backend.
 
         Uses the authenticated API to store user configuration and secrets.
         This is required - there is no local-only mode.
 
+        Args:
+            force: Post even if the payload matches the last synced one
+
         Raises:
             RuntimeError: If cloud sync fails
         """
+        console = get_console()
         console.print("[dim]Syncing configuration to cloud (per-user storage)...[/dim]")
 
         import requests
 
+        from cli.service_validator import CONNECT_TIMEOUT
+        from shared.utils.serialization import dumps, loads
+
         # Use stored token from auth context
         if not self._id_token:
             raise RuntimeError(
@@ -282,57 +620,18 @@ class ConfigWizard:
 
         # Prepare config and secrets for API
         # Separate sensitive credentials from config
-        secrets = {}
-        config_to_save = {}
-
-        # Trace source
-        config_to_save["trace_source"] = self.config.get("trace_source", "langsmith")
-
-        # LangSmith
-        if self.config.get("langsmith"):
-            secrets["langsmith_api_key"] = self.config["langsmith"].get("api_key", "")
-            config_to_save["langsmith"] = {
-                "project": self.config["langsmith"].get("project"),
-                "queue": self.config["langsmith"].get("queue"),
-            }
-
-        # Langfuse
-        if self.config.get("langfuse"):
-            secrets["langfuse_public_key"] = self.config["langfuse"].get("public_key", "")
-            secrets["langfuse_secret_key"] = self.config["langfuse"].get("secret_key", "")
-            config_to_save["langfuse"] = {
-                "host": self.config["langfuse"].get("host"),
-                "dataset": self.config["langfuse"].get("dataset"),
-            }
-
-        # AWS
-        if self.config.get("aws"):
-            secrets["aws_api_key"] = self.config["aws"].get("api_key", "")
-            config_to_save["aws"] = {
-                "region": self.config["aws"].get("region"),
-                "integration_endpoint": self.config["aws"].get("integration_endpoint"),
-                "evaluation_endpoint": self.config["aws"].get("evaluation_endpoint"),
-            }
-
-        # Provider
-        config_to_save["provider"] = self.config.get("provider", "none")
-
-        # Jira
-        if self.config.get("jira"):
-            secrets["jira_api_token"] = self.config["jira"].get("api_token", "")
-            config_to_save["jira"] = {
-                "base_url": self.config["jira"].get("base_url"),
-                "email": self.config["jira"].get("email"),
-                "project_key": self.config["jira"].get("project_key"),
-                "issue_type": self.config["jira"].get("issue_type"),
-            }
-
-        # Notion
-        if self.config.get("notion"):
-            secrets["notion_api_key"] = self.config["notion"].get("api_key", "")
-            config_to_save["notion"] = {
-                "database_id": self.config["notion"].get("database_id"),
-            }
+        secrets: dict[str, str] = {}
+        config_to_save: dict[str, Any] = {
+            "trace_source": self.config.get("trace_source", "langsmith"),
+            "provider": self.config.get("provider", "none"),
+        }
+        for section, (secret_fields, config_fields) in self.SYNC_SCHEMA.items():
+            values = self.config.get(section)
+            if not values:
+                continue
+            for secret_name, field in secret_fields.items():
+                secrets[secret_name] = values.get(field, "")
+            config_to_save[section] = {field: values.get(field) for field in config_fields}
 
         # Call authenticated API to save config
         headers = {
@@ -345,11 +644,24 @@ class ConfigWizard:
             "secrets": secrets,
         }
 
+        url = f"{endpoint.rstrip('/')}/users/me/config"
+        # Encoded up front (orjson when installed) rather than via json=, with
+        # sorted keys so identical answers hash identically
+        body = dumps(payload, sort_keys=True)
+        digest = hashlib.blake2b(
+            f"{url}\n{self._user_id}\n".encode() + body, digest_size=16
+        ).hexdigest()
+        if not force and _read_sync_hash() == digest:
+            console.print("[dim]No changes since the last sync; skipping cloud sync.[/dim]")
+            return
+
         try:
-            url = f"{endpoint.rstrip('/')}/users/me/config"
-            response = requests.post(url, json=payload, headers=headers, timeout=30)
+            response = _session().post(
+                url, data=body, headers=headers, timeout=(CONNECT_TIMEOUT, 30)
+            )
 
             if response.status_code == 200:
+                _write_sync_hash(digest)
                 console.print("\n[green]✓ Configuration synced to cloud[/green]")
                 console.print("[dim]Your credentials are stored securely per-user in AWS.[/dim]")
             elif response.status_code == 401:
@@ -359,7 +671,7 @@ class ConfigWizard:
             else:
                 error_detail = ""
                 try:
-                    error_detail = response.json().get("message", response.text)
+                    error_detail = loads(response.content).get("message", response.text)
                 except Exception:
                     error_detail = response.text
                 raise RuntimeError(
@@ -371,13 +683,12 @@ class ConfigWizard:
 
     def _validate_services(self) -> None:
         """Validate all configured services."""
-        validate = questionary.confirm(
-            "Test credentials and endpoints now?",
-            default=True,
-        ).ask()
+        from cli.output_formatter import create_progress
+        from cli.service_validator import ServiceValidator
 
-        if validate is None:
-            raise KeyboardInterrupt("Wizard cancelled")
+        console = get_console()
+
+        validate = _ask_confirm("Test credentials and endpoints now?")
 
         if not validate:
             console.print("[dim]Skipping validation. Run 'geni configure --validate' later.[/dim]")
@@ -385,18 +696,20 @@ class ConfigWizard:
 
         console.print("\n[dim]Testing connections...[/dim]")
 
-        validator = ServiceValidator()
-        results = validator.validate_all(self.config, auth_token=self._id_token)
-
-        # Display results
-        all_passed = True
-        for result in results:
-            status = "[green]✓[/green]" if result.success else "[red]✗[/red]"
-            console.print(f"  {status} {result.service}: {result.message}")
-            if not result.success:
-                all_passed = False
+        # Each result is shown as soon as its check finishes, above a spinner
+        # that stays up while the slower checks are still pending
+        with (
+            ServiceValidator(session=_session()) as validator,
+            create_progress(transient=True) as progress,
+        ):
+            progress.add_task("Waiting for services...", total=None)
+            results = validator.validate_all(
+                self.config,
+                auth_token=self._id_token,
+                on_result=lambda result: progress.console.print(validator.format_result(result)),
+            )
 
-        if not all_passed:
+        if not all(result.success for result in results):
             console.print("\n[yellow]Some validations failed.[/yellow]")
             console.print(
                 "[dim]Your configuration has been saved. You can re-validate with 'geni validate'[/dim]"
@@ -410,38 +723,15 @@ class ConfigWizard:
         Returns:
             Selected integration: 'jira', 'notion', or 'none'
         """
-        choice = questionary.select(
-            "Select your issue tracker:",
-            choices=[c["name"] for c in self.INTEGRATION_CHOICES],
-        ).ask()
-
-        if choice is None:
-            raise KeyboardInterrupt("Wizard cancelled")
+        choice = _ask_select("Select your issue tracker:", list(self._INTEGRATION_NAME_TO_VALUE))
 
-        # Map display name back to value
-        for c in self.INTEGRATION_CHOICES:
-            if c["name"] == choice:
-                return c["value"]
-
-        return "none"
+        return self._INTEGRATION_NAME_TO_VALUE.get(choice, "none")
 
     def _capture_tracing_config(self) -> None:
         """Capture tracing provider configuration (LangSmith or Langfuse)."""
-        provider = questionary.select(
-            "Select your tracing provider:",
-            choices=[c["name"] for c in self.TRACING_CHOICES],
-        ).ask()
-
-        if provider is None:
-            raise KeyboardInterrupt("Wizard cancelled")
-
-        # Map display name to value
-        trace_source = "langsmith"
-        for c in self.TRACING_CHOICES:
-            if c["name"] == provider:
-                trace_source = c["value"]
-                break
+        provider = _ask_select("Select your tracing provider:", list(self._TRACING_NAME_TO_VALUE))
 
+        trace_source = self._TRACING_NAME_TO_VALUE.get(provider, "langsmith")
         self.config["trace_source"] = trace_source
 
         if trace_source == "langsmith":
@@ -451,32 +741,11 @@ class ConfigWizard:
 
     def _capture_langsmith_config(self) -> None:
         """Capture LangSmith configuration."""
-        api_key = questionary.password(
-            "LangSmith API Key:",
-            validate=lambda x: validate_api_key(x, prefix="ls")
-            or "Invalid API key format (should start with 'ls')",
-        ).ask()
-
-        if api_key is None:
-            raise KeyboardInterrupt("Wizard cancelled")
-
-        project = questionary.text(
-            "LangSmith Project Name:",
-            default="default",
-            validate=lambda x: len(x) > 0 or "Project name is required",
-        ).ask()
+        api_key = _ask_text("LangSmith API Key:", _check_langsmith_key, password=True)
 
-        if project is None:
-            raise KeyboardInterrupt("Wizard cancelled")
+        project = _ask_text("LangSmith Project Name:", _check_project_name, default="default")
 
-        queue = questionary.text(
-            "Annotation Queue Name:",
-            default="quality-review",
-            validate=lambda x: len(x) > 0 or "Queue name is required",
-        ).ask()
-
-        if queue is None:
-            raise KeyboardInterrupt("Wizard cancelled")
+        queue = _ask_text("Annotation Queue Name:", _check_queue_name, default="quality-review")
 
         self.config["langsmith"] = {
             "api_key": api_key,
@@ -486,41 +755,17 @@ class ConfigWizard:
 
     def _capture_langfuse_config(self) -> None:
         """Capture Langfuse configuration."""
-        public_key = questionary.password(
-            "Langfuse Public Key:",
-            validate=lambda x: x.startswith("pk-lf-")
-            or "Public key should start with 'pk-lf-'",
-        ).ask()
-
-        if public_key is None:
-            raise KeyboardInterrupt("Wizard cancelled")
-
-        secret_key = questionary.password(
-            "Langfuse Secret Key:",
-            validate=lambda x: x.startswith("sk-lf-")
-            or "Secret key should start with 'sk-lf-'",
-        ).ask()
-
-        if secret_key is None:
-            raise KeyboardInterrupt("Wizard cancelled")
-
-        host = questionary.text(
-            "Langfuse Host URL:",
-            default="https://cloud.langfuse.com",
-            validate=lambda x: validate_url(x) or "Invalid URL format",
-        ).ask()
-
-        if host is None:
-            raise KeyboardInterrupt("Wizard cancelled")
-
-        dataset = questionary.text(
+        public_key = _ask_text("Langfuse Public Key:", _check_langfuse_public_key, password=True)
+
+        secret_key = _ask_text("Langfuse Secret Key:", _check_langfuse_secret_key, password=True)
+
+        host = _ask_text("Langfuse Host URL:", _check_url, default="https://cloud.langfuse.com")
+
+        dataset = _ask_text(
             "Langfuse Dataset Name (for trace grouping):",
+            _check_dataset_name,
             default="annotations",
-            validate=lambda x: len(x) > 0 or "Dataset name is required",
-        ).ask()
-
-        if dataset is None:
-            raise KeyboardInterrupt("Wizard cancelled")
+        )
 
         self.config["langfuse"] = {
             "public_key": public_key,
@@ -531,49 +776,20 @@ class ConfigWizard:
 
     def _capture_jira_credentials(self) -> None:
         """Capture Jira integration credentials."""
+        console = get_console()
         console.print("\n[dim]Configure Jira integration[/dim]")
 
-        base_url = questionary.text(
-            "Jira Base URL (e.g., https://company.atlassian.net):",
-            validate=lambda x: validate_url(x) or "Invalid URL format",
-        ).ask()
-
-        if base_url is None:
-            raise KeyboardInterrupt("Wizard cancelled")
-
-        email = questionary.text(
-            "Jira Email:",
-            validate=lambda x: validate_email(x) or "Invalid email format",
-        ).ask()
-
-        if email is None:
-            raise KeyboardInterrupt("Wizard cancelled")
+        base_url = _ask_text("Jira Base URL (e.g., https://company.atlassian.net):", _check_url)
 
-        api_token = questionary.password(
-            "Jira API Token:",
-            validate=lambda x: len(x) > 10 or "API token seems too short",
-        ).ask()
+        email = _ask_text("Jira Email:", _check_email)
 
-        if api_token is None:
-            raise KeyboardInterrupt("Wizard cancelled")
+        api_token = _ask_text("Jira API Token:", _check_jira_token, password=True)
 
-        project_key = questionary.text(
-            "Jira Project Key (e.g., PROJ):",
-            validate=lambda x: validate_project_key(x)
-            or "Invalid project key format (use uppercase letters)",
-        ).ask()
+        project_key = _ask_text("Jira Project Key (e.g., PROJ):", _check_project_key)
 
-        if project_key is None:
-            raise KeyboardInterrupt("Wizard cancelled")
-
-        issue_type = questionary.select(
-            "Default Issue Type:",
-            choices=["Bug", "Task", "Story", "Improvement"],
-            default="Bug",
-        ).ask()
-
-        if issue_type is None:
-            raise KeyboardInterrupt("Wizard cancelled")
+        issue_type = _ask_select(
+            "Default Issue Type:", ["Bug", "Task", "Story", "Improvement"], default="Bug"
+        )
 
         self.config["provider"] = "jira"
         self.config["jira"] = {
@@ -586,26 +802,14 @@ class ConfigWizard:
 
     def _capture_notion_credentials(self) -> None:
         """Capture Notion integration credentials."""
+        console = get_console()
         console.print("\n[dim]Configure Notion integration[/dim]")
 
-        api_key = questionary.password(
-            "Notion API Key (starts with 'secret_'):",
-            validate=lambda x: x.startswith("secret_")
-            or "Notion API key should start with 'secret_'",
-        ).ask()
-
-        if api_key is None:
-            raise KeyboardInterrupt("Wizard cancelled")
-
-        database_id = questionary.text(
-            "Notion Database ID:",
-            validate=lambda x: len(x) == 32
-            or len(x) == 36
-            or "Database ID should be 32 characters (without dashes) or 36 (with dashes)",
-        ).ask()
+        api_key = _ask_text(
+            "Notion API Key (starts with 'secret_'):", _check_notion_key, password=True
+        )
 
-        if database_id is None:
-            raise KeyboardInterrupt("Wizard cancelled")
+        database_id = _ask_text("Notion Database ID:", _check_notion_database_id)
 
         self.config["provider"] = "notion"
         self.config["notion"] = {
@@ -1,7 +1,24 @@
-"""Shared code for CLI and Local Agent."""
+"""Shared code for CLI and Local Agent.
 
-from shared.models.config import AppConfig
-from shared.models.issue_card import AffectedCode, EvaluationResult, IssueCard, Sources
+The models are imported on first attribute access, so importing a light
+submodule such as shared.utils.serialization does not load pydantic.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from shared.models.config import AppConfig
+    from shared.models.issue_card import AffectedCode, EvaluationResult, IssueCard, Sources
+
+# Public name -> module defining it
+_EXPORTS = {
+    "IssueCard": "shared.models.issue_card",
+    "AffectedCode": "shared.models.issue_card",
+    "Sources": "shared.models.issue_card",
+    "EvaluationResult": "shared.models.issue_card",
+    "AppConfig": "shared.models.config",
+}
 
 __all__ = [
     "IssueCard",
@@ -10,3 +27,10 @@ __all__ = [
     "EvaluationResult",
     "AppConfig",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
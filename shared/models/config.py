@@ -6,14 +6,16 @@ the ~/.geniable.yaml config file or environment variables.
 
 import os
 from pathlib import Path
-from typing import Any, Literal
+from typing import Literal
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class LangSmithConfig(BaseModel):
     """LangSmith API configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     api_key: str = Field(..., description="LangSmith API key")
     project: str = Field(default="insights-agent-v2", description="LangSmith project name")
     queue: str = Field(..., description="Annotation queue name")
@@ -22,6 +24,8 @@ class LangSmithConfig(BaseModel):
 class LangfuseConfig(BaseModel):
     """Langfuse tracing configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     public_key: str = Field(default="", description="Langfuse public key")
     secret_key: str = Field(default="", description="Langfuse secret key")
     host: str = Field(
@@ -36,6 +40,8 @@ class LangfuseConfig(BaseModel):
 class AWSConfig(BaseModel):
     """AWS service configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     region: str = Field(default="us-east-1", description="AWS region")
     integration_endpoint: str = Field(..., description="Integration Service API endpoint URL")
     evaluation_endpoint: str = Field(..., description="Evaluation Service API endpoint URL")
@@ -45,6 +51,8 @@ class AWSConfig(BaseModel):
 class JiraConfig(BaseModel):
     """Jira integration configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     base_url: str = Field(..., description="Jira instance URL")
     email: str = Field(..., description="Jira user email")
     api_token: str = Field(..., description="Jira API token")
@@ -55,6 +63,8 @@ class JiraConfig(BaseModel):
 class NotionConfig(BaseModel):
     """Notion integration configuration."""
 
+    model_config = ConfigDict(frozen=True)
+
     api_key: str = Field(..., description="Notion API key")
     database_id: str = Field(..., description="Notion database ID")
 
@@ -66,6 +76,8 @@ class AnthropicConfig(BaseModel):
     in CI/CD environments.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     api_key: str | None = Field(
         default=None,
         description="Anthropic API key (can also use ANTHROPIC_API_KEY env var)",
@@ -91,6 +103,8 @@ class AnthropicConfig(BaseModel):
 class CloudSyncConfig(BaseModel):
     """Cloud sync settings for AWS state synchronization."""
 
+    model_config = ConfigDict(frozen=True)
+
     enabled: bool = Field(default=False, description="Whether to sync state to AWS")
     sync_mode: Literal["immediate", "batch", "manual"] = Field(
         default="immediate",
@@ -101,6 +115,8 @@ class CloudSyncConfig(BaseModel):
 class DefaultsConfig(BaseModel):
     """Default settings."""
 
+    model_config = ConfigDict(frozen=True)
+
     report_dir: Path = Field(
         default=Path("./reports"), description="Directory for generated reports"
     )
@@ -143,38 +159,31 @@ class AppConfig(BaseModel):
     )
     defaults: DefaultsConfig = Field(default_factory=DefaultsConfig)
 
-    @field_validator("jira", mode="before")
-    @classmethod
-    def validate_jira_config(cls, v: Any, info: Any) -> Any:
-        """Validate Jira config is present when provider is jira."""
-        # This is called before the model is fully constructed
-        # Full validation happens in model_validator
-        return v
-
-    @field_validator("notion", mode="before")
-    @classmethod
-    def validate_notion_config(cls, v: Any, info: Any) -> Any:
-        """Validate Notion config is present when provider is notion."""
-        return v
-
     def get_provider_config(self) -> JiraConfig | NotionConfig | None:
-        """Get the active provider configuration."""
-        if self.provider == "jira":
-            if not self.jira:
-                raise ValueError("Jira configuration required when provider is 'jira'")
-            return self.jira
-        elif self.provider == "notion":
-            if not self.notion:
-                raise ValueError("Notion configuration required when provider is 'notion'")
-            return self.notion
-        else:
-            # provider == "none" - reports only mode
+        """Get the active provider configuration.
+
+        The provider section is only required here rather than when the
+        config is loaded, so commands that never reach the issue tracker
+        still work while it is missing (e.g. ISSUE_PROVIDER set in the
+        environment ahead of its credentials).
+
+        Raises:
+            ValueError: If the section for the selected provider is missing
+        """
+        if self.provider == "none":
+            # Reports only mode
             return None
-
-    class Config:
-        """Pydantic model configuration."""
-
-        json_schema_extra = {
+        provider_config = self.jira if self.provider == "jira" else self.notion
+        if provider_config is None:
+            raise ValueError(
+                f"{self.provider.capitalize()} configuration required "
+                f"when provider is '{self.provider}'"
+            )
+        return provider_config
+
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "trace_source": "langsmith",
                 "langsmith": {
@@ -212,4 +221,5 @@ class AppConfig(BaseModel):
                     "cloud_sync": {"enabled": False, "sync_mode": "immediate"},
                 },
             }
-        }
+        },
+    )
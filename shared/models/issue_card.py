@@ -5,15 +5,41 @@ when creating tickets in Jira or Notion. It supports all 9 required fields
 as specified in the architecture document.
 """
 
-from datetime import datetime
-from typing import Literal
+from datetime import UTC, datetime
+from typing import Literal, get_args
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# Issue card enumerations, shared with code that builds cards
+Priority = Literal["CRITICAL", "HIGH", "MEDIUM", "LOW"]
+Category = Literal[
+    "BUG",
+    "PERFORMANCE",
+    "OPTIMIZATION",
+    "FEATURE_IDEA",
+    "DOCUMENTATION",
+    "UI_UX",
+    "TECHNICAL_DEBT",
+    "ERROR",
+    "QUALITY",
+    "SECURITY",
+]
+
+# Allowed values, for membership checks outside the model
+PRIORITIES: frozenset[str] = frozenset(get_args(Priority))
+CATEGORIES: frozenset[str] = frozenset(get_args(Category))
+
+
+def _utcnow() -> datetime:
+    """Get the current time as a timezone-aware UTC datetime."""
+    return datetime.now(UTC)
 
 
 class AffectedCode(BaseModel):
     """Reference to affected code location with improvement suggestions."""
 
+    model_config = ConfigDict(frozen=True)
+
     file: str | None = Field(default=None, description="File path")
     lines: str | None = Field(default=None, description="Line range (e.g., '145-180')")
     component: str | None = Field(default=None, description="Component or class name")
@@ -26,6 +52,8 @@ class AffectedCode(BaseModel):
 class Sources(BaseModel):
     """Thread and run references for traceability."""
 
+    model_config = ConfigDict(frozen=True)
+
     thread_id: str = Field(..., description="LangSmith thread UUID")
     thread_name: str = Field(..., description="Human-readable thread name")
     run_id: str | None = Field(default=None, description="LangSmith run UUID")
@@ -37,6 +65,8 @@ class Sources(BaseModel):
 class EvaluationResult(BaseModel):
     """Result from a single evaluation tool."""
 
+    model_config = ConfigDict(frozen=True)
+
     tool: str = Field(..., description="Name of the evaluation tool")
     status: Literal["pass", "warning", "fail", "error"] = Field(
         ..., description="Evaluation outcome"
@@ -66,21 +96,8 @@ class IssueCard(BaseModel):
 
     # Required fields (1-9 as per requirements)
     title: str = Field(..., min_length=1, description="Issue title")
-    priority: Literal["CRITICAL", "HIGH", "MEDIUM", "LOW"] = Field(
-        default="MEDIUM", description="Issue priority level"
-    )
-    category: Literal[
-        "BUG",
-        "PERFORMANCE",
-        "OPTIMIZATION",
-        "FEATURE_IDEA",
-        "DOCUMENTATION",
-        "UI_UX",
-        "TECHNICAL_DEBT",
-        "ERROR",
-        "QUALITY",
-        "SECURITY",
-    ] = Field(..., description="Issue category classification")
+    priority: Priority = Field(default="MEDIUM", description="Issue priority level")
+    category: Category = Field(..., description="Issue category classification")
     status: str = Field(default="BACKLOG", description="Issue workflow status")
     details: str = Field(..., description="Detailed issue description with context")
     description: str = Field(..., description="Brief summary of the issue")
@@ -94,13 +111,12 @@ class IssueCard(BaseModel):
     evaluation_results: list[EvaluationResult] = Field(
         default_factory=list, description="Results from evaluation tools"
     )
-    created_at: datetime = Field(default_factory=datetime.utcnow, description="Creation timestamp")
+    created_at: datetime = Field(default_factory=_utcnow, description="Creation timestamp")
     issue_id: str | None = Field(default=None, description="Generated issue ID (e.g., IA-001)")
 
-    class Config:
-        """Pydantic model configuration."""
-
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "title": "High Latency in Thread: User Query Processing",
                 "priority": "HIGH",
@@ -126,4 +142,5 @@ class IssueCard(BaseModel):
                     {"tool": "latency_evaluation", "status": "fail", "score": 0.3}
                 ],
             }
-        }
+        },
+    )
@@ -1,5 +1,6 @@
 """Shared utilities."""
 
 from shared.utils.logging import get_logger, setup_logging
+from shared.utils.serialization import dumps, loads
 
-__all__ = ["setup_logging", "get_logger"]
+__all__ = ["setup_logging", "get_logger", "dumps", "loads"]
@@ -0,0 +1,58 @@
+"""JSON serialization helpers.
+
+Uses orjson when it is installed (``pip install geniable[speedups]``) and
+falls back to the standard library otherwise. Both paths produce bytes so
+callers can write straight to binary streams or HTTP bodies.
+"""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on optional extra
+    orjson = None  # type: ignore[assignment]
+
+
+def dumps(
+    obj: Any,
+    indent: bool = False,
+    default: Callable[[Any], Any] | None = str,
+    sort_keys: bool = False,
+) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with two-space indentation
+        default: Fallback for values that are not natively serializable
+        sort_keys: Sort dict keys, so equal objects serialize identically
+
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=default, option=option)
+    return json.dumps(
+        obj,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+        default=default,
+        ensure_ascii=False,
+        sort_keys=sort_keys,
+    ).encode()
+
+
+def loads(data: str | bytes | bytearray) -> Any:
+    """Deserialize a JSON document from str or bytes.
+
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,60 @@
+"""Tests for building the agent configuration."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from agent.agent import AgentConfig
+from shared.models.config import AppConfig
+
+
+def _app_config(**extra: object) -> AppConfig:
+    return AppConfig.model_validate(
+        {
+            "langsmith": {"api_key": "ls_key", "project": "proj", "queue": "review"},
+            "aws": {
+                "region": "us-east-1",
+                "integration_endpoint": "https://integration.example.com",
+                "evaluation_endpoint": "https://evaluation.example.com",
+                "api_key": "gw_key",
+            },
+            **extra,
+        }
+    )
+
+
+class TestFromAppConfig:
+    """Tests for AgentConfig.from_app_config."""
+
+    def test_maps_services_and_provider(self) -> None:
+        config = _app_config(
+            provider="jira",
+            jira={
+                "base_url": "https://example.atlassian.net",
+                "email": "dev@example.com",
+                "api_token": "token",
+                "project_key": "PROJ",
+            },
+        )
+
+        agent_config = AgentConfig.from_app_config(config, auth_token="jwt")
+
+        assert agent_config.integration_endpoint == "https://integration.example.com"
+        assert agent_config.evaluation_endpoint == "https://evaluation.example.com"
+        assert agent_config.api_key == "gw_key"
+        assert agent_config.auth_token == "jwt"
+        assert agent_config.provider == "jira"
+        assert agent_config.project == "proj"
+        assert agent_config.report_dir == Path("./reports")
+        assert agent_config.jira_project_key == "PROJ"
+        assert agent_config.notion_database_id is None
+        assert not agent_config.ci_mode
+
+    def test_overrides(self) -> None:
+        agent_config = AgentConfig.from_app_config(
+            _app_config(provider="none"), provider="notion", ci_mode=True
+        )
+
+        assert agent_config.provider == "notion"
+        assert agent_config.ci_mode
+        assert agent_config.jira_project_key is None
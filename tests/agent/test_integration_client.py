@@ -0,0 +1,105 @@
+"""Tests for the Integration Service client."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from agent.api_clients.integration_client import IntegrationServiceClient, ThreadData
+
+
+def _response(payload: dict, status_code: int = 200) -> MagicMock:
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = payload
+    if status_code >= 400:
+        response.raise_for_status.side_effect = requests.HTTPError(response=response)
+    return response
+
+
+@pytest.fixture()
+def client() -> IntegrationServiceClient:
+    client = IntegrationServiceClient(endpoint="https://api.example.com/prod/")
+    client._session = MagicMock()
+    return client
+
+
+class TestFetchThreads:
+    """Tests for fetch_threads."""
+
+    def test_details_keep_summary_order(self, client: IntegrationServiceClient) -> None:
+        summaries = [{"thread_id": f"t{i}", "name": "summary"} for i in range(12)]
+        client._session.get.return_value = _response(
+            {"threads": summaries, "pagination": {"total": 15, "returned": 12}}
+        )
+        client.get_thread_details = MagicMock(  # type: ignore[method-assign]
+            side_effect=lambda tid: ThreadData({"thread_id": tid, "name": "details"})
+        )
+
+        result = client.fetch_threads(limit=12)
+
+        assert [t.thread_id for t in result.threads] == [f"t{i}" for i in range(12)]
+        assert all(t.name == "details" for t in result.threads)
+        assert (result.total_in_queue, result.returned, result.skipped) == (15, 12, 3)
+
+    def test_failed_details_fall_back_to_summary(self, client: IntegrationServiceClient) -> None:
+        client._session.get.return_value = _response(
+            {"threads": [{"thread_id": "t1", "name": "summary"}]}
+        )
+        client.get_thread_details = MagicMock(  # type: ignore[method-assign]
+            side_effect=RuntimeError("boom")
+        )
+
+        result = client.fetch_threads(limit=1)
+
+        assert [t.name for t in result.threads] == ["summary"]
+
+    def test_progress_reports_every_thread(self, client: IntegrationServiceClient) -> None:
+        summaries = [{"thread_id": f"t{i}"} for i in range(3)]
+        client._session.get.return_value = _response({"threads": summaries})
+        client.get_thread_details = MagicMock(  # type: ignore[method-assign]
+            side_effect=lambda tid: ThreadData({"thread_id": tid})
+        )
+        calls: list[tuple[str, int, int, str]] = []
+
+        client.fetch_threads(limit=3, progress_callback=lambda *args: calls.append(args))
+
+        details = [c for c in calls if c[0] == "details"]
+        assert [c[1] for c in details] == [0, 1, 2, 3]
+        assert {c[3] for c in details[1:]} == {"t0", "t1", "t2"}
+        assert calls[-1] == ("complete", 3, 3, "")
+
+
+class TestFetchThread:
+    """Tests for fetch_thread."""
+
+    def test_returns_single_thread(self, client: IntegrationServiceClient) -> None:
+        client._session.get.return_value = _response({"thread_id": "abc"})
+
+        result = client.fetch_thread("abc")
+
+        assert [t.thread_id for t in result.threads] == ["abc"]
+        client._session.get.assert_called_once()
+        assert client._session.get.call_args.args[0].endswith("/threads/abc/details")
+
+    def test_not_found_returns_empty(self, client: IntegrationServiceClient) -> None:
+        client._session.get.return_value = _response({}, status_code=404)
+
+        assert client.fetch_thread("missing").threads == []
+
+
+class TestCreateTicket:
+    """Tests for create_ticket."""
+
+    def test_raw_issue_json_is_sent_verbatim(self, client: IntegrationServiceClient) -> None:
+        client._session.post.return_value = _response({"success": True, "issue_key": "P-1"})
+
+        result = client.create_ticket(provider="jira", raw_issue_json=b'{"title":"T"}')
+
+        kwargs = client._session.post.call_args.kwargs
+        assert "json" not in kwargs
+        assert json.loads(kwargs["data"]) == {"provider": "jira", "issue": {"title": "T"}}
+        assert result["issue_key"] == "P-1"
@@ -0,0 +1,97 @@
+"""Tests for the local processing state manager."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+from agent.state_manager import StateManager
+
+
+def _manager(tmp_path: Path) -> StateManager:
+    return StateManager(project="test-project", state_dir=str(tmp_path))
+
+
+class TestProcessedIds:
+    """Tests for processed thread ID lookups."""
+
+    def test_new_state_has_no_processed_threads(self, tmp_path: Path) -> None:
+        manager = _manager(tmp_path)
+        assert manager.processed_ids_set() == set()
+        assert not manager.is_processed("thread-1")
+
+    def test_record_processing_updates_set(self, tmp_path: Path) -> None:
+        manager = _manager(tmp_path)
+        manager.processed_ids_set()
+
+        manager.record_processing(thread_id="thread-1", name="Thread 1", status="success")
+
+        assert manager.is_processed("thread-1")
+        assert manager.load().processed_thread_ids == ["thread-1"]
+
+    def test_processed_ids_loaded_from_file(self, tmp_path: Path) -> None:
+        _manager(tmp_path).record_processing(thread_id="thread-1", name="T", status="success")
+
+        manager = _manager(tmp_path)
+        assert manager.is_processed("thread-1")
+        assert manager.get_unprocessed_threads(["thread-1", "thread-2"]) == ["thread-2"]
+
+    def test_clear_state_resets_set(self, tmp_path: Path) -> None:
+        manager = _manager(tmp_path)
+        manager.record_processing(thread_id="thread-1", name="T", status="success")
+
+        manager.clear_state()
+
+        assert not manager.is_processed("thread-1")
+
+
+class TestProcessingHistory:
+    """Tests for per-thread processing history lookups."""
+
+    def test_history_for_unknown_thread_is_empty(self, tmp_path: Path) -> None:
+        assert _manager(tmp_path).get_processing_history("missing") == []
+
+    def test_rerecording_replaces_entry(self, tmp_path: Path) -> None:
+        manager = _manager(tmp_path)
+        manager.record_processing(thread_id="thread-1", name="T1", status="error")
+        manager.record_processing(thread_id="thread-2", name="T2", status="success")
+        manager.record_processing(thread_id="thread-1", name="T1", status="success")
+
+        history = manager.get_processing_history("thread-1")
+
+        assert [h.status for h in history] == ["success"]
+        assert [h.thread_id for h in manager.get_processing_history()] == [
+            "thread-1",
+            "thread-2",
+        ]
+
+    def test_history_loaded_from_file(self, tmp_path: Path) -> None:
+        _manager(tmp_path).record_processing(
+            thread_id="thread-1", name="T1", status="success", documentation_path="r.md"
+        )
+
+        history = _manager(tmp_path).get_processing_history("thread-1")
+
+        assert [h.documentation_path for h in history] == ["r.md"]
+
+
+class TestStateFileCache:
+    """Tests for reuse of parsed state files across instances."""
+
+    def test_unchanged_file_is_parsed_once(self, tmp_path: Path) -> None:
+        _manager(tmp_path).record_processing(thread_id="thread-1", name="T", status="success")
+        first = _manager(tmp_path)
+        first.load()
+
+        with patch("agent.state_manager.json.loads") as loads:
+            second = _manager(tmp_path)
+            assert second.is_processed("thread-1")
+        loads.assert_not_called()
+
+    def test_clear_state_is_seen_by_new_instances(self, tmp_path: Path) -> None:
+        _manager(tmp_path).record_processing(thread_id="thread-1", name="T", status="success")
+        assert _manager(tmp_path).get_stats()["total_processed"] == 1
+
+        _manager(tmp_path).clear_state()
+
+        assert _manager(tmp_path).get_stats()["total_processed"] == 0
@@ -0,0 +1,226 @@
+"""Tests for the short-lived authentication check cache."""
+
+from __future__ import annotations
+
+import base64
+import json
+import os
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from cli import auth
+from cli.auth import AuthTokens, clear_auth_cache, has_recent_auth, record_auth_ok
+
+
+@pytest.fixture(autouse=True)
+def cache_file(tmp_path: Path):
+    """Point the auth cache at a temporary file."""
+    path = tmp_path / "cache" / "auth_ok.json"
+    with patch.object(auth, "AUTH_CACHE_FILE", path):
+        yield path
+
+
+def _tokens(expires_in: timedelta = timedelta(hours=1)) -> AuthTokens:
+    return AuthTokens(
+        access_token="access",
+        id_token="id",
+        refresh_token="refresh",
+        expires_at=datetime.now(UTC) + expires_in,
+        user_id="user",
+        email="user@example.com",
+    )
+
+
+class TestAuthCache:
+    """Tests for has_recent_auth/record_auth_ok."""
+
+    def test_no_record(self) -> None:
+        assert not has_recent_auth(None)
+
+    def test_recent_record(self) -> None:
+        record_auth_ok(_tokens(), None)
+        assert has_recent_auth(None)
+
+    def test_stale_record(self, cache_file: Path) -> None:
+        record_auth_ok(_tokens(), None)
+        data = json.loads(cache_file.read_text())
+        data["authenticated_at"] = time.time() - 600
+        cache_file.write_text(json.dumps(data))
+
+        assert not has_recent_auth(None, ttl=300)
+
+    def test_tokens_near_expiry(self) -> None:
+        record_auth_ok(_tokens(expires_in=timedelta(minutes=2)), None)
+        assert not has_recent_auth(None)
+
+    def test_token_file_changed(self) -> None:
+        record_auth_ok(_tokens(), None)
+        assert not has_recent_auth(123.0)
+
+    def test_clear(self) -> None:
+        record_auth_ok(_tokens(), None)
+        clear_auth_cache()
+        assert not has_recent_auth(None)
+
+
+class TestIsAuthenticated:
+    """Tests for CognitoAuthClient.is_authenticated."""
+
+    @pytest.fixture()
+    def client(self, tmp_path: Path):
+        client = auth.get_auth_client(use_keyring=False)
+        client._token_storage = auth.TokenStorage(
+            use_keyring=False, config_dir=str(tmp_path / "geniable")
+        )
+        yield client
+        auth._TOKEN_CACHE.pop(client._token_storage.config_dir, None)
+
+    def test_recent_record_skips_token_store(self, client: auth.CognitoAuthClient) -> None:
+        record_auth_ok(_tokens(), None)
+
+        with patch.object(client._token_storage, "get_tokens") as get_tokens:
+            assert client.is_authenticated()
+        get_tokens.assert_not_called()
+
+    def test_valid_tokens_are_recorded(self, client: auth.CognitoAuthClient) -> None:
+        with patch.object(client._token_storage, "get_tokens", return_value=_tokens()):
+            assert client.is_authenticated()
+        assert has_recent_auth(None)
+
+    def test_no_tokens(self, client: auth.CognitoAuthClient) -> None:
+        with patch.object(client._token_storage, "get_tokens", return_value=None):
+            assert not client.is_authenticated()
+        assert not has_recent_auth(None)
+
+    def test_watches_own_token_file(self, client: auth.CognitoAuthClient) -> None:
+        record_auth_ok(_tokens(), None)
+        client._token_storage.store_tokens(_tokens())
+
+        with patch.object(client._token_storage, "get_tokens", return_value=None) as get_tokens:
+            assert not client.is_authenticated()
+        get_tokens.assert_called_once()
+
+
+class TestTokenExpiry:
+    """Tests for AuthTokens expiry helpers."""
+
+    def test_seconds_until_expiry(self) -> None:
+        remaining = _tokens(timedelta(minutes=10)).seconds_until_expiry()
+
+        assert remaining is not None
+        assert 590 < remaining <= 600
+
+    def test_naive_expiry_is_treated_as_utc(self) -> None:
+        tokens = _tokens()
+        tokens.expires_at = (datetime.now(UTC) + timedelta(hours=1)).replace(tzinfo=None)
+
+        assert not tokens.is_expired()
+
+    def test_within_buffer_is_expired(self) -> None:
+        assert _tokens(timedelta(minutes=4)).is_expired()
+        assert _tokens(timedelta(minutes=-1)).is_expired()
+
+    def test_unknown_expiry(self) -> None:
+        tokens = _tokens()
+        tokens.expires_at = None
+
+        assert tokens.seconds_until_expiry() is None
+        assert tokens.is_expired()
+
+
+class TestTokenStorageCache:
+    """Tests for reusing tokens read from storage within a process."""
+
+    @pytest.fixture()
+    def storage(self, tmp_path: Path):
+        storage = auth.TokenStorage(use_keyring=False, config_dir=str(tmp_path / "geniable"))
+        yield storage
+        auth._TOKEN_CACHE.pop(storage.config_dir, None)
+
+    def test_reuses_tokens_until_file_changes(self, storage: auth.TokenStorage) -> None:
+        storage.store_tokens(_tokens())
+
+        with patch("builtins.open") as open_:
+            cached = storage.get_tokens()
+
+        open_.assert_not_called()
+        assert cached is not None
+        assert cached.email == "user@example.com"
+
+        token_file = Path(storage.config_dir) / "tokens.json"
+        data = json.loads(token_file.read_text())
+        data["email"] = "other@example.com"
+        token_file.write_text(json.dumps(data))
+        stat = token_file.stat()
+        os.utime(token_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        tokens = storage.get_tokens()
+        assert tokens is not None
+        assert tokens.email == "other@example.com"
+
+    def test_expired_tokens_are_reread(self, storage: auth.TokenStorage) -> None:
+        storage.store_tokens(_tokens(timedelta(minutes=1)))
+
+        with patch("builtins.open", side_effect=OSError("read")), pytest.raises(OSError):
+            storage.get_tokens()
+
+    def test_clear(self, storage: auth.TokenStorage) -> None:
+        storage.store_tokens(_tokens())
+        storage.clear_tokens()
+
+        assert storage.get_tokens() is None
+
+
+def _jwt(claims: dict) -> str:
+    payload = base64.urlsafe_b64encode(json.dumps(claims).encode()).rstrip(b"=").decode()
+    return f"header.{payload}.signature"
+
+
+class TestDecodeJwtPayload:
+    """Tests for decode_jwt_payload."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_claims_cache(self):
+        auth._CLAIMS_CACHE.clear()
+        yield
+        auth._CLAIMS_CACHE.clear()
+
+    def test_decodes_unpadded_payload(self) -> None:
+        token = _jwt({"sub": "user-1", "email": "a@example.com"})
+
+        assert auth.decode_jwt_payload(token) == {"sub": "user-1", "email": "a@example.com"}
+
+    def test_reuses_decoded_claims(self) -> None:
+        token = _jwt({"sub": "user-2"})
+
+        first = auth.decode_jwt_payload(token)
+        with patch.object(auth, "loads") as loads:
+            assert auth.decode_jwt_payload(token) is first
+        loads.assert_not_called()
+
+    def test_malformed_token(self) -> None:
+        with pytest.raises(ValueError, match="Malformed JWT"):
+            auth.decode_jwt_payload("not-a-jwt")
+
+    def test_cache_expires_at_exp(self) -> None:
+        exp = int(time.time()) + 60
+        token = _jwt({"sub": "user-3", "exp": exp})
+
+        auth.decode_jwt_payload(token)
+        assert [len(key) for key in auth._CLAIMS_CACHE] == [16]
+        with (
+            patch.object(auth.time, "time", return_value=exp + 1),
+            patch.object(auth, "loads", wraps=auth.loads) as loads,
+        ):
+            assert auth.decode_jwt_payload(token)["sub"] == "user-3"
+        loads.assert_called_once()
+        assert auth._CLAIMS_CACHE == {}
+
+    def test_expired_token_is_not_cached(self) -> None:
+        auth.decode_jwt_payload(_jwt({"sub": "user-4", "exp": int(time.time()) - 1}))
+
+        assert auth._CLAIMS_CACHE == {}
@@ -0,0 +1,60 @@
+"""Tests for the login/logout/whoami commands."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+from typer.testing import CliRunner
+
+from cli.commands.auth import app
+
+runner = CliRunner()
+
+
+def _auth_client(authenticated: bool) -> MagicMock:
+    client = MagicMock()
+    client.is_authenticated.return_value = authenticated
+    return client
+
+
+class TestLogout:
+    """Tests for geni logout."""
+
+    def test_not_logged_in(self) -> None:
+        client = _auth_client(authenticated=False)
+
+        with patch("cli.auth.get_auth_client", return_value=client):
+            result = runner.invoke(app, ["logout"])
+
+        assert result.exit_code == 0
+        assert "Not currently logged in" in result.output
+        client.logout.assert_not_called()
+
+    def test_logs_out_and_clears_caches(self) -> None:
+        client = _auth_client(authenticated=True)
+
+        with (
+            patch("cli.auth.get_auth_client", return_value=client),
+            patch("cli.secrets_manager.clear_secret_cache") as clear_secret_cache,
+            patch("cli.wizard.clear_sync_hash") as clear_sync_hash,
+        ):
+            result = runner.invoke(app, ["logout"])
+
+        assert result.exit_code == 0
+        client.logout.assert_called_once()
+        clear_secret_cache.assert_called_once()
+        clear_sync_hash.assert_called_once()
+
+
+class TestWhoami:
+    """Tests for geni whoami."""
+
+    def test_not_logged_in(self) -> None:
+        with (
+            patch("cli.auth.get_auth_client", return_value=_auth_client(authenticated=False)),
+            patch("cli.commands.auth.ensure_skills_installed"),
+        ):
+            result = runner.invoke(app, ["whoami"])
+
+        assert result.exit_code == 1
+        assert "Not logged in" in result.output
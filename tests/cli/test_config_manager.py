@@ -0,0 +1,189 @@
+"""Tests for the configuration manager."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from cli.config_manager import ConfigManager, build_service_config_dict
+
+CONFIG_YAML = """\
+langsmith:
+  api_key: "ls_file_key"
+  project: "proj"
+  queue: "review"
+aws:
+  region: "us-east-1"
+  integration_endpoint: "https://integration.example.com"
+  evaluation_endpoint: "https://evaluation.example.com"
+provider: "none"
+"""
+
+
+@pytest.fixture()
+def config_path(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.delenv("LANGSMITH_API_KEY", raising=False)
+    path = tmp_path / "geniable.yaml"
+    path.write_text(CONFIG_YAML)
+    return path
+
+
+class TestLoad:
+    """Tests for ConfigManager.load."""
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        manager = ConfigManager(config_path=tmp_path / "missing.yaml")
+
+        with pytest.raises(FileNotFoundError, match="geni configure"):
+            manager.load()
+
+    def test_reuses_config_until_file_changes(self, config_path: Path) -> None:
+        manager = ConfigManager(config_path=config_path)
+
+        first = manager.load()
+        assert manager.load() is first
+
+        config_path.write_text(CONFIG_YAML.replace("ls_file_key", "ls_new_key"))
+        stat = config_path.stat()
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        reloaded = manager.load()
+        assert reloaded is not first
+        assert reloaded.langsmith.api_key == "ls_new_key"
+
+
+class TestEnvOverrides:
+    """Tests for environment variable overrides."""
+
+    @pytest.fixture(autouse=True)
+    def _clean_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        for name in ("ISSUE_PROVIDER", "JIRA_API_TOKEN", "NOTION_API_KEY", "LANGFUSE_PUBLIC_KEY"):
+            monkeypatch.delenv(name, raising=False)
+
+    def test_section_and_top_level_overrides(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("LANGSMITH_API_KEY", "ls_env")
+        monkeypatch.setenv("ISSUE_PROVIDER", "jira")
+        monkeypatch.setenv("JIRA_API_TOKEN", "jira_env")
+        monkeypatch.setenv("NOTION_API_KEY", "notion_env")
+
+        config = ConfigManager()._apply_env_overrides({"langsmith": {"api_key": "ls_file"}})
+
+        assert config["langsmith"]["api_key"] == "ls_env"
+        assert config["provider"] == "jira"
+        assert config["jira"] == {"api_token": "jira_env"}
+        assert "notion" not in config
+        assert "langfuse" not in config
+        assert "aws" in config
+
+    def test_empty_values_are_ignored(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setenv("LANGSMITH_API_KEY", "")
+
+        config = ConfigManager()._apply_env_overrides({"langsmith": {"api_key": "ls_file"}})
+
+        assert config["langsmith"]["api_key"] == "ls_file"
+
+
+class TestSaveConfig:
+    """Tests for writing the wizard config to YAML."""
+
+    def test_round_trip(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.delenv("LANGSMITH_API_KEY", raising=False)
+        monkeypatch.delenv("JIRA_API_TOKEN", raising=False)
+        monkeypatch.delenv("ISSUE_PROVIDER", raising=False)
+        wizard_config = {
+            "langsmith": {"api_key": "ls_key", "project": "proj", "queue": "review"},
+            "aws": {
+                "region": "us-east-1",
+                "integration_endpoint": "https://integration.example.com",
+                "evaluation_endpoint": "https://evaluation.example.com",
+            },
+            "provider": "jira",
+            "jira": {
+                "base_url": "https://example.atlassian.net",
+                "email": "dev@example.com",
+                "api_token": "token",
+                "project_key": "PROJ",
+                "issue_type": "Bug",
+            },
+        }
+
+        path = ConfigManager.save_config(wizard_config, tmp_path / "geniable.yaml")
+        config = ConfigManager(config_path=path).load()
+
+        assert path.read_text().startswith("# Geniable Configuration\n")
+        assert config.langsmith.queue == "review"
+        assert config.aws.api_key == ""
+        assert config.jira is not None
+        assert config.jira.issue_type == "Bug"
+        assert config.defaults.log_level == "INFO"
+
+
+class TestValidatedConfigCache:
+    """Tests for reuse of validated configs across ConfigManager instances."""
+
+    def test_shared_between_instances(self, config_path: Path) -> None:
+        first = ConfigManager(config_path=config_path).load()
+
+        assert ConfigManager(config_path=config_path).load() is first
+
+    def test_shared_config_is_read_only(self, config_path: Path) -> None:
+        config = ConfigManager(config_path=config_path).load()
+
+        with pytest.raises(ValidationError):
+            config.langsmith.queue = "other"
+
+    def test_env_override_change_revalidates(
+        self, config_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        first = ConfigManager(config_path=config_path).load()
+        monkeypatch.setenv("LANGSMITH_API_KEY", "ls_env_key")
+
+        config = ConfigManager(config_path=config_path).load()
+
+        assert config is not first
+        assert config.langsmith.api_key == "ls_env_key"
+
+
+class TestExists:
+    """Tests for ConfigManager.exists."""
+
+    def test_exists_then_load(self, config_path: Path) -> None:
+        manager = ConfigManager(config_path=config_path)
+
+        assert manager.exists()
+        assert manager.load().langsmith.queue == "review"
+
+    def test_missing(self, tmp_path: Path) -> None:
+        assert not ConfigManager(config_path=tmp_path / "missing.yaml").exists()
+
+
+class TestBuildServiceConfigDict:
+    """Tests for build_service_config_dict."""
+
+    def test_with_endpoints(self, config_path: Path) -> None:
+        config = ConfigManager(config_path=config_path).load()
+
+        config_dict = build_service_config_dict(config, include_endpoints=True)
+
+        assert config_dict == {
+            "langsmith": {"api_key": "ls_file_key"},
+            "provider": "none",
+            "aws": {
+                "integration_endpoint": "https://integration.example.com",
+                "evaluation_endpoint": "https://evaluation.example.com",
+                "api_key": None,
+            },
+        }
+
+    def test_without_endpoints(self, config_path: Path) -> None:
+        config = ConfigManager(config_path=config_path).load()
+
+        config_dict = build_service_config_dict(config, include_endpoints=False)
+
+        assert config_dict == {
+            "langsmith": {"api_key": "ls_file_key", "project": "proj", "queue": "review"},
+            "provider": "none",
+        }
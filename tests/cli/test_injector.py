@@ -0,0 +1,78 @@
+"""Tests for agent code injection."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from cli import injector
+
+
+@pytest.fixture()
+def sources(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Create small agent/shared source trees and point the injector at them."""
+    src = tmp_path / "src"
+    (src / "agent" / "tools").mkdir(parents=True)
+    (src / "agent" / "__init__.py").write_text("")
+    (src / "agent" / "tools" / "tool.py").write_text("")
+    (src / "agent" / "__pycache__").mkdir()
+    (src / "agent" / "__pycache__" / "tool.cpython-311.pyc").write_bytes(b"")
+    (src / "shared").mkdir()
+    (src / "shared" / "models.py").write_text("")
+    (src / "shared" / "README.md").write_text("")
+
+    monkeypatch.setattr(injector, "get_agent_source_dir", lambda: src / "agent")
+    monkeypatch.setattr(injector, "get_shared_source_dir", lambda: src / "shared")
+    return src
+
+
+@pytest.mark.usefixtures("sources")
+class TestInjectAgentCode:
+    """Tests for inject_agent_code."""
+
+    def test_copies_agent_and_shared(self, tmp_path: Path) -> None:
+        target = tmp_path / "project"
+
+        results = injector.inject_agent_code(target)
+
+        assert results["errors"] == []
+        assert results["files_copied"] == 3
+        assert (target / "agent" / "tools" / "tool.py").exists()
+        assert (target / "shared" / "README.md").exists()
+        assert not (target / "agent" / "__pycache__").exists()
+
+    def test_shared_inside_agent_target(self, tmp_path: Path) -> None:
+        target = tmp_path / "agent"
+
+        results = injector.inject_agent_code(target)
+
+        assert results["errors"] == []
+        assert results["files_copied"] == 3
+        assert (target / "shared" / "models.py").exists()
+
+    def test_existing_target_requires_overwrite(self, tmp_path: Path) -> None:
+        target = tmp_path / "project"
+        (target / "agent").mkdir(parents=True)
+
+        with pytest.raises(FileExistsError):
+            injector.inject_agent_code(target)
+
+        results = injector.inject_agent_code(target, overwrite=True)
+        assert results["agent_dir"] == str(target / "agent")
+
+
+class TestCopyFile:
+    """Tests for _copy_file."""
+
+    def test_copies_content_and_mode(self, tmp_path: Path) -> None:
+        src = tmp_path / "script.py"
+        src.write_bytes(b"print('hi')\n" * 1000)
+        src.chmod(0o750)
+        dst = tmp_path / "copy.py"
+
+        injector._copy_file(str(src), str(dst))
+
+        assert dst.read_bytes() == src.read_bytes()
+        assert os.stat(dst).st_mode == os.stat(src).st_mode
@@ -0,0 +1,158 @@
+"""Tests for the top-level CLI application."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+import pytest
+from typer.testing import CliRunner
+
+from cli.main import app
+
+runner = CliRunner()
+
+
+class TestLazySubcommands:
+    """Tests for lazily registered subcommand groups."""
+
+    def test_import_does_not_load_subcommand_modules(self) -> None:
+        code = (
+            "import sys, cli.main; "
+            "print(sorted(m for m in sys.modules if m.startswith('cli.commands')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "[]"
+
+    def test_help_lists_subcommands(self) -> None:
+        result = runner.invoke(app, ["--help"])
+
+        assert result.exit_code == 0
+        for name in ("analyze", "ticket", "issues", "new"):
+            assert name in result.output
+        assert "Jira issue management" in result.output
+
+    def test_subcommand_group_loads_on_invoke(self) -> None:
+        result = runner.invoke(app, ["ticket", "--help"])
+
+        assert result.exit_code == 0
+        assert "create" in result.output
+
+    def test_lazy_command_loads_on_invoke(self) -> None:
+        result = runner.invoke(app, ["login", "--help"])
+
+        assert result.exit_code == 0
+        assert "--no-keyring" in result.output
+
+
+class TestVersionFastPath:
+    """Tests for the dependency-free version entry point."""
+
+    def test_version_skips_typer(self) -> None:
+        code = (
+            "import sys, cli.version_check as vc; "
+            "vc.check_for_updates = lambda: None; "
+            "sys.argv = ['geni', 'version']; "
+            "from cli.entry import main; main(); "
+            "print('typer' in sys.modules, 'rich' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        lines = result.stdout.splitlines()
+        assert lines[0].startswith("Geni v")
+        assert lines[1] == "QA Pipeline for LLM Applications"
+        assert lines[-1] == "False False"
+
+
+class TestSubcommandDispatch:
+    """Tests for running subcommand groups straight from the entry point."""
+
+    def test_group_runs_without_importing_main(self) -> None:
+        code = (
+            "import sys, cli.version_check as vc; "
+            "vc.check_for_updates = lambda: None; "
+            "sys.argv = ['geni', 'ticket', '--help']; "
+            "from cli.entry import main\n"
+            "try:\n    main()\nexcept SystemExit:\n    pass\n"
+            "print('cli.main' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert "create" in result.stdout
+        assert result.stdout.splitlines()[-1] == "False"
+
+    def test_lazy_command_runs_without_importing_main(self) -> None:
+        code = (
+            "import sys, cli.version_check as vc; "
+            "vc.check_for_updates = lambda: None; "
+            "sys.argv = ['geni', 'whoami', '--help']; "
+            "from cli.entry import main\n"
+            "try:\n    main()\nexcept SystemExit:\n    pass\n"
+            "print(sorted(m for m in sys.modules if m.startswith(('cli.main', 'cli.commands.'))))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert "authentication status" in result.stdout
+        assert result.stdout.splitlines()[-1] == "['cli.commands.auth']"
+
+
+class TestDispatchPathsAgree:
+    """Tests that cli.entry's lazy dispatch matches running through cli.main."""
+
+    @staticmethod
+    def _run(entry_module: str, args: list[str]) -> subprocess.CompletedProcess[str]:
+        code = (
+            "import sys, cli.version_check as vc; "
+            "vc.check_for_updates = lambda: print('update check'); "
+            f"sys.argv = ['geni', *{args!r}]; "
+            f"from {entry_module} import main\n"
+            "try:\n    main()\nexcept SystemExit as e:\n    print('exit', e.code)\n"
+        )
+        return subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={**os.environ, "COLUMNS": "100"},
+        )
+
+    @pytest.mark.parametrize(
+        "args", [["login", "--help"], ["analyze", "--help"], ["analyze", "fetch", "--help"]]
+    )
+    def test_same_output(self, args: list[str]) -> None:
+        via_entry = self._run("cli.entry", args)
+        via_main = self._run("cli.main", args)
+
+        assert via_entry.stdout == via_main.stdout
+        assert via_entry.stderr == via_main.stderr
+        assert "Usage: geni " in via_entry.stdout
+
+
+class TestStaticHelp:
+    """Tests for the pre-rendered `geni --help` output."""
+
+    def test_lists_every_command_with_its_help(self) -> None:
+        import typer
+
+        from cli.entry import _APP_HELP, _help_text
+
+        group = typer.main.get_command(app)
+        ctx = group.make_context("geni", [])
+        help_text = _help_text()
+
+        assert group.help == _APP_HELP
+        for name in group.list_commands(ctx):
+            _, command, _ = group.resolve_command(ctx, [name])
+            short_help = command.get_short_help_str(limit=200)
+            assert f"  {name}  " in help_text
+            assert short_help in help_text
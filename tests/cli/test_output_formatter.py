@@ -0,0 +1,96 @@
+"""Tests for CLI output formatting helpers."""
+
+from __future__ import annotations
+
+import pytest
+from rich.console import Console
+
+from cli import output_formatter
+
+
+@pytest.fixture()
+def console(monkeypatch: pytest.MonkeyPatch) -> Console:
+    """Capture output in a wide, non-terminal console."""
+    test_console = Console(record=True, width=200, force_terminal=False)
+    monkeypatch.setattr(output_formatter, "get_console", lambda: test_console)
+    return test_console
+
+
+class TestPrintConfig:
+    """Tests for print_config."""
+
+    def test_masks_sensitive_values(self, console: Console) -> None:
+        output_formatter.print_config(
+            {
+                "langsmith": {"API_KEY": "ls_secret_value", "project": "proj"},
+                "jira": {"api_token": "abc", "password": "hunter22"},
+            }
+        )
+
+        text = console.export_text()
+        assert "ls_s...****" in text
+        assert "ls_secret_value" not in text
+        assert "hunt...****" in text
+        assert "proj" in text
+        # Too short to partially reveal
+        assert "abc" in text
+
+
+class TestThreadLoadingProgress:
+    """Tests for ThreadLoadingProgress."""
+
+    def test_details_update_the_progress_task(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        console = Console(record=True, width=200, force_terminal=True)
+        monkeypatch.setattr(output_formatter, "get_console", lambda: console)
+
+        with output_formatter.ThreadLoadingProgress() as progress:
+            progress.start_details(4)
+            progress.update_details(3, "thread-abcdefghijklmnopqrstuvwxyz")
+            assert progress._progress is not None
+            task = progress._progress.tasks[0]
+            progress.complete()
+
+        assert task.completed == 3
+        assert task.total == 4
+        assert task.description == "Thread: thread-abcdefghijklm..."
+        assert "Loaded 4 threads" in console.export_text()
+
+    def test_plain_output_when_not_a_terminal(self, console: Console) -> None:
+        with output_formatter.ThreadLoadingProgress() as progress:
+            progress.start_summaries()
+            progress.start_details(4)
+            progress.update_details(1, "thread-1")
+            progress.complete()
+
+        assert progress._live is None
+        assert progress._progress is None
+        assert console.export_text() == "ℹ Loading details for 4 threads...\n✓ Loaded 4 threads\n"
+
+
+class TestPrintThreads:
+    """Tests for print_threads."""
+
+    def test_fills_missing_fields_and_truncates(self, console: Console) -> None:
+        threads = [{"thread_id": "abc", "duration_seconds": 1.25, "total_tokens": 1234}]
+        threads += [{"thread_id": f"t{i}"} for i in range(24)]
+
+        output_formatter.print_threads(threads)
+
+        text = console.export_text()
+        assert "1.2s" in text
+        assert "1,234" in text
+        assert "unknown" in text
+        assert "t18" in text
+        assert "t19" not in text
+        assert "(5 more)" in text
+
+
+class TestCreateProgress:
+    """Tests for create_progress."""
+
+    def test_indicators_do_not_share_columns(self, console: Console) -> None:
+        first = output_formatter.create_progress()
+        second = output_formatter.create_progress(transient=True)
+
+        assert not set(map(id, first.columns)) & set(map(id, second.columns))
+        assert first.console is console
@@ -0,0 +1,106 @@
+"""Tests for the local Secrets Manager lookup cache."""
+
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cli import secrets_manager
+from cli.secrets_manager import clear_secret_cache, get_cached_secret
+
+
+@pytest.fixture(autouse=True)
+def cache_file(tmp_path: Path):
+    """Point the secret cache at a temporary file."""
+    path = tmp_path / "cache" / "secrets.json"
+    with patch.object(secrets_manager, "SECRET_CACHE_FILE", path):
+        yield path
+
+
+def _client(value: dict[str, str] | None, region: str = "us-east-1") -> MagicMock:
+    client = MagicMock(region=region, secret_prefix="geniable")
+    client.get_secret.return_value = value
+    return client
+
+
+class TestGetCachedSecret:
+    """Tests for get_cached_secret."""
+
+    def test_miss_fetches_and_writes_cache(self, cache_file: Path) -> None:
+        client = _client({"api_key": "sk-ant-123"})
+
+        assert get_cached_secret("anthropic", client=client) == {"api_key": "sk-ant-123"}
+        client.get_secret.assert_called_once_with("anthropic")
+        assert cache_file.stat().st_mode & 0o777 == 0o600
+        assert json.loads(cache_file.read_text())["us-east-1:geniable/anthropic"]["value"] == {
+            "api_key": "sk-ant-123"
+        }
+
+    def test_fresh_entry_skips_secrets_manager(self) -> None:
+        get_cached_secret("anthropic", client=_client({"api_key": "sk-ant-123"}))
+        client = _client({"api_key": "other"})
+
+        assert get_cached_secret("anthropic", client=client) == {"api_key": "sk-ant-123"}
+        client.get_secret.assert_not_called()
+
+    def test_expired_entry_refetches(self, cache_file: Path) -> None:
+        cache_file.parent.mkdir(parents=True)
+        cache_file.write_text(
+            json.dumps(
+                {
+                    "us-east-1:geniable/anthropic": {
+                        "cached_at": time.time() - 7200,
+                        "value": {"api_key": "old"},
+                    }
+                }
+            )
+        )
+        client = _client({"api_key": "new"})
+
+        assert get_cached_secret("anthropic", ttl=3600, client=client) == {"api_key": "new"}
+        client.get_secret.assert_called_once()
+
+    def test_malformed_timestamp_is_stale(self, cache_file: Path) -> None:
+        cache_file.parent.mkdir(parents=True)
+        cache_file.write_text(
+            json.dumps(
+                {"us-east-1:geniable/anthropic": {"cached_at": "soon", "value": {"api_key": "x"}}}
+            )
+        )
+        client = _client({"api_key": "new"})
+
+        assert get_cached_secret("anthropic", client=client) == {"api_key": "new"}
+        assert get_cached_secret("anthropic", client=client) == {"api_key": "new"}
+        client.get_secret.assert_called_once()
+
+    def test_other_region_is_not_served(self) -> None:
+        get_cached_secret("anthropic", client=_client({"api_key": "sk-ant-123"}))
+        client = _client({"api_key": "other"}, region="eu-west-1")
+
+        assert get_cached_secret("anthropic", client=client) == {"api_key": "other"}
+        client.get_secret.assert_called_once_with("anthropic")
+
+    def test_missing_secret_is_not_cached(self, cache_file: Path) -> None:
+        assert get_cached_secret("anthropic", client=_client(None)) is None
+        assert not cache_file.exists()
+
+    def test_sync_invalidates_entry(self) -> None:
+        client = secrets_manager.SecretsManagerClient(region="us-east-1")
+        client._client = MagicMock()
+        client._client.get_secret_value.return_value = {"SecretString": '{"api_key": "old"}'}
+        get_cached_secret("anthropic", client=client)
+
+        client.sync_secret("anthropic", {"api_key": "new"})
+        client._secret_memo.clear()
+        client._client.get_secret_value.return_value = {"SecretString": '{"api_key": "new"}'}
+
+        assert get_cached_secret("anthropic", client=client) == {"api_key": "new"}
+
+    def test_clear_secret_cache(self, cache_file: Path) -> None:
+        get_cached_secret("anthropic", client=_client({"api_key": "sk-ant-123"}))
+        clear_secret_cache()
+        assert not cache_file.exists()
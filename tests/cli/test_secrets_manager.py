@@ -0,0 +1,289 @@
+"""Tests for the Secrets Manager client."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cli.secrets_manager import SecretsManagerClient, get_secrets_client
+
+
+def _client(existing: tuple[str, ...] = ()) -> tuple[SecretsManagerClient, MagicMock]:
+    client = SecretsManagerClient(region="us-east-1")
+    boto_client = MagicMock()
+    boto_client.get_paginator.return_value.paginate.return_value = [
+        {"SecretList": [{"Name": name} for name in existing]}
+    ]
+    client._client = boto_client
+    return client, boto_client
+
+
+class TestValidateConnection:
+    """Tests for SecretsManagerClient.validate_connection."""
+
+    def test_success_is_remembered(self) -> None:
+        client, boto_client = _client()
+
+        assert client.validate_connection()
+        assert client.validate_connection()
+        boto_client.list_secrets.assert_called_once()
+
+    def test_failure_is_retried_after_backoff(self) -> None:
+        client, boto_client = _client()
+        boto_client.list_secrets.side_effect = [RuntimeError("no credentials"), {}]
+
+        assert not client.validate_connection()
+        assert not client.validate_connection()
+        assert boto_client.list_secrets.call_count == 1
+
+        later = time.monotonic() + 11
+        with patch("cli.secrets_manager.time.monotonic", return_value=later):
+            assert client.validate_connection()
+        assert boto_client.list_secrets.call_count == 2
+
+
+class TestGetSecretsClient:
+    """Tests for get_secrets_client."""
+
+    def test_shared_per_region(self) -> None:
+        assert get_secrets_client("eu-west-1") is get_secrets_client("eu-west-1")
+        assert get_secrets_client("eu-west-1") is not get_secrets_client("us-west-2")
+        assert get_secrets_client("us-west-2").region == "us-west-2"
+
+
+class TestSyncUserConfig:
+    """Tests for SecretsManagerClient.sync_user_config."""
+
+    def test_writes_secret_and_dynamodb_item(self) -> None:
+        client, boto_client = _client(existing=("geniable/users/user-1",))
+        boto_client.put_secret_value.return_value = {"VersionId": "v1"}
+        config = {
+            "langsmith": {"api_key": "ls_key", "project": "proj", "queue": "review"},
+            "provider": "none",
+        }
+
+        with patch("boto3.session.Session") as session:
+            results = client.sync_user_config("user-1", "dev@example.com", config, "table")
+
+        assert [r.secret_name for r in results] == ["geniable/users/user-1", "table"]
+        assert all(r.success for r in results)
+        assert results[0].version_id == "v1"
+        table = session.return_value.resource.return_value.Table.return_value
+        item = table.put_item.call_args.kwargs["Item"]
+        assert item["pk"] == "USER#user-1"
+        assert item["langsmith"] == {"project": "proj", "queue": "review"}
+
+    def test_user_secret_does_not_list_other_secrets(self) -> None:
+        client, boto_client = _client()
+        config = {"langsmith": {"api_key": "ls_key"}, "provider": "none"}
+
+        with patch("boto3.session.Session"):
+            client.sync_user_config("user-1", "dev@example.com", config, "table")
+
+        boto_client.get_paginator.assert_not_called()
+        assert boto_client.put_secret_value.call_args.kwargs["SecretId"] == "geniable/users/user-1"
+
+    def test_no_secrets_only_writes_item(self) -> None:
+        client, boto_client = _client()
+
+        with patch("boto3.session.Session"):
+            results = client.sync_user_config("user-1", "dev@example.com", {}, "table")
+
+        assert [r.secret_name for r in results] == ["table"]
+        boto_client.put_secret_value.assert_not_called()
+
+
+class TestGetClient:
+    """Tests for SecretsManagerClient._get_client."""
+
+    def test_built_once_across_threads(self) -> None:
+        from concurrent.futures import ThreadPoolExecutor
+
+        client = SecretsManagerClient(region="eu-west-1")
+
+        with (
+            patch("boto3.session.Session") as session,
+            ThreadPoolExecutor(max_workers=4) as executor,
+        ):
+            clients = list(executor.map(lambda _: client._get_client(), range(8)))
+
+        session.assert_called_once()
+        assert all(c is clients[0] for c in clients)
+        kwargs = session.return_value.client.call_args.kwargs
+        assert kwargs["region_name"] == "eu-west-1"
+        assert kwargs["config"].max_pool_connections == 10
+
+
+class TestSyncAll:
+    """Tests for SecretsManagerClient.sync_all."""
+
+    def test_syncs_categories_in_order(self, tmp_path: Path) -> None:
+        client, boto_client = _client(
+            existing=(
+                "geniable/langsmith",
+                "geniable/aws-gateway",
+                "geniable/jira",
+                "geniable/anthropic",
+            )
+        )
+        boto_client.put_secret_value.side_effect = lambda **kwargs: {
+            "VersionId": kwargs["SecretId"]
+        }
+        config = {
+            "langsmith": {"api_key": "ls_key"},
+            "aws": {"api_key": "gw_key"},
+            "provider": "jira",
+            "jira": {"api_token": "jira_token", "email": "dev@example.com"},
+            "anthropic": {"api_key": "sk"},
+        }
+
+        with patch("cli.secrets_manager.SECRET_CACHE_FILE", tmp_path / "secrets.json"):
+            results = client.sync_all(config)
+
+        assert [r.version_id for r in results] == [
+            "geniable/langsmith",
+            "geniable/aws-gateway",
+            "geniable/jira",
+            "geniable/anthropic",
+        ]
+        assert all(r.success for r in results)
+
+
+class TestSyncSecret:
+    """Tests for SecretsManagerClient.sync_secret."""
+
+    @pytest.fixture(autouse=True)
+    def _cache_file(self, tmp_path: Path):
+        with patch("cli.secrets_manager.SECRET_CACHE_FILE", tmp_path / "secrets.json"):
+            yield
+
+    def test_new_secret_is_created_without_put(self) -> None:
+        client, boto_client = _client()
+        boto_client.create_secret.return_value = {"VersionId": "v1"}
+
+        result = client.sync_secret("langsmith", {"api_key": "ls_key"})
+
+        assert result.message == "Secret created"
+        boto_client.put_secret_value.assert_not_called()
+        assert boto_client.create_secret.call_args.kwargs["Name"] == "geniable/langsmith"
+
+    def test_existing_secrets_listed_once(self) -> None:
+        client, boto_client = _client(existing=("geniable/langsmith", "geniable/jira"))
+
+        client.sync_secret("langsmith", {"api_key": "ls_key"})
+        client.sync_secret("jira", {"api_token": "token"})
+
+        boto_client.get_paginator.assert_called_once_with("list_secrets")
+        filters = boto_client.get_paginator.return_value.paginate.call_args.kwargs["Filters"]
+        assert filters[0]["Values"] == [
+            "geniable/langsmith",
+            "geniable/jira",
+            "geniable/notion",
+            "geniable/aws-gateway",
+            "geniable/anthropic",
+        ]
+        assert boto_client.put_secret_value.call_count == 2
+        boto_client.create_secret.assert_not_called()
+
+    def test_unchanged_value_is_not_rewritten(self) -> None:
+        client, boto_client = _client(existing=("geniable/langsmith",))
+        boto_client.get_secret_value.return_value = {"SecretString": '{"api_key": "ls_key"}'}
+
+        client.get_secret("langsmith")
+        result = client.sync_secret("langsmith", {"api_key": "ls_key", "project": "ignored"})
+
+        assert result.success
+        assert result.message == "Secret unchanged"
+        boto_client.put_secret_value.assert_not_called()
+
+    def test_repeated_sync_writes_once(self) -> None:
+        client, boto_client = _client(existing=("geniable/langsmith",))
+
+        client.sync_secret("langsmith", {"api_key": "ls_key"})
+        result = client.sync_secret("langsmith", {"api_key": "ls_key"})
+
+        assert result.message == "Secret unchanged"
+        boto_client.put_secret_value.assert_called_once()
+
+    def test_listing_failure_falls_back_to_put(self) -> None:
+        client, boto_client = _client()
+        boto_client.get_paginator.side_effect = RuntimeError("denied")
+
+        result = client.sync_secret("langsmith", {"api_key": "ls_key"})
+
+        assert result.message == "Secret updated"
+        boto_client.create_secret.assert_not_called()
+
+
+class TestListSecrets:
+    """Tests for SecretsManagerClient.list_secrets."""
+
+    def test_limit_stops_early(self) -> None:
+        client, boto_client = _client()
+        paginate = boto_client.get_paginator.return_value.paginate
+        paginate.return_value = [
+            {"SecretList": [{"Name": "geniable/a"}, {"Name": "geniable/b"}]},
+            {"SecretList": [{"Name": "geniable/c"}]},
+        ]
+
+        secrets = client.list_secrets(limit=1)
+
+        assert [s["name"] for s in secrets] == ["geniable/a"]
+        assert paginate.call_args.kwargs["PaginationConfig"] == {"PageSize": 100, "MaxItems": 1}
+
+    def test_all_pages_without_limit(self) -> None:
+        client, boto_client = _client()
+        paginate = boto_client.get_paginator.return_value.paginate
+        paginate.return_value = [
+            {"SecretList": [{"Name": "geniable/a"}]},
+            {"SecretList": [{"Name": "geniable/b"}]},
+        ]
+
+        assert len(client.list_secrets()) == 2
+        assert paginate.call_args.kwargs["PaginationConfig"] == {"PageSize": 100}
+
+
+class TestGetSecret:
+    """Tests for SecretsManagerClient.get_secret."""
+
+    def test_reuses_recent_value(self) -> None:
+        client, boto_client = _client()
+        boto_client.get_secret_value.return_value = {"SecretString": '{"api_key": "ls"}'}
+
+        assert client.get_secret("langsmith") == {"api_key": "ls"}
+        assert client.get_secret("langsmith") == {"api_key": "ls"}
+        boto_client.get_secret_value.assert_called_once()
+
+    def test_expired_value_is_refetched(self) -> None:
+        client, boto_client = _client()
+        boto_client.get_secret_value.return_value = {"SecretString": '{"api_key": "ls"}'}
+
+        client.get_secret("langsmith")
+        with patch("cli.secrets_manager.time.monotonic", return_value=time.monotonic() + 61):
+            client.get_secret("langsmith")
+
+        assert boto_client.get_secret_value.call_count == 2
+
+    def test_sync_replaces_value(self, tmp_path: Path) -> None:
+        client, boto_client = _client(existing=("geniable/langsmith",))
+        boto_client.get_secret_value.return_value = {"SecretString": '{"api_key": "ls"}'}
+
+        client.get_secret("langsmith")
+        with patch("cli.secrets_manager.SECRET_CACHE_FILE", tmp_path / "secrets.json"):
+            client.sync_secret("langsmith", {"api_key": "new"})
+
+        assert client.get_secret("langsmith") == {"api_key": "new"}
+        boto_client.get_secret_value.assert_called_once()
+
+    def test_delete_invalidates(self) -> None:
+        client, boto_client = _client()
+        boto_client.get_secret_value.return_value = {"SecretString": '{"api_key": "ls"}'}
+
+        client.get_secret("langsmith")
+        client.delete_secret("langsmith")
+        client.get_secret("langsmith")
+
+        assert boto_client.get_secret_value.call_count == 2
@@ -0,0 +1,351 @@
+"""Tests for service validation during init."""
+
+from __future__ import annotations
+
+import dataclasses
+import io
+import json
+import subprocess
+import sys
+import threading
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+from urllib3.response import HTTPResponse
+
+from cli.service_validator import MAX_RESPONSE_BYTES, ServiceValidator, ValidationResult
+
+CONFIG = {
+    "langsmith": {"api_key": "ls_test_key", "queue": "review"},
+    "aws": {
+        "integration_endpoint": "https://integration.example.com",
+        "evaluation_endpoint": "https://evaluation.example.com",
+    },
+    "provider": "jira",
+}
+
+
+def _response(status_code: int, body: Any = None, raw: bytes | None = None) -> requests.Response:
+    """Build a streamed response with a JSON (or raw) body."""
+    response = requests.Response()
+    response.status_code = status_code
+    content = json.dumps(body).encode() if raw is None else raw
+    response.raw = HTTPResponse(body=io.BytesIO(content), preload_content=False)
+    return response
+
+
+class TestValidateAll:
+    """Tests for ServiceValidator.validate_all."""
+
+    def test_runs_checks_concurrently_in_order(self) -> None:
+        validator = ServiceValidator()
+        barrier = threading.Barrier(4, timeout=5)
+
+        def check(service: str):
+            def run(*args, **kwargs) -> ValidationResult:
+                barrier.wait()  # only passes if all four checks run at once
+                return ValidationResult(service=service, success=True, message="ok")
+
+            return run
+
+        with (
+            patch.object(validator, "validate_langsmith", check("LangSmith")),
+            patch.object(validator, "validate_integration_endpoint", check("Integration")),
+            patch.object(validator, "validate_evaluation_endpoint", check("Evaluation")),
+            patch.object(validator, "validate_provider_via_lambda", check("Jira")),
+        ):
+            results = validator.validate_all(CONFIG, auth_token="token")
+
+        assert [r.service for r in results] == ["LangSmith", "Integration", "Evaluation", "Jira"]
+
+    def test_reports_results_as_checks_finish(self) -> None:
+        validator = ServiceValidator()
+        langsmith_done = threading.Event()
+        reported: list[str] = []
+
+        def slow(*args, **kwargs) -> ValidationResult:
+            assert langsmith_done.wait(timeout=5)
+            return ValidationResult(service="Integration", success=True, message="ok")
+
+        def fast(*args, **kwargs) -> ValidationResult:
+            return ValidationResult(service="LangSmith", success=True, message="ok")
+
+        def on_result(result: ValidationResult) -> None:
+            reported.append(result.service)
+            langsmith_done.set()
+
+        config = {"langsmith": CONFIG["langsmith"], "aws": CONFIG["aws"]}
+        with (
+            patch.object(validator, "validate_langsmith", fast),
+            patch.object(validator, "validate_integration_endpoint", slow),
+            patch.object(validator, "validate_evaluation_endpoint", fast),
+        ):
+            results = validator.validate_all(config, on_result=on_result)
+
+        assert reported[0] == "LangSmith"
+        assert sorted(reported) == sorted(r.service for r in results)
+
+    def test_single_check(self) -> None:
+        validator = ServiceValidator()
+        result = ValidationResult(service="LangSmith", success=True, message="ok")
+
+        with patch.object(validator, "validate_langsmith", return_value=result) as check:
+            results = validator.validate_all({"langsmith": {"api_key": "ls_test_key"}})
+
+        assert results == [result]
+        check.assert_called_once_with(api_key="ls_test_key", queue_name=None)
+
+    def test_malformed_values_fail_without_requests(self) -> None:
+        config = {
+            **CONFIG,
+            "langsmith": {"api_key": "sk_short"},
+            "aws": {
+                "integration_endpoint": "integration.example.com",
+                "evaluation_endpoint": "https://evaluation.example.com",
+            },
+        }
+        validator = ServiceValidator()
+        ok = ValidationResult(service="Evaluation Service", success=True, message="ok")
+
+        with (
+            patch.object(validator._session, "get") as get,
+            patch.object(validator, "validate_evaluation_endpoint", return_value=ok),
+        ):
+            results = validator.validate_all(config)
+
+        get.assert_not_called()
+        assert [(r.service, r.message) for r in results] == [
+            ("LangSmith", "Invalid API key format"),
+            ("Integration Service", "Invalid URL format"),
+            ("Evaluation Service", "ok"),
+        ]
+
+
+class TestSession:
+    """Tests for the pooled HTTP session."""
+
+    def test_langsmith_calls_share_the_session(self) -> None:
+        responses = {
+            "workspaces": _response(200, [{}]),
+            "annotation-queues": _response(200, [{"name": "Review"}]),
+        }
+
+        with (
+            ServiceValidator() as validator,
+            patch.object(
+                validator._session,
+                "get",
+                side_effect=lambda url, **_: responses[url.rsplit("/", 1)[1]],
+            ) as get,
+        ):
+            result = validator.validate_langsmith("ls_key", queue_name="review")
+
+        assert get.call_count == 2
+        assert not result.success
+        assert "Did you mean 'Review'?" in result.message
+
+    def test_queue_fetch_overlaps_key_check(self) -> None:
+        barrier = threading.Barrier(2, timeout=5)
+
+        def get(url: str, **kwargs) -> MagicMock:
+            barrier.wait()  # only passes if both requests are in flight at once
+            if url.endswith("/workspaces"):
+                return _response(200, [{}])
+            return _response(200, [{"name": "review"}])
+
+        with ServiceValidator() as validator, patch.object(validator._session, "get", get):
+            result = validator.validate_langsmith("ls_key", queue_name="review")
+
+        assert result.success
+
+    def test_retries_gateway_errors_only(self) -> None:
+        validator = ServiceValidator()
+
+        retries = validator._session.get_adapter("https://example.com").max_retries
+        validator.close()
+
+        assert retries.status_forcelist == (502, 503, 504)
+        assert retries.connect == 0
+        assert retries.read == 0
+
+    def test_supplied_session_is_used_and_left_open(self) -> None:
+        session = MagicMock(spec=requests.Session, headers={})
+        session.get.return_value = _response(200, {"tools": [{}]})
+
+        with ServiceValidator(session=session) as validator:
+            result = validator.validate_evaluation_endpoint("https://api.example.com")
+
+        assert result.success
+        assert session.headers["Content-Type"] == "application/json"
+        session.close.assert_not_called()
+
+
+class TestListingCache:
+    """Tests for reuse of LangSmith listings."""
+
+    def test_second_validation_stays_off_the_network(self) -> None:
+        urls: list[str] = []
+
+        def get(url: str, **kwargs) -> MagicMock:
+            urls.append(url.rsplit("/", 1)[1])
+            if url.endswith("/workspaces"):
+                return _response(200, [{}])
+            return _response(200, [{"name": "Quality Review"}, {"name": "quality review"}])
+
+        with ServiceValidator() as validator, patch.object(validator._session, "get", get):
+            first = validator.validate_langsmith("ls_key", queue_name="QualityReview")
+            second = validator.validate_langsmith("ls_key", queue_name="Quality Review")
+
+        assert first.message == (
+            "Annotation queue 'QualityReview' not found. Did you mean 'Quality Review'?"
+        )
+        assert second.success
+        assert sorted(urls) == ["annotation-queues", "workspaces"]
+
+    def test_rejected_key_is_not_cached(self) -> None:
+        response = MagicMock(status_code=401)
+
+        with (
+            ServiceValidator() as validator,
+            patch.object(validator._session, "get", return_value=response) as get,
+        ):
+            validator.validate_langsmith("ls_bad")
+            result = validator.validate_langsmith("ls_bad")
+
+        assert result.message == "Invalid API key"
+        assert get.call_count == 2
+
+
+class TestValidateIntegrationEndpoint:
+    """Tests for ServiceValidator.validate_integration_endpoint."""
+
+    def test_skips_response_body(self) -> None:
+        response = MagicMock(status_code=200)
+
+        with (
+            ServiceValidator() as validator,
+            patch.object(validator._session, "get", return_value=response) as get,
+        ):
+            result = validator.validate_integration_endpoint(
+                "https://integration.example.com/", auth_token="token"
+            )
+
+        assert result.success
+        assert get.call_args.args[0] == "https://integration.example.com/threads/annotated"
+        assert get.call_args.kwargs["stream"] is True
+        assert get.call_args.kwargs["headers"] == {"Authorization": "Bearer token"}
+        assert validator._session.headers["Content-Type"] == "application/json"
+        response.close.assert_called_once()
+        response.json.assert_not_called()
+
+    def test_short_connect_timeout(self) -> None:
+        with (
+            ServiceValidator() as validator,
+            patch.object(validator._session, "get", return_value=MagicMock(status_code=403)) as get,
+        ):
+            result = validator.validate_integration_endpoint("https://integration.example.com")
+
+        assert result.message == "Access denied - check API key"
+        assert get.call_args.kwargs["timeout"] == (3.05, 30)
+
+
+class TestValidateEvaluationEndpoint:
+    """Tests for ServiceValidator.validate_evaluation_endpoint."""
+
+    def test_counts_tools(self) -> None:
+        response = _response(200, {"tools": [{}, {}]})
+
+        with (
+            ServiceValidator() as validator,
+            patch.object(validator._session, "get", return_value=response),
+        ):
+            result = validator.validate_evaluation_endpoint("https://evaluation.example.com")
+
+        assert result.message == "Connected (2 tools)"
+
+    def test_oversized_body_is_not_decoded(self) -> None:
+        response = _response(200, raw=b" " * (MAX_RESPONSE_BYTES + 1) + b"{}")
+
+        with (
+            ServiceValidator() as validator,
+            patch.object(validator._session, "get", return_value=response),
+        ):
+            result = validator.validate_evaluation_endpoint("https://evaluation.example.com")
+
+        assert not result.success
+        assert "Response larger than" in result.message
+
+    def test_declared_oversized_body_is_not_read(self) -> None:
+        response = _response(200, {"tools": []})
+        response.headers["Content-Length"] = str(MAX_RESPONSE_BYTES + 1)
+
+        with (
+            ServiceValidator() as validator,
+            patch.object(validator._session, "get", return_value=response),
+        ):
+            result = validator.validate_evaluation_endpoint("https://evaluation.example.com")
+
+        assert not result.success
+        assert response.raw.tell() == 0
+
+
+class TestErrorResults:
+    """Tests for mapping request errors to failed results."""
+
+    def test_connect_timeout_reports_timeout(self) -> None:
+        with (
+            ServiceValidator() as validator,
+            patch.object(
+                validator._session, "get", side_effect=requests.exceptions.ConnectTimeout()
+            ),
+        ):
+            result = validator.validate_integration_endpoint("https://integration.example.com")
+
+        assert result.message == "Connection timeout"
+
+    def test_provider_connection_error(self) -> None:
+        with (
+            ServiceValidator() as validator,
+            patch.object(
+                validator._session, "post", side_effect=requests.exceptions.ConnectionError()
+            ),
+        ):
+            result = validator.validate_provider_via_lambda("https://x.example.com", "notion")
+
+        assert result == ValidationResult(
+            service="Notion", success=False, message="Connection failed - check network"
+        )
+
+    def test_other_errors(self) -> None:
+        with (
+            ServiceValidator() as validator,
+            patch.object(validator._session, "get", side_effect=RuntimeError("boom")),
+        ):
+            result = validator.validate_langsmith("ls_key")
+
+        assert result.message == "Validation error: boom"
+
+
+class TestLazyImport:
+    """Tests for deferring the requests import."""
+
+    def test_import_does_not_load_requests(self) -> None:
+        code = "import sys, cli.service_validator; print('requests' in sys.modules)"
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "False"
+
+
+class TestValidationResult:
+    """Tests for the ValidationResult value type."""
+
+    def test_is_immutable_without_instance_dict(self) -> None:
+        result = ValidationResult(service="LangSmith", success=True, message="ok")
+
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            result.success = False  # type: ignore[misc]
@@ -0,0 +1,111 @@
+"""Tests for packaged skill and agent installation."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from cli import agents, skills
+
+
+class TestPackageDirs:
+    """Tests for resolving the packaged resource directories."""
+
+    def test_skills_dir_is_cached(self) -> None:
+        skills_dir = skills.get_skills_dir()
+
+        assert skills.get_skills_dir() is skills_dir
+        for skill_name in skills.SKILLS:
+            assert (skills_dir / skill_name).is_file()
+
+    def test_agents_dir_is_cached(self) -> None:
+        agents_dir = agents.get_agents_dir()
+
+        assert agents.get_agents_dir() is agents_dir
+        for agent_name in agents.AGENTS:
+            assert (agents_dir / agent_name).is_file()
+
+
+class TestInstallSkills:
+    """Tests for install_skills."""
+
+    def test_installs_then_reports_installed(self, tmp_path: Path) -> None:
+        target = tmp_path / "commands"
+
+        results = skills.install_skills(target_dir=target)
+
+        assert results == dict.fromkeys(skills.SKILLS, True)
+        assert skills.get_installed_skills(target_dir=target) == skills.SKILLS
+
+    def test_updates_outdated_and_keeps_others(self, tmp_path: Path) -> None:
+        target = tmp_path / "commands"
+        skills.install_skills(target_dir=target)
+        stale, current = target / skills.SKILLS[0], target / skills.SKILLS[1]
+        stale.write_text("old")
+        current_mtime = current.stat().st_mtime_ns
+
+        results = skills.install_skills(target_dir=target)
+
+        assert list(results) == skills.SKILLS
+        assert all(results.values())
+        assert stale.read_text() == (skills.get_skills_dir() / skills.SKILLS[0]).read_text()
+        assert current.stat().st_mtime_ns == current_mtime
+
+    def test_copy_failure_is_reported(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        target = tmp_path / "commands"
+        failing = skills.SKILLS[0]
+
+        def copy2(src: Path, dst: Path) -> None:
+            if dst.name == failing:
+                raise OSError("disk full")
+            dst.write_text(src.read_text())
+
+        monkeypatch.setattr(skills.shutil, "copy2", copy2)
+
+        results = skills.install_skills(target_dir=target)
+
+        assert results[failing] is False
+        assert sum(results.values()) == len(skills.SKILLS) - 1
+
+
+class TestInstalled:
+    """Tests for listing installed skills and agents."""
+
+    def test_missing_directory(self, tmp_path: Path) -> None:
+        assert skills.get_installed_skills(target_dir=tmp_path / "missing") == []
+        assert agents.get_installed_agents(target_dir=tmp_path / "missing") == []
+
+    def test_only_known_names_in_package_order(self, tmp_path: Path) -> None:
+        for name in (agents.AGENTS[-1], "custom.md"):
+            (tmp_path / name).write_text("")
+
+        assert agents.get_installed_agents(target_dir=tmp_path) == [agents.AGENTS[-1]]
+
+
+class TestInstallAgents:
+    """Tests for install_agents."""
+
+    def test_keeps_current_and_updates_stale(self, tmp_path: Path) -> None:
+        agents.install_agents(target_dir=tmp_path)
+        stale = tmp_path / agents.AGENTS[0]
+        stale.write_text("old")
+
+        results = agents.install_agents(target_dir=tmp_path)
+
+        assert results == dict.fromkeys(agents.AGENTS, True)
+        assert stale.read_text() == (agents.get_agents_dir() / agents.AGENTS[0]).read_text()
+
+    def test_force_skips_directory_listing(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def fail(directory: Path) -> set[str]:
+            raise AssertionError("listed target directory")
+
+        monkeypatch.setattr(agents, "_list_dir_names", fail)
+        monkeypatch.setattr(skills, "_list_dir_names", fail)
+
+        assert all(agents.install_agents(target_dir=tmp_path / "a", force=True).values())
+        assert all(skills.install_skills(target_dir=tmp_path / "s", force=True).values())
@@ -0,0 +1,68 @@
+"""Tests for the ticket create command."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+from typer.testing import CliRunner
+
+from cli.commands.ticket import app
+
+runner = CliRunner()
+
+VALID_ISSUE = {
+    "title": "High latency in retrieval",
+    "priority": "HIGH",
+    "category": "PERFORMANCE",
+    "details": "Thread took 45s",
+    "description": "Slow responses",
+    "recommendation": "Add caching",
+    "sources": {"thread_id": "thread-1", "thread_name": "User query"},
+}
+
+
+@pytest.fixture()
+def mock_auth():
+    """Mock authentication to always succeed."""
+    with patch("cli.commands.ticket._require_auth") as mock:
+        yield mock
+
+
+@pytest.fixture()
+def mock_config():
+    """Mock ConfigManager to return a valid config."""
+    with patch("cli.commands.ticket.ConfigManager") as mock_cm:
+        config = MagicMock()
+        config.provider = "jira"
+        config.aws.integration_endpoint = "https://api.example.com/prod"
+        config.aws.api_key = "test-key"
+        mock_cm.return_value.load.return_value = config
+        yield config
+
+
+@pytest.mark.usefixtures("mock_auth", "mock_config")
+class TestCreateTicketParsing:
+    """Tests for IssueCard parsing in ticket create."""
+
+    def test_dry_run_valid_issue(self):
+        result = runner.invoke(app, ["--dry-run", json.dumps(VALID_ISSUE)])
+
+        assert result.exit_code == 0
+        assert "Validation successful" in result.output
+        assert "High latency in retrieval" in result.output
+
+    def test_invalid_json(self):
+        result = runner.invoke(app, ["--dry-run", "{not json"])
+
+        assert result.exit_code == 1
+        assert "Invalid JSON" in result.output
+
+    def test_schema_violation(self):
+        issue = {**VALID_ISSUE, "category": "UNKNOWN"}
+
+        result = runner.invoke(app, ["--dry-run", json.dumps(issue)])
+
+        assert result.exit_code == 1
+        assert "IssueCard validation failed" in result.output
@@ -0,0 +1,48 @@
+"""Tests for CLI input validators."""
+
+from __future__ import annotations
+
+import pytest
+
+from cli.validators import validate_email, validate_project_key, validate_url
+
+
+@pytest.mark.parametrize(
+    ("url", "expected"),
+    [
+        ("https://api.example.com/prod", True),
+        ("http://localhost:8080", True),
+        ("https://10.0.0.1/path?q=1", True),
+        ("https://api.example.technology/", True),
+        ("https://example.com:123456", False),
+        ("https://bad..example.com", False),
+        ("ftp://example.com", False),
+        ("https://", False),
+        ("example.com", False),
+    ],
+)
+def test_validate_url(url: str, expected: bool) -> None:
+    assert validate_url(url) is expected
+
+
+@pytest.mark.parametrize(
+    ("email", "expected"),
+    [
+        ("dev@example.com", True),
+        ("first.last+tag@sub.example.co", True),
+        ("dev@example", False),
+        ("@example.com", False),
+        ("dev@example..com", False),
+        ("dev@example.com\n", False),
+    ],
+)
+def test_validate_email(email: str, expected: bool) -> None:
+    assert validate_email(email) is expected
+
+
+@pytest.mark.parametrize(
+    ("key", "expected"),
+    [("PROJ", True), ("proj", True), ("AB_1", True), ("1AB", False), ("P", False)],
+)
+def test_validate_project_key(key: str, expected: bool) -> None:
+    assert validate_project_key(key) is expected
@@ -0,0 +1,368 @@
+"""Tests for the interactive configuration wizard."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from cli import wizard as wizard_module
+from cli.wizard import ConfigWizard
+
+
+class TestLazyImports:
+    """Tests for deferring the wizard's heavy imports."""
+
+    def test_import_skips_prompt_and_rendering_libraries(self) -> None:
+        code = (
+            "import sys, cli.wizard; "
+            "print([m for m in ('questionary', 'rich', 'requests', 'cli.claude_code_setup') "
+            "if m in sys.modules])"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "[]"
+
+
+class TestClaudeCodePermissions:
+    """Tests for pre-approving geni commands in Claude Code settings."""
+
+    def test_creates_settings_in_project_root(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.chdir(tmp_path)
+        wizard = ConfigWizard()
+
+        wizard._configure_claude_code_permissions()
+
+        settings = json.loads((tmp_path / ".claude" / "settings.local.json").read_text())
+        assert "Bash(geni:*)" in settings["permissions"]["allow"]
+        assert [p.name for p in (tmp_path / ".claude").iterdir()] == ["settings.local.json"]
+
+    def test_keeps_existing_settings(self, tmp_path: Path) -> None:
+        settings_path = tmp_path / ".claude" / "settings.local.json"
+        settings_path.parent.mkdir()
+        settings_path.write_text(
+            json.dumps({"model": "x", "permissions": {"allow": ["Bash(ls:*)", "Bash(geni:*)"]}})
+        )
+        wizard = ConfigWizard()
+        wizard._project_root = tmp_path
+
+        wizard._configure_claude_code_permissions()
+        wizard._configure_claude_code_permissions()
+
+        settings = json.loads(settings_path.read_text())
+        allow = settings["permissions"]["allow"]
+        assert settings["model"] == "x"
+        assert allow[:2] == ["Bash(ls:*)", "Bash(geni:*)"]
+        assert len(allow) == len(set(allow))
+
+
+class TestInstallSkills:
+    """Tests for the skill and agent install step."""
+
+    def test_installs_skills_and_agents(self, tmp_path: Path) -> None:
+        from cli.agents import AGENTS
+        from cli.skills import SKILLS
+
+        wizard = ConfigWizard()
+        wizard._project_root = tmp_path
+
+        wizard._install_skills()
+
+        assert sorted(p.name for p in (tmp_path / ".claude" / "commands").iterdir()) == SKILLS
+        assert sorted(p.name for p in (tmp_path / ".claude" / "agents").iterdir()) == AGENTS
+        assert (tmp_path / ".claude" / "settings.local.json").exists()
+
+
+class TestSyncToCloud:
+    """Tests for syncing the captured configuration to the backend."""
+
+    CONFIG = {
+        "trace_source": "langsmith",
+        "langsmith": {"api_key": "ls_key", "project": "proj", "queue": "review"},
+        "aws": {
+            "region": "ap-southeast-2",
+            "integration_endpoint": "https://api.example.com/dev/",
+            "evaluation_endpoint": "https://api.example.com/dev",
+            "api_key": "",
+        },
+        "provider": "notion",
+        "notion": {"api_key": "secret_notion", "database_id": "db"},
+    }
+
+    @pytest.fixture(autouse=True)
+    def _sync_hash_file(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        path = tmp_path / "last_sync_hash"
+        monkeypatch.setattr(wizard_module, "SYNC_HASH_FILE", path)
+        return path
+
+    def _wizard(self) -> ConfigWizard:
+        wizard = ConfigWizard()
+        wizard.config = self.CONFIG
+        wizard._id_token = "token"
+        return wizard
+
+    def test_posts_config_and_secrets(self) -> None:
+        session = wizard_module._session()
+
+        with patch.object(session, "post", return_value=MagicMock(status_code=200)) as post:
+            self._wizard()._sync_to_cloud()
+
+        assert post.call_args.args[0] == "https://api.example.com/dev/users/me/config"
+        assert post.call_args.kwargs["headers"]["Authorization"] == "Bearer token"
+        assert post.call_args.kwargs["headers"]["Content-Type"] == "application/json"
+        payload = json.loads(post.call_args.kwargs["data"])
+        assert payload["secrets"] == {
+            "langsmith_api_key": "ls_key",
+            "aws_api_key": "",
+            "notion_api_key": "secret_notion",
+        }
+        assert payload["config"] == {
+            "trace_source": "langsmith",
+            "langsmith": {"project": "proj", "queue": "review"},
+            "aws": {
+                "region": "ap-southeast-2",
+                "integration_endpoint": "https://api.example.com/dev/",
+                "evaluation_endpoint": "https://api.example.com/dev",
+            },
+            "provider": "notion",
+            "notion": {"database_id": "db"},
+        }
+
+    def test_unchanged_config_skips_post(self, _sync_hash_file: Path) -> None:
+        session = wizard_module._session()
+
+        with patch.object(session, "post", return_value=MagicMock(status_code=200)) as post:
+            self._wizard()._sync_to_cloud()
+            self._wizard()._sync_to_cloud()
+
+            assert post.call_count == 1
+            assert oct(_sync_hash_file.stat().st_mode & 0o777) == "0o600"
+
+            changed = self._wizard()
+            changed.config = {**self.CONFIG, "provider": "none"}
+            changed._sync_to_cloud()
+
+        assert post.call_count == 2
+
+    def test_force_and_cleared_hash_post_again(self) -> None:
+        session = wizard_module._session()
+
+        with patch.object(session, "post", return_value=MagicMock(status_code=200)) as post:
+            self._wizard()._sync_to_cloud()
+            self._wizard()._sync_to_cloud(force=True)
+            wizard_module.clear_sync_hash()
+            self._wizard()._sync_to_cloud()
+
+        assert post.call_count == 3
+
+    def test_failed_sync_is_retried(self) -> None:
+        session = wizard_module._session()
+
+        with patch.object(session, "post", return_value=MagicMock(status_code=401)) as post:
+            for _ in range(2):
+                with pytest.raises(RuntimeError):
+                    self._wizard()._sync_to_cloud()
+
+        assert post.call_count == 2
+
+    def test_reuses_session(self) -> None:
+        assert wizard_module._session() is wizard_module._session()
+
+    def test_expired_session(self) -> None:
+        session = wizard_module._session()
+
+        with (
+            patch.object(session, "post", return_value=MagicMock(status_code=401)),
+            pytest.raises(RuntimeError, match="geni login"),
+        ):
+            self._wizard()._sync_to_cloud()
+
+    def test_reports_error_message(self) -> None:
+        session = wizard_module._session()
+        response = MagicMock(status_code=500, content=b'{"message": "boom"}', text="raw")
+
+        with (
+            patch.object(session, "post", return_value=response),
+            pytest.raises(RuntimeError, match=r"HTTP 500\): boom"),
+        ):
+            self._wizard()._sync_to_cloud()
+
+    def test_langfuse_and_jira_sections(self) -> None:
+        session = wizard_module._session()
+        wizard = self._wizard()
+        wizard.config = {
+            "trace_source": "langfuse",
+            "langfuse": {"public_key": "pk", "secret_key": "sk", "host": "h", "dataset": "d"},
+            "aws": self.CONFIG["aws"],
+            "provider": "jira",
+            "jira": {"base_url": "b", "email": "e", "api_token": "t", "project_key": "P"},
+        }
+
+        with patch.object(session, "post", return_value=MagicMock(status_code=200)) as post:
+            wizard._sync_to_cloud()
+
+        payload = json.loads(post.call_args.kwargs["data"])
+        assert payload["secrets"] == {
+            "langfuse_public_key": "pk",
+            "langfuse_secret_key": "sk",
+            "aws_api_key": "",
+            "jira_api_token": "t",
+        }
+        assert payload["config"]["langfuse"] == {"host": "h", "dataset": "d"}
+        assert payload["config"]["jira"] == {
+            "base_url": "b",
+            "email": "e",
+            "project_key": "P",
+            "issue_type": None,
+        }
+        assert "langsmith" not in payload["config"]
+
+
+class TestAwsConfig:
+    """Tests for the fixed AWS configuration."""
+
+    def test_read_only_and_saved_with_config(self, tmp_path: Path) -> None:
+        from cli.config_manager import ConfigManager
+
+        with pytest.raises(TypeError):
+            ConfigWizard.AWS_CONFIG["region"] = "us-east-1"  # type: ignore[index]
+
+        config = {
+            "langsmith": {"api_key": "ls_key", "project": "proj", "queue": "review"},
+            "aws": ConfigWizard.AWS_CONFIG,
+            "provider": "none",
+        }
+        path = ConfigManager.save_config(config, tmp_path / "geniable.yaml")
+
+        saved = ConfigManager(config_path=path).load()
+        assert saved.aws.integration_endpoint == ConfigWizard.AWS_CONFIG["integration_endpoint"]
+
+
+class TestRun:
+    """Tests for the overall wizard flow."""
+
+    @pytest.fixture()
+    def wizard(self) -> ConfigWizard:
+        wizard = ConfigWizard()
+        for step in ("_load_auth_context", "_setup_claude_code", "_capture_tracing_config"):
+            setattr(wizard, step, MagicMock())
+        wizard._select_integration = MagicMock(return_value="none")
+        return wizard
+
+    def test_failed_sync_can_be_retried(self, wizard: ConfigWizard) -> None:
+        wizard._sync_to_cloud = MagicMock(side_effect=[RuntimeError("HTTP 500"), None])
+
+        with patch.object(wizard_module, "_ask_confirm", return_value=True):
+            config = wizard.run(skip_validation=True)
+
+        assert wizard._sync_to_cloud.call_count == 2
+        assert config["provider"] == "none"
+
+    def test_declined_retry_fails_setup(self, wizard: ConfigWizard) -> None:
+        wizard._sync_to_cloud = MagicMock(side_effect=RuntimeError("HTTP 500"))
+
+        with (
+            patch.object(wizard_module, "_ask_confirm", return_value=False),
+            pytest.raises(RuntimeError, match="not completed"),
+        ):
+            wizard.run(skip_validation=True)
+
+
+class TestPromptValidators:
+    """Tests for the questionary prompt validators."""
+
+    @pytest.mark.parametrize("value", ["a" * 32, "a" * 36])
+    def test_notion_database_id_lengths(self, value: str) -> None:
+        assert wizard_module._check_notion_database_id(value) is True
+
+    def test_notion_database_id_message(self) -> None:
+        assert "32 characters" in wizard_module._check_notion_database_id("a" * 33)
+
+    def test_required(self) -> None:
+        assert wizard_module._check_queue_name("review") is True
+        assert wizard_module._check_queue_name("") == "Queue name is required"
+
+
+class TestPipedInput:
+    """Tests for answering the wizard from piped (non-terminal) input."""
+
+    @pytest.fixture()
+    def answers(self, monkeypatch: pytest.MonkeyPatch) -> list[str]:
+        lines: list[str] = []
+        monkeypatch.setattr(sys.stdin, "isatty", lambda: False, raising=False)
+
+        def fake_input(prompt: str = "") -> str:
+            if not lines:
+                raise EOFError
+            return lines.pop(0)
+
+        monkeypatch.setattr("builtins.input", fake_input)
+        return lines
+
+    def test_reasks_until_valid_and_uses_defaults(self, answers: list[str]) -> None:
+        answers.extend(["LangSmith", "sk_wrong", "ls_valid_key_123", "", "my-queue"])
+        wizard = ConfigWizard()
+
+        wizard._capture_tracing_config()
+
+        assert wizard.config["langsmith"] == {
+            "api_key": "ls_valid_key_123",
+            "project": "default",
+            "queue": "my-queue",
+        }
+
+    def test_select_and_confirm(self, answers: list[str]) -> None:
+        answers.extend(["Jira", "Task", "n"])
+
+        assert wizard_module._ask_select("Tracker:", ["Notion", "Jira"]) == "Jira"
+        assert wizard_module._ask_select("Type:", ["Bug", "Task"], default="Bug") == "Task"
+        assert wizard_module._ask_confirm("Validate?") is False
+        with pytest.raises(KeyboardInterrupt):
+            wizard_module._ask_confirm("Validate?")
+
+    def test_integration_choice_maps_to_value(self, answers: list[str]) -> None:
+        answers.append("None (reports only)")
+
+        assert ConfigWizard()._select_integration() == "none"
+
+    def test_end_of_input_cancels(self, answers: list[str]) -> None:
+        answers.append("secret_key")
+
+        with pytest.raises(KeyboardInterrupt):
+            ConfigWizard()._capture_notion_credentials()
+
+
+class TestAuthContext:
+    """Tests for loading the signed-in user's context."""
+
+    def test_uses_tokens_from_caller(self) -> None:
+        tokens = MagicMock(email="dev@example.com", user_id="u1", id_token="id")
+        wizard = ConfigWizard(tokens=tokens)
+
+        with patch("cli.auth.get_auth_client") as get_auth_client:
+            wizard._load_auth_context()
+
+        get_auth_client.assert_not_called()
+        assert (wizard._user_email, wizard._user_id, wizard._id_token) == (
+            "dev@example.com",
+            "u1",
+            "id",
+        )
+
+    def test_reads_stored_session_otherwise(self) -> None:
+        tokens = MagicMock(email="dev@example.com", user_id="u1", id_token="id")
+        wizard = ConfigWizard()
+
+        with patch("cli.auth.get_auth_client") as get_auth_client:
+            get_auth_client.return_value.get_current_tokens.return_value = tokens
+            wizard._load_auth_context()
+
+        assert wizard._id_token == "id"